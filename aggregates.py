@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 누적 집계
+
+관리자 통계를 매번 전체 결과에서 다시 계산하지 않도록 건수, 점수 합계,
+제곱합, 레벨/부서별 인원, 영역별 점수 합계를 누적해 둡니다.
+결과 1건 저장 시 O(1)로 갱신되며, 저장소가 결과 데이터 옆에 함께 보관합니다.
+"""
+
+import json
+import math
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+from ai_skill_assessment import SCHEMA
+
+
+class RunningAggregates:
+    """진단 결과 누적 집계"""
+
+    def __init__(self):
+        self.count = 0
+        self.score_sum = 0
+        self.score_sumsq = 0
+        self.level_counts: Dict[str, int] = dict.fromkeys(SCHEMA.level_names, 0)
+        self.department_counts: Dict[str, int] = {}
+        self.category_sums: Dict[str, int] = dict.fromkeys(SCHEMA.category_ids, 0)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "RunningAggregates":
+        """전체 결과에서 처음부터 다시 집계"""
+        aggregates = cls()
+        for record in records:
+            aggregates.add(record)
+        return aggregates
+
+    # ---------- 갱신 ----------
+    def _apply(self, record: Dict, sign: int) -> None:
+        scores = record["scores"]
+        score = scores["total_score"]
+        self.count += sign
+        self.score_sum += sign * score
+        self.score_sumsq += sign * score * score
+
+        level = scores["level"]
+        self.level_counts[level] = self.level_counts.get(level, 0) + sign
+
+        department = record.get("user_info", {}).get("department", "")
+        remaining = self.department_counts.get(department, 0) + sign
+        if remaining:
+            self.department_counts[department] = remaining
+        else:
+            self.department_counts.pop(department, None)
+
+        for cat_id, cat_score in scores.get("category_scores", {}).items():
+            self.category_sums[cat_id] = self.category_sums.get(cat_id, 0) + sign * cat_score["score"]
+
+    def add(self, record: Dict) -> None:
+        """결과 1건 추가 (user_info/scores 포함 dict)"""
+        self._apply(record, 1)
+
+    def remove(self, record: Dict) -> None:
+        """결과 1건 제거 (같은 ID의 결과를 덮어쓸 때)"""
+        self._apply(record, -1)
+
+    # ---------- 통계 ----------
+    @property
+    def mean(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """점수 표준편차 (모집단)"""
+        if not self.count:
+            return 0.0
+        variance = self.score_sumsq / self.count - self.mean ** 2
+        return math.sqrt(max(variance, 0.0))
+
+    def statistics(self) -> Dict:
+        """관리자 통계 형식으로 변환"""
+        return {
+            "total_count": self.count,
+            "avg_score": self.mean,
+            "score_std": self.std,
+            "level_counts": dict(self.level_counts),
+            "department_counts": dict(self.department_counts),
+            "category_averages": {
+                cat_id: (total / self.count if self.count else 0.0)
+                for cat_id, total in self.category_sums.items()
+            }
+        }
+
+    # ---------- 직렬화 ----------
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "score_sum": self.score_sum,
+            "score_sumsq": self.score_sumsq,
+            "level_counts": self.level_counts,
+            "department_counts": self.department_counts,
+            "category_sums": self.category_sums
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RunningAggregates":
+        aggregates = cls()
+        aggregates.count = data["count"]
+        aggregates.score_sum = data["score_sum"]
+        aggregates.score_sumsq = data["score_sumsq"]
+        aggregates.level_counts.update(data["level_counts"])
+        aggregates.department_counts = dict(data["department_counts"])
+        aggregates.category_sums.update(data["category_sums"])
+        return aggregates
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RunningAggregates):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+
+def write_aggregates_file(path: str, aggregates: RunningAggregates, position: int) -> None:
+    """
+    집계를 파일로 저장 (임시 파일 교체로 원자적 기록)
+
+    Args:
+        position: 집계가 반영한 저장소 위치 (로그 저장소의 인덱스 파일 위치)
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"position": position, "aggregates": aggregates.to_dict()},
+            f, ensure_ascii=False
+        )
+    os.replace(tmp_path, path)
+
+
+def read_aggregates_file(path: str) -> Optional[Tuple[int, RunningAggregates]]:
+    """집계 파일 읽기 → (position, RunningAggregates), 없거나 손상되면 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["position"], RunningAggregates.from_dict(data["aggregates"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
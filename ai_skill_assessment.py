@@ -4,9 +4,21 @@
 공공기관 근무자 AI 활용 역량 진단 시스템
 """
 
+import hashlib
 import json
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from metrics import timed
+
+# 진단 문항 구성 버전 (문항 추가/삭제/영역 이동 시 올리고 schema_versions.py에 이전 구성과
+# 응답 변환 규칙을 등록)
+SCHEMA_VERSION = 1
 
 # 진단 문항 데이터베이스
 ASSESSMENT_DATA = {
@@ -139,36 +151,424 @@ LEVEL_CRITERIA = {
     "전문가": {"min": 66, "max": 75, "description": "AI 고도화 활용"}
 }
 
+# 레벨별 전체 평가 문구 ({level}, {percentage}는 진단 결과로 채움)
+OVERALL_ASSESSMENTS = {
+    "초급": "현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
+           "AI 도구에 대한 기본적인 이해와 경험이 부족한 상태입니다. "
+           "체계적인 학습을 통해 업무에 AI를 적용하기 시작하는 것이 필요합니다.",
+    
+    "중급": "현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
+           "AI 도구를 업무에 부분적으로 활용하고 있으나, 더 깊이 있는 활용이 가능합니다. "
+           "실무 적용 사례를 늘리고 고급 기능을 학습하면 업무 효율을 크게 높일 수 있습니다.",
+    
+    "고급": "현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
+           "AI 도구를 능숙하게 활용하여 업무 효율을 높이고 있습니다. "
+           "이제는 팀 내 AI 활용을 선도하고, 고도화된 AI 전략을 수립할 수 있는 단계입니다.",
+    
+    "전문가": "현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
+            "AI 도구를 전문가 수준으로 활용하고 있으며, 조직의 디지털 전환을 이끌 수 있습니다. "
+            "다른 구성원들의 멘토 역할과 AI 활용 문화 확산에 기여할 수 있습니다."
+}
+
+# 강점/약점 판단 기준 (영역 달성률 %)과 강점/약점/학습 경로에 보여줄 영역 수
+STRENGTH_MIN_PERCENTAGE = 70
+WEAKNESS_MAX_PERCENTAGE = 60
+MAX_ANALYSIS_ITEMS = 3
+
+# 영역별 강점 코멘트
+STRENGTH_COMMENTS = {
+    "basic": "AI 기술에 대한 이해도가 높아 새로운 AI 도구를 빠르게 습득할 수 있습니다.",
+    "automation": "업무 자동화를 잘 활용하여 효율성을 높이고 있습니다.",
+    "data_analysis": "데이터 기반 의사결정 능력이 우수하여 정책 수립에 강점이 있습니다.",
+    "practical_tools": "다양한 AI 도구를 실전에서 능숙하게 활용하고 있습니다.",
+    "ethics_security": "AI 윤리와 보안에 대한 인식이 높아 책임감 있게 활용하고 있습니다."
+}
+
+# 영역별 약점 코멘트
+WEAKNESS_COMMENTS = {
+    "basic": "AI 기본 개념 학습이 필요합니다. 입문 과정부터 시작하는 것을 추천합니다.",
+    "automation": "반복 업무를 AI로 자동화하는 연습이 필요합니다. 실습 중심 학습을 추천합니다.",
+    "data_analysis": "데이터 분석 도구 활용 경험을 쌓아야 합니다. 실제 업무 데이터로 실습해보세요.",
+    "practical_tools": "AI 도구 사용 경험이 부족합니다. 매일 조금씩 사용해보는 것을 추천합니다.",
+    "ethics_security": "AI 윤리와 보안에 대한 이해가 필요합니다. 공공기관 가이드라인을 숙지하세요."
+}
+
+# 레벨별 추천사항 (목록에 없는 레벨은 전문가 추천사항 사용)
+RECOMMENDATIONS = {
+    "초급": (
+        "📚 생성형 AI 기초 강의를 수강하여 개념을 이해하세요",
+        "💻 ChatGPT 또는 Claude를 업무에 하루 10분씩 사용해보세요",
+        "👥 AI 활용 사례를 동료들과 공유하며 학습하세요",
+        "📝 간단한 문서 작성부터 AI를 활용해보세요"
+    ),
+    "중급": (
+        "🎯 프롬프트 엔지니어링 기술을 학습하세요",
+        "🔧 업무별 AI 도구(문서작성, 데이터분석 등)를 심화 학습하세요",
+        "📊 데이터 분석을 위한 AI 활용법을 익히세요",
+        "🤝 팀 내에서 AI 활용 사례를 공유하고 확산하세요"
+    ),
+    "고급": (
+        "🚀 조직의 AI 활용 전략 수립에 참여하세요",
+        "👨‍🏫 다른 구성원들의 AI 활용을 지도하고 멘토링하세요",
+        "🔬 고급 AI 도구와 자동화 워크플로우를 구축하세요",
+        "📈 AI 활용 성과를 측정하고 개선점을 도출하세요"
+    ),
+    "전문가": (
+        "🎓 AI 최신 트렌드를 지속적으로 학습하고 공유하세요",
+        "🏢 조직의 디지털 전환을 이끄는 리더 역할을 하세요",
+        "✍️ AI 활용 가이드라인과 베스트 프랙티스를 문서화하세요",
+        "🌟 외부 컨퍼런스나 세미나에서 경험을 공유하세요"
+    )
+}
+
+# 영역별 학습 자료
+LEARNING_RESOURCES = {
+    "basic": (
+        {"type": "온라인 강의", "title": "생성형 AI 이해하기", "duration": "2시간", "level": "입문"},
+        {"type": "도서", "title": "ChatGPT 제대로 활용하기", "duration": "자율학습", "level": "입문"},
+        {"type": "실습", "title": "AI 챗봇 기본 사용법", "duration": "1시간", "level": "입문"}
+    ),
+    "automation": (
+        {"type": "온라인 강의", "title": "공공기관 문서 작성 AI 자동화", "duration": "3시간", "level": "초급"},
+        {"type": "실습", "title": "보고서 작성 실전 프로젝트", "duration": "2시간", "level": "초급"},
+        {"type": "가이드", "title": "업무별 AI 자동화 템플릿", "duration": "자율학습", "level": "초급"}
+    ),
+    "data_analysis": (
+        {"type": "온라인 강의", "title": "AI 데이터 분석 기초", "duration": "4시간", "level": "중급"},
+        {"type": "실습", "title": "정책 데이터 분석 프로젝트", "duration": "3시간", "level": "중급"},
+        {"type": "도구", "title": "데이터 분석 AI 도구 활용", "duration": "2시간", "level": "중급"}
+    ),
+    "practical_tools": (
+        {"type": "실습", "title": "프롬프트 엔지니어링 마스터", "duration": "3시간", "level": "중급"},
+        {"type": "워크샵", "title": "업무별 AI 도구 실전", "duration": "4시간", "level": "중급"},
+        {"type": "커뮤니티", "title": "AI 활용 사례 스터디", "duration": "지속", "level": "중급"}
+    ),
+    "ethics_security": (
+        {"type": "필수교육", "title": "공공기관 AI 활용 가이드라인", "duration": "2시간", "level": "필수"},
+        {"type": "온라인 강의", "title": "AI 윤리와 책임", "duration": "2시간", "level": "초급"},
+        {"type": "문서", "title": "개인정보보호 체크리스트", "duration": "30분", "level": "필수"}
+    )
+}
+
+class LevelTable:
+    """
+    레벨 경계표
+
+    레벨별 하한값을 정렬된 배열로 보관하여 단일 점수는 bisect,
+    점수 배열은 searchsorted로 한 번에 분류합니다. 기본 LEVEL_CRITERIA 외에
+    백분위 기반이나 기관별 기준 등 다른 경계표로 교체할 수 있습니다.
+    """
+
+    def __init__(self, names: Sequence[str], thresholds: Sequence[float], max_score: float):
+        """
+        Args:
+            names: 낮은 레벨부터 순서대로 정렬된 레벨명
+            thresholds: 각 레벨의 하한값 (첫 값이 허용 최소 점수)
+            max_score: 허용 최대 점수
+        """
+        if not names or len(names) != len(thresholds):
+            raise ValueError("레벨명과 하한값의 개수가 일치해야 합니다")
+        if any(lo >= hi for lo, hi in zip(thresholds, thresholds[1:])):
+            raise ValueError(f"레벨 하한값은 오름차순이어야 합니다: {list(thresholds)}")
+        if max_score < thresholds[-1]:
+            raise ValueError(f"최대 점수({max_score})가 마지막 하한값보다 작습니다")
+
+        self.names = tuple(names)
+        self.thresholds = tuple(thresholds)
+        self.min_score = thresholds[0]
+        self.max_score = max_score
+        self._threshold_array = np.asarray(thresholds, dtype=np.float64)
+        self._name_array = np.array(self.names, dtype=object)
+
+    @classmethod
+    def from_criteria(cls, criteria: Dict[str, Dict]) -> "LevelTable":
+        """LEVEL_CRITERIA 형식의 dict로부터 경계표 생성"""
+        ordered = sorted(criteria.items(), key=lambda item: item[1]["min"])
+        for (name, prev), (next_name, cur) in zip(ordered, ordered[1:]):
+            if cur["min"] <= prev["max"]:
+                raise ValueError(f"레벨 구간이 겹칩니다: {name}, {next_name}")
+        return cls(
+            [name for name, _ in ordered],
+            [c["min"] for _, c in ordered],
+            ordered[-1][1]["max"]
+        )
+
+    @classmethod
+    def from_percentiles(
+        cls,
+        scores: Sequence[float],
+        percentiles: Sequence[float],
+        names: Sequence[str],
+        min_score: float = 0,
+        max_score: float = 75
+    ) -> "LevelTable":
+        """
+        모집단 점수 분포의 백분위를 경계로 하는 경계표 생성
+
+        Args:
+            scores: 기준 모집단 점수
+            percentiles: 두 번째 레벨부터의 하한 백분위 (예: [25, 50, 85])
+            names: 레벨명 (len(percentiles) + 1 개)
+        """
+        if len(names) != len(percentiles) + 1:
+            raise ValueError("레벨명은 백분위 개수보다 하나 많아야 합니다")
+        cutoffs = np.percentile(np.asarray(scores, dtype=np.float64), percentiles)
+        return cls(names, [min_score] + cutoffs.tolist(), max_score)
+
+    def _validate(self, low, high) -> None:
+        if low < self.min_score or high > self.max_score:
+            raise ValueError(
+                f"점수가 허용 범위({self.min_score}~{self.max_score})를 벗어났습니다: "
+                f"{low if low < self.min_score else high}"
+            )
+
+    def classify(self, score: float) -> str:
+        """단일 점수의 레벨 판정 (bisect)"""
+        self._validate(score, score)
+        return self.names[bisect_right(self.thresholds, score) - 1]
+
+    def classify_codes(self, scores: Union[np.ndarray, Sequence[float]]) -> np.ndarray:
+        """점수 배열의 레벨 인덱스 판정 (searchsorted)"""
+        scores = np.asarray(scores)
+        if scores.size:
+            self._validate(scores.min(), scores.max())
+        return np.searchsorted(self._threshold_array, scores, side="right") - 1
+
+    def classify_array(self, scores: Union[np.ndarray, Sequence[float]]) -> np.ndarray:
+        """점수 배열의 레벨명 판정"""
+        return self._name_array[self.classify_codes(scores)]
+
+
+def load_level_tables(path: str) -> Dict[str, LevelTable]:
+    """
+    JSON 파일에서 경계표 묶음을 불러오기 (기관/부서별 기준 등)
+
+    파일 형식: {"기준명": {"초급": {"min": 0, "max": 30}, ...}, ...}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {key: LevelTable.from_criteria(criteria) for key, criteria in data.items()}
+
+
+def relevel_by_group(
+    scores: Union[np.ndarray, Sequence[float]],
+    groups: Sequence[str],
+    tables: Dict[str, LevelTable],
+    default: Optional[LevelTable] = None
+) -> np.ndarray:
+    """그룹(기관/부서)별 경계표로 점수 배열 전체를 재판정"""
+    scores = np.asarray(scores)
+    groups = np.asarray(groups, dtype=object)
+    levels = np.empty(scores.shape, dtype=object)
+    assigned = np.zeros(scores.shape, dtype=bool)
+    for key, table in tables.items():
+        mask = groups == key
+        if mask.any():
+            levels[mask] = table.classify_array(scores[mask])
+            assigned |= mask
+    if not assigned.all():
+        if default is None:
+            missing = sorted(set(groups[~assigned].tolist()))
+            raise ValueError(f"경계표가 없는 그룹이 있습니다: {missing}")
+        levels[~assigned] = default.classify_array(scores[~assigned])
+    return levels
+
+
+class CompiledSchema:
+    """
+    진단 문항 구조를 인덱스 배열로 미리 컴파일한 스키마
+
+    ASSESSMENT_DATA/LEVEL_CRITERIA의 중첩 dict를 한 번만 순회하여
+    점수 계산과 분석에 필요한 조회 구조를 만들어 둡니다.
+    """
+
+    def __init__(self, data: Dict, level_criteria: Dict, version: int = SCHEMA_VERSION):
+        self.data = data
+        self.level_criteria = level_criteria
+        self.version = version
+        self.likert_scale = data["likert_scale"]
+        self.likert_options = tuple(sorted(self.likert_scale))
+
+        # 영역 정보
+        self.categories = tuple(data["categories"])
+        self.category_ids = tuple(c["id"] for c in self.categories)
+        self.category_names = tuple(c["name"] for c in self.categories)
+        self.category_index = {cat_id: j for j, cat_id in enumerate(self.category_ids)}
+        self.category_by_id = {c["id"]: c for c in self.categories}
+        self.category_question_ids = tuple(
+            tuple(q["id"] for q in c["questions"]) for c in self.categories
+        )
+
+        # 문항 → 영역 인덱스 (영역별 문항은 연속 구간)
+        self.question_ids = tuple(q_id for q_ids in self.category_question_ids for q_id in q_ids)
+        self.question_index = {q_id: i for i, q_id in enumerate(self.question_ids)}
+        self.num_questions = len(self.question_ids)
+        self.question_category = np.array(
+            [j for j, q_ids in enumerate(self.category_question_ids) for _ in q_ids],
+            dtype=np.int64
+        )
+        self.category_starts = np.array(
+            np.cumsum([0] + [len(q_ids) for q_ids in self.category_question_ids[:-1]]),
+            dtype=np.int64
+        )
+
+        # 만점 벡터
+        max_likert = max(self.likert_options)
+        self.category_max_list = tuple(len(q_ids) * max_likert for q_ids in self.category_question_ids)
+        self.category_max_scores = np.array(self.category_max_list, dtype=np.int64)
+        self.total_max = sum(self.category_max_list)
+
+        # 점수는 정수 0..max 이므로 달성률(round 결과)을 표로 미리 계산
+        self.category_percentage_tables = tuple(
+            np.array([round((s / m) * 100, 1) for s in range(m + 1)])
+            for m in self.category_max_list
+        )
+        self.total_percentage_table = np.array(
+            [round((s / self.total_max) * 100, 1) for s in range(self.total_max + 1)]
+        )
+
+        # 레벨 기준 (하한 기준 정렬)
+        self.level_table = LevelTable.from_criteria(level_criteria)
+        self.level_names = self.level_table.names
+        self.level_thresholds = np.array(self.level_table.thresholds, dtype=np.int64)
+
+        # 응답 저장 형식: 문항 순서대로 한 글자씩 '0'(미응답)~'5'
+        self.layout_id = hashlib.sha256(",".join(self.question_ids).encode("utf-8")).hexdigest()[:8]
+
+    # ---------- 응답 인코딩 ----------
+    def encode_responses(self, responses: Dict[str, int]) -> str:
+        """
+        응답 dict → 문항당 1바이트 숫자 문자열 (예: "453...")
+
+        Raises:
+            ValueError: 응답 값이 0(미응답) 또는 1~5가 아닐 때
+        """
+        values = [responses.get(q_id, 0) for q_id in self.question_ids]
+        if any(not isinstance(value, (int, np.integer)) or not 0 <= value <= 5 for value in values):
+            raise ValueError(f"응답 값은 0(미응답) 또는 1~5 사이의 정수여야 합니다: {values}")
+        return "".join(map(str, values))
+
+    def response_bytes(self, code: str) -> bytes:
+        """
+        응답 문자열 → 문항 순서의 응답 값 (문항당 1바이트)
+
+        Raises:
+            ValueError: 길이나 문자가 형식에 맞지 않을 때
+        """
+        values = code.encode("ascii").translate(_RESPONSE_DIGITS)
+        if len(values) != self.num_questions or max(values, default=0) > 5:
+            raise ValueError(f"응답 형식이 맞지 않습니다: {code!r}")
+        return values
+
+    def decode_responses(self, code: str) -> Dict[str, int]:
+        """응답 문자열 → 응답 dict (미응답 문항은 제외)"""
+        return {
+            q_id: value for q_id, value in zip(self.question_ids, self.response_bytes(code)) if value
+        }
+
+    def decode_response_matrix(self, codes: Sequence[str]) -> np.ndarray:
+        """응답 문자열 목록 → N×문항 수 uint8 행렬 (calculate_scores_batch 입력)"""
+        values = np.frombuffer(
+            "".join(codes).encode("ascii").translate(_RESPONSE_DIGITS), dtype=np.uint8
+        )
+        if values.size != len(codes) * self.num_questions or (values.size and values.max() > 5):
+            raise ValueError("응답 형식이 맞지 않는 결과가 있습니다")
+        return values.reshape(len(codes), self.num_questions)
+
+
+# '0'~'5' → 0~5, 그 외 문자는 255로 바꿔 검증에서 걸러냄
+_RESPONSE_DIGITS = bytes(i - 48 if 48 <= i <= 53 else 255 for i in range(256))
+
+
+# 임포트 시 한 번 컴파일되는 기본 스키마
+SCHEMA = CompiledSchema(ASSESSMENT_DATA, LEVEL_CRITERIA)
+
+
+# 분석 결과 캐시 (영역별 점수 조합이 같으면 분석도 같으므로 재사용)
+ANALYSIS_CACHE_SIZE = 4096
+_analysis_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+_analysis_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _copy_analysis(analysis: Dict) -> Dict:
+    """캐시된 분석의 사본 (문자열/숫자 외의 dict, list는 모두 새로 만듦)"""
+    return {
+        **analysis,
+        "strengths": [dict(item) for item in analysis["strengths"]],
+        "weaknesses": [dict(item) for item in analysis["weaknesses"]],
+        "recommendations": list(analysis["recommendations"]),
+        "learning_path": [
+            dict(path, resources=[
+                dict(resource) if isinstance(resource, dict) else resource
+                for resource in path["resources"]
+            ])
+            for path in analysis["learning_path"]
+        ]
+    }
+
+
+def analysis_cache_info() -> Dict:
+    """분석 캐시 적중/실패 횟수와 크기"""
+    with _analysis_cache_lock:
+        return dict(_analysis_cache_stats, size=len(_analysis_cache), maxsize=ANALYSIS_CACHE_SIZE)
+
+
+def clear_analysis_cache() -> None:
+    with _analysis_cache_lock:
+        _analysis_cache.clear()
+        _analysis_cache_stats.update(hits=0, misses=0)
+
+
 class AISkillAssessment:
     """AI 활용 역량 진단 클래스"""
     
-    def __init__(self):
-        self.data = ASSESSMENT_DATA
+    def __init__(
+        self,
+        schema: Optional[CompiledSchema] = None,
+        level_table: Optional[LevelTable] = None,
+        outcome_table=None
+    ):
+        """
+        Args:
+            schema: 컴파일된 스키마 (기본: SCHEMA)
+            level_table: 레벨 경계표 (기본: 스키마의 LEVEL_CRITERIA)
+            outcome_table: 영역 점수 조합별 결과표 (outcome_table.OutcomeTable,
+                지정 시 분석의 강점/약점/학습 경로 판단을 표 조회로 대신함)
+        """
+        self.schema = schema or SCHEMA
+        self.level_table = level_table or self.schema.level_table
+        self.data = self.schema.data
         self.responses = {}
+        if outcome_table is not None and outcome_table.schema is not self.schema:
+            raise ValueError("결과표가 다른 스키마로 만들어졌습니다")
+        self.outcome_table = outcome_table
         
+    @timed("calculate_scores")
     def calculate_scores(self, responses: Dict[str, int]) -> Dict:
         """점수 계산"""
         self.responses = responses
+        schema = self.schema
+        get = responses.get
         
         # 영역별 점수 계산
         category_scores = {}
-        for category in self.data["categories"]:
-            cat_id = category["id"]
-            questions = [q["id"] for q in category["questions"]]
-            score = sum(responses.get(q_id, 0) for q_id in questions)
-            max_score = len(questions) * 5
+        total_score = 0
+        for j, cat_id in enumerate(schema.category_ids):
+            score = sum(get(q_id, 0) for q_id in schema.category_question_ids[j])
+            max_score = schema.category_max_list[j]
             percentage = (score / max_score) * 100
+            total_score += score
             
             category_scores[cat_id] = {
-                "name": category["name"],
+                "name": schema.category_names[j],
                 "score": score,
                 "max_score": max_score,
                 "percentage": round(percentage, 1)
             }
         
         # 총점 계산
-        total_score = sum(cs["score"] for cs in category_scores.values())
-        total_max = sum(cs["max_score"] for cs in category_scores.values())
+        total_max = schema.total_max
         
         # 레벨 판정
         level = self._determine_level(total_score)
@@ -182,48 +582,202 @@ class AISkillAssessment:
             "timestamp": datetime.now().isoformat()
         }
     
+    def calculate_scores_batch(
+        self,
+        responses: Union[np.ndarray, Iterable[Dict[str, int]]]
+    ) -> Dict:
+        """
+        여러 응답자의 점수를 한 번에 계산
+
+        Args:
+            responses: N×15 응답 행렬(문항 순서 Q1~Q15) 또는 응답 dict 목록.
+                미응답 문항은 0으로 취급합니다 (calculate_scores와 동일).
+
+        Returns:
+            영역별 점수/달성률, 총점, 달성률, 레벨을 담은 배열 dict.
+            각 행의 값은 calculate_scores 결과와 정확히 일치합니다.
+        """
+        schema = self.schema
+        matrix = self._to_response_matrix(responses, schema.question_ids)
+
+        # 영역별 문항은 연속 구간이므로 구간 합으로 영역 점수 계산
+        if matrix.shape[0]:
+            category_scores = np.add.reduceat(matrix, schema.category_starts, axis=1)
+        else:
+            category_scores = np.zeros((0, len(schema.category_ids)), dtype=np.int64)
+        total_scores = category_scores.sum(axis=1)
+
+        # 반올림 결과를 표에서 인덱싱 (np.round와 round()의 미세한 차이를 피함)
+        category_percentages = np.empty(category_scores.shape, dtype=np.float64)
+        for j, table in enumerate(schema.category_percentage_tables):
+            category_percentages[:, j] = table[category_scores[:, j]]
+
+        return {
+            "category_ids": list(schema.category_ids),
+            "category_names": list(schema.category_names),
+            "category_max_scores": schema.category_max_scores,
+            "category_scores": category_scores,
+            "category_percentages": category_percentages,
+            "total_score": total_scores,
+            "total_max": schema.total_max,
+            "percentage": schema.total_percentage_table[total_scores],
+            "level": self.level_table.classify_array(total_scores)
+        }
+
+    def iter_batch_scores(self, batch: Dict, timestamp: Optional[str] = None) -> Iterator[Dict]:
+        """calculate_scores_batch 결과를 행 단위 calculate_scores 형식으로 변환"""
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+
+        category_ids = batch["category_ids"]
+        category_names = batch["category_names"]
+        category_max = [int(m) for m in batch["category_max_scores"]]
+        total_max = batch["total_max"]
+
+        for i in range(len(batch["total_score"])):
+            cat_scores = batch["category_scores"][i].tolist()
+            cat_percentages = batch["category_percentages"][i].tolist()
+            yield {
+                "total_score": int(batch["total_score"][i]),
+                "total_max": total_max,
+                "percentage": float(batch["percentage"][i]),
+                "level": batch["level"][i],
+                "category_scores": {
+                    cat_id: {
+                        "name": category_names[j],
+                        "score": cat_scores[j],
+                        "max_score": category_max[j],
+                        "percentage": cat_percentages[j]
+                    }
+                    for j, cat_id in enumerate(category_ids)
+                },
+                "timestamp": timestamp
+            }
+
+    @staticmethod
+    def _to_response_matrix(
+        responses: Union[np.ndarray, Iterable[Dict[str, int]]],
+        question_ids: Tuple[str, ...]
+    ) -> np.ndarray:
+        """응답 입력을 검증된 N×문항수 정수 행렬로 변환"""
+        if isinstance(responses, np.ndarray):
+            matrix = responses
+        else:
+            rows = [[r.get(q_id, 0) for q_id in question_ids] for r in responses]
+            matrix = np.array(rows, dtype=np.int64).reshape(len(rows), len(question_ids))
+
+        if matrix.ndim != 2 or matrix.shape[1] != len(question_ids):
+            raise ValueError(
+                f"응답 행렬은 N×{len(question_ids)} 형태여야 합니다: {matrix.shape}"
+            )
+        if matrix.size and not np.issubdtype(matrix.dtype, np.integer):
+            raise ValueError(f"응답 값은 정수여야 합니다: {matrix.dtype}")
+        matrix = matrix.astype(np.int64, copy=False)
+        if matrix.size and (matrix.min() < 0 or matrix.max() > 5):
+            raise ValueError("응답 값은 0(미응답) 또는 1~5 사이여야 합니다")
+        return matrix
+
     def _determine_level(self, score: int) -> str:
-        """레벨 판정"""
-        for level, criteria in LEVEL_CRITERIA.items():
-            if criteria["min"] <= score <= criteria["max"]:
-                return level
-        return "초급"
+        """레벨 판정 (범위를 벗어난 점수는 ValueError)"""
+        return self.level_table.classify(score)
     
+    @timed("generate_analysis")
     def generate_analysis(self, scores: Dict) -> Dict:
-        """상세 분석 생성"""
-        analysis = {
+        """
+        상세 분석 생성
+
+        분석은 레벨과 영역별 점수로만 결정되므로 이 조합을 키로
+        최근 ANALYSIS_CACHE_SIZE개의 결과를 재사용합니다. 캐시는 모든 세션이
+        공유하므로 호출할 때마다 사본을 돌려줍니다.
+        """
+        # 달성률은 스키마와 점수로 정해지므로 키에서 제외
+        key = (
+            self.schema,
+            scores["level"],
+            tuple(
+                (cat_id, cat_score["score"])
+                for cat_id, cat_score in scores["category_scores"].items()
+            )
+        )
+        with _analysis_cache_lock:
+            analysis = _analysis_cache.get(key)
+            if analysis is not None:
+                _analysis_cache.move_to_end(key)
+                _analysis_cache_stats["hits"] += 1
+        
+        if analysis is None:
+            outcome = None
+            if self.outcome_table is not None:
+                outcome = self.outcome_table.lookup([score for _, score in key[2]])
+            if outcome is not None:
+                analysis = self._analysis_from_outcome(scores, outcome)
+            else:
+                analysis = {
+                    "overall_assessment": self._generate_overall_assessment(scores),
+                    "strengths": self._identify_strengths(scores),
+                    "weaknesses": self._identify_weaknesses(scores),
+                    "recommendations": self._generate_recommendations(scores),
+                    "learning_path": self._create_learning_path(scores)
+                }
+            with _analysis_cache_lock:
+                _analysis_cache_stats["misses"] += 1
+                _analysis_cache[key] = analysis
+                if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+        
+        return _copy_analysis(analysis)
+    
+    def _analysis_from_outcome(self, scores: Dict, outcome: Tuple) -> Dict:
+        """결과표 조회 결과(영역 인덱스)로 분석 구성 (정렬/비교 없이 조립만 함)"""
+        schema = self.schema
+        category_ids = schema.category_ids
+        category_scores = scores["category_scores"]
+        _, strength_ids, weakness_ids, path_ids = outcome
+        
+        strengths = []
+        for j in strength_ids:
+            cat_score = category_scores[category_ids[j]]
+            strengths.append({
+                "category": cat_score["name"],
+                "score": cat_score["percentage"],
+                "description": schema.categories[j]["description"],
+                "comment": STRENGTH_COMMENTS.get(category_ids[j], "")
+            })
+        
+        weaknesses = []
+        for j in weakness_ids:
+            cat_score = category_scores[category_ids[j]]
+            weaknesses.append({
+                "category": cat_score["name"],
+                "score": cat_score["percentage"],
+                "description": schema.categories[j]["description"],
+                "comment": WEAKNESS_COMMENTS.get(category_ids[j], "")
+            })
+        
+        learning_path = []
+        for idx, j in enumerate(path_ids, 1):
+            cat_score = category_scores[category_ids[j]]
+            learning_path.append({
+                "priority": idx,
+                "category": cat_score["name"],
+                "current_score": cat_score["percentage"],
+                "target_score": min(cat_score["percentage"] + 20, 100),
+                "resources": self._get_learning_resources(category_ids[j])
+            })
+        
+        return {
             "overall_assessment": self._generate_overall_assessment(scores),
-            "strengths": self._identify_strengths(scores),
-            "weaknesses": self._identify_weaknesses(scores),
+            "strengths": strengths,
+            "weaknesses": weaknesses,
             "recommendations": self._generate_recommendations(scores),
-            "learning_path": self._create_learning_path(scores)
+            "learning_path": learning_path
         }
-        return analysis
     
     def _generate_overall_assessment(self, scores: Dict) -> str:
         """전체 평가 생성"""
         level = scores["level"]
-        percentage = scores["percentage"]
-        
-        assessments = {
-            "초급": f"현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
-                   "AI 도구에 대한 기본적인 이해와 경험이 부족한 상태입니다. "
-                   "체계적인 학습을 통해 업무에 AI를 적용하기 시작하는 것이 필요합니다.",
-            
-            "중급": f"현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
-                   "AI 도구를 업무에 부분적으로 활용하고 있으나, 더 깊이 있는 활용이 가능합니다. "
-                   "실무 적용 사례를 늘리고 고급 기능을 학습하면 업무 효율을 크게 높일 수 있습니다.",
-            
-            "고급": f"현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
-                   "AI 도구를 능숙하게 활용하여 업무 효율을 높이고 있습니다. "
-                   "이제는 팀 내 AI 활용을 선도하고, 고도화된 AI 전략을 수립할 수 있는 단계입니다.",
-            
-            "전문가": f"현재 AI 활용 역량은 '{level}' 수준입니다 ({percentage}점). "
-                    "AI 도구를 전문가 수준으로 활용하고 있으며, 조직의 디지털 전환을 이끌 수 있습니다. "
-                    "다른 구성원들의 멘토 역할과 AI 활용 문화 확산에 기여할 수 있습니다."
-        }
-        
-        return assessments.get(level, assessments["초급"])
+        template = OVERALL_ASSESSMENTS.get(level, OVERALL_ASSESSMENTS["초급"])
+        return template.format(level=level, percentage=scores["percentage"])
     
     def _identify_strengths(self, scores: Dict) -> List[Dict]:
         """강점 영역 파악"""
@@ -232,8 +786,8 @@ class AISkillAssessment:
         
         # 70% 이상인 영역을 강점으로 판단
         for cat_id, cat_score in category_scores.items():
-            if cat_score["percentage"] >= 70:
-                category = next(c for c in self.data["categories"] if c["id"] == cat_id)
+            if cat_score["percentage"] >= STRENGTH_MIN_PERCENTAGE:
+                category = self.schema.category_by_id[cat_id]
                 strengths.append({
                     "category": cat_score["name"],
                     "score": cat_score["percentage"],
@@ -243,7 +797,7 @@ class AISkillAssessment:
         
         # 점수 순으로 정렬
         strengths.sort(key=lambda x: x["score"], reverse=True)
-        return strengths[:3]  # 상위 3개만
+        return strengths[:MAX_ANALYSIS_ITEMS]  # 상위 3개만
     
     def _identify_weaknesses(self, scores: Dict) -> List[Dict]:
         """약점 영역 파악"""
@@ -252,8 +806,8 @@ class AISkillAssessment:
         
         # 60% 미만인 영역을 약점으로 판단
         for cat_id, cat_score in category_scores.items():
-            if cat_score["percentage"] < 60:
-                category = next(c for c in self.data["categories"] if c["id"] == cat_id)
+            if cat_score["percentage"] < WEAKNESS_MAX_PERCENTAGE:
+                category = self.schema.category_by_id[cat_id]
                 weaknesses.append({
                     "category": cat_score["name"],
                     "score": cat_score["percentage"],
@@ -263,65 +817,19 @@ class AISkillAssessment:
         
         # 점수 순으로 정렬 (낮은 순)
         weaknesses.sort(key=lambda x: x["score"])
-        return weaknesses[:3]  # 하위 3개만
+        return weaknesses[:MAX_ANALYSIS_ITEMS]  # 하위 3개만
     
     def _get_strength_comment(self, category_id: str) -> str:
         """강점 코멘트"""
-        comments = {
-            "basic": "AI 기술에 대한 이해도가 높아 새로운 AI 도구를 빠르게 습득할 수 있습니다.",
-            "automation": "업무 자동화를 잘 활용하여 효율성을 높이고 있습니다.",
-            "data_analysis": "데이터 기반 의사결정 능력이 우수하여 정책 수립에 강점이 있습니다.",
-            "practical_tools": "다양한 AI 도구를 실전에서 능숙하게 활용하고 있습니다.",
-            "ethics_security": "AI 윤리와 보안에 대한 인식이 높아 책임감 있게 활용하고 있습니다."
-        }
-        return comments.get(category_id, "")
+        return STRENGTH_COMMENTS.get(category_id, "")
     
     def _get_weakness_comment(self, category_id: str) -> str:
         """약점 코멘트"""
-        comments = {
-            "basic": "AI 기본 개념 학습이 필요합니다. 입문 과정부터 시작하는 것을 추천합니다.",
-            "automation": "반복 업무를 AI로 자동화하는 연습이 필요합니다. 실습 중심 학습을 추천합니다.",
-            "data_analysis": "데이터 분석 도구 활용 경험을 쌓아야 합니다. 실제 업무 데이터로 실습해보세요.",
-            "practical_tools": "AI 도구 사용 경험이 부족합니다. 매일 조금씩 사용해보는 것을 추천합니다.",
-            "ethics_security": "AI 윤리와 보안에 대한 이해가 필요합니다. 공공기관 가이드라인을 숙지하세요."
-        }
-        return comments.get(category_id, "")
+        return WEAKNESS_COMMENTS.get(category_id, "")
     
     def _generate_recommendations(self, scores: Dict) -> List[str]:
         """맞춤형 추천사항"""
-        level = scores["level"]
-        recommendations = []
-        
-        if level == "초급":
-            recommendations = [
-                "📚 생성형 AI 기초 강의를 수강하여 개념을 이해하세요",
-                "💻 ChatGPT 또는 Claude를 업무에 하루 10분씩 사용해보세요",
-                "👥 AI 활용 사례를 동료들과 공유하며 학습하세요",
-                "📝 간단한 문서 작성부터 AI를 활용해보세요"
-            ]
-        elif level == "중급":
-            recommendations = [
-                "🎯 프롬프트 엔지니어링 기술을 학습하세요",
-                "🔧 업무별 AI 도구(문서작성, 데이터분석 등)를 심화 학습하세요",
-                "📊 데이터 분석을 위한 AI 활용법을 익히세요",
-                "🤝 팀 내에서 AI 활용 사례를 공유하고 확산하세요"
-            ]
-        elif level == "고급":
-            recommendations = [
-                "🚀 조직의 AI 활용 전략 수립에 참여하세요",
-                "👨‍🏫 다른 구성원들의 AI 활용을 지도하고 멘토링하세요",
-                "🔬 고급 AI 도구와 자동화 워크플로우를 구축하세요",
-                "📈 AI 활용 성과를 측정하고 개선점을 도출하세요"
-            ]
-        else:  # 전문가
-            recommendations = [
-                "🎓 AI 최신 트렌드를 지속적으로 학습하고 공유하세요",
-                "🏢 조직의 디지털 전환을 이끄는 리더 역할을 하세요",
-                "✍️ AI 활용 가이드라인과 베스트 프랙티스를 문서화하세요",
-                "🌟 외부 컨퍼런스나 세미나에서 경험을 공유하세요"
-            ]
-        
-        return recommendations
+        return list(RECOMMENDATIONS.get(scores["level"], RECOMMENDATIONS["전문가"]))
     
     def _create_learning_path(self, scores: Dict) -> List[Dict]:
         """학습 경로 생성"""
@@ -334,7 +842,7 @@ class AISkillAssessment:
             key=lambda x: x[1]["percentage"]
         )
         
-        for idx, (cat_id, cat_score) in enumerate(sorted_categories[:3], 1):
+        for idx, (cat_id, cat_score) in enumerate(sorted_categories[:MAX_ANALYSIS_ITEMS], 1):
             learning_resources = self._get_learning_resources(cat_id)
             learning_path.append({
                 "priority": idx,
@@ -348,32 +856,10 @@ class AISkillAssessment:
     
     def _get_learning_resources(self, category_id: str) -> List[Dict]:
         """카테고리별 학습 자료"""
-        resources = {
-            "basic": [
-                {"type": "온라인 강의", "title": "생성형 AI 이해하기", "duration": "2시간", "level": "입문"},
-                {"type": "도서", "title": "ChatGPT 제대로 활용하기", "duration": "자율학습", "level": "입문"},
-                {"type": "실습", "title": "AI 챗봇 기본 사용법", "duration": "1시간", "level": "입문"}
-            ],
-            "automation": [
-                {"type": "온라인 강의", "title": "공공기관 문서 작성 AI 자동화", "duration": "3시간", "level": "초급"},
-                {"type": "실습", "title": "보고서 작성 실전 프로젝트", "duration": "2시간", "level": "초급"},
-                {"type": "가이드", "title": "업무별 AI 자동화 템플릿", "duration": "자율학습", "level": "초급"}
-            ],
-            "data_analysis": [
-                {"type": "온라인 강의", "title": "AI 데이터 분석 기초", "duration": "4시간", "level": "중급"},
-                {"type": "실습", "title": "정책 데이터 분석 프로젝트", "duration": "3시간", "level": "중급"},
-                {"type": "도구", "title": "데이터 분석 AI 도구 활용", "duration": "2시간", "level": "중급"}
-            ],
-            "practical_tools": [
-                {"type": "실습", "title": "프롬프트 엔지니어링 마스터", "duration": "3시간", "level": "중급"},
-                {"type": "워크샵", "title": "업무별 AI 도구 실전", "duration": "4시간", "level": "중급"},
-                {"type": "커뮤니티", "title": "AI 활용 사례 스터디", "duration": "지속", "level": "중급"}
-            ],
-            "ethics_security": [
-                {"type": "필수교육", "title": "공공기관 AI 활용 가이드라인", "duration": "2시간", "level": "필수"},
-                {"type": "온라인 강의", "title": "AI 윤리와 책임", "duration": "2시간", "level": "초급"},
-                {"type": "문서", "title": "개인정보보호 체크리스트", "duration": "30분", "level": "필수"}
-            ]
-        }
-        
-        return resources.get(category_id, [])
+        return [dict(resource) for resource in LEARNING_RESOURCES.get(category_id, ())]
+
+
+if __name__ == "__main__":
+    # 명령행 실행 시 응답 파일 일괄 채점 (batch_score.py 참고)
+    from batch_score import main
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - JSON HTTP API
+
+Streamlit 화면 없이 채점/분석/리포트/통계를 쓸 수 있는 asyncio 기반
+HTTP/1.1 서버입니다 (표준 라이브러리만 사용, keep-alive 지원).
+
+    GET  /health                        상태 확인
+    POST /api/score                     점수 계산
+    POST /api/analyze                   점수 + 분석 (save=true면 저장 후 result_id 포함)
+    GET  /api/results/<결과 ID>/report  HTML 리포트 (리포트 캐시 사용)
+    GET  /api/admin/statistics          관리자 통계 (department, level, date_from, date_to)
+
+요청 본문은 항목 하나 또는 항목 배열(일괄 처리)이며, 배열이면 응답도 같은
+순서의 배열입니다.
+
+    {"responses": {"Q1": 4, ...}, "user_info": {"name": ..., ...}, "save": true}
+
+- 일괄 요청은 calculate_scores_batch로 한 번에 채점합니다.
+- 저장 요청은 대기열에 모았다가 save_many로 묶어서 기록하므로(그룹 커밋),
+  동시에 수천 건이 들어와도 저장소 잠금/집계 기록은 묶음당 한 번입니다.
+- 파일 입출력(저장, 결과 조회, 리포트 생성, 조건 통계)은 스레드 풀에서
+  실행해 이벤트 루프를 막지 않습니다.
+- AI_ASSESSMENT_API_TOKEN 환경 변수가 있으면 관리자 통계와 리포트 조회에
+  "Authorization: Bearer <토큰>"이 필요합니다.
+
+사용법:
+    python api_server.py [--host 127.0.0.1] [--port 8080] [--store results] [--backend log]
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import logging
+import os
+from datetime import date, datetime
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment
+from outcome_table import OutcomeTable, open_outcome_table
+from report_cache import ReportCache, open_report_cache
+from result_store import ResultFilter, ResultRepository, open_result_store
+
+logger = logging.getLogger(__name__)
+
+TOKEN_ENV = "AI_ASSESSMENT_API_TOKEN"
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_HEADERS = 100
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH_ITEMS = 10000
+KEEPALIVE_TIMEOUT = 30
+SAVE_BATCH_SIZE = 500
+LISTEN_BACKLOG = 4096
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SaveBatcher:
+    """저장 요청을 모아 save_many 한 번으로 기록하는 대기열 (그룹 커밋)"""
+
+    def __init__(self, store: ResultRepository, max_batch: int = SAVE_BATCH_SIZE):
+        self.store = store
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def save(self, item: Tuple) -> str:
+        """(user_info, scores, analysis, responses) 저장 후 결과 ID"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            # 기록하는 동안 쌓인 요청은 다음 묶음에 함께 들어감
+            while len(pending) < self.max_batch and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            try:
+                result_ids = await loop.run_in_executor(
+                    None, self.store.save_many, [item for item, _ in pending]
+                )
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result_id in zip(pending, result_ids):
+                if not future.done():
+                    future.set_result(result_id)
+
+
+def _parse_item(item, require_user: bool) -> Tuple[Optional[Dict], Dict[str, int]]:
+    """요청 항목 → (user_info, responses)"""
+    if not isinstance(item, dict):
+        raise HTTPError(400, "요청 항목은 JSON 객체여야 합니다")
+    responses = item.get("responses")
+    if not isinstance(responses, dict):
+        raise HTTPError(400, "responses 객체가 필요합니다")
+    unknown = set(responses) - set(SCHEMA.question_ids)
+    if unknown:
+        raise HTTPError(400, f"알 수 없는 문항입니다: {sorted(unknown)}")
+    for q_id, value in responses.items():
+        if type(value) is not int or value not in SCHEMA.likert_scale:
+            raise HTTPError(400, f"{q_id} 응답은 1~5 사이의 정수여야 합니다: {value!r}")
+
+    user_info = item.get("user_info")
+    if user_info is not None and not isinstance(user_info, dict):
+        raise HTTPError(400, "user_info는 JSON 객체여야 합니다")
+    if require_user:
+        if not user_info or not user_info.get("name"):
+            raise HTTPError(400, "저장하려면 user_info.name이 필요합니다")
+        user_info = {field: str(user_info.get(field, "")) for field in ("name", "department", "position")}
+    return user_info, responses
+
+
+def _filters(query: Dict[str, List[str]]) -> Optional[ResultFilter]:
+    def value(name: str) -> Optional[str]:
+        values = query.get(name)
+        return values[0] if values else None
+
+    try:
+        filters = ResultFilter(
+            department=value("department"),
+            level=value("level"),
+            date_from=date.fromisoformat(value("date_from")) if value("date_from") else None,
+            date_to=date.fromisoformat(value("date_to")) if value("date_to") else None
+        )
+    except ValueError as e:
+        raise HTTPError(400, f"날짜 형식이 맞지 않습니다: {e}") from None
+    if filters == ResultFilter():
+        return None
+    return filters
+
+
+class AssessmentAPI:
+    """요청 라우팅과 처리 (연결 관리는 handle_connection)"""
+
+    def __init__(
+        self,
+        store: ResultRepository,
+        report_cache: Optional[ReportCache] = None,
+        outcome_table: Optional[OutcomeTable] = None,
+        token: Optional[str] = None
+    ):
+        self.store = store
+        self.report_cache = report_cache or ReportCache()
+        self.assessment = AISkillAssessment(outcome_table=outcome_table)
+        self.token = token
+        self.saver = SaveBatcher(store)
+
+    # ---------- 엔드포인트 ----------
+    async def score(self, body, analyze: bool) -> object:
+        batch = isinstance(body, list)
+        items = body if batch else [body]
+        if not items:
+            return []
+        if len(items) > MAX_BATCH_ITEMS:
+            raise HTTPError(413, f"한 번에 최대 {MAX_BATCH_ITEMS}건까지 처리할 수 있습니다")
+        saves = [analyze and isinstance(item, dict) and bool(item.get("save")) for item in items]
+        parsed = [_parse_item(item, save) for item, save in zip(items, saves)]
+
+        if len(parsed) == 1:
+            all_scores = [self.assessment.calculate_scores(parsed[0][1])]
+        else:
+            matrix = np.array(
+                [[responses.get(q_id, 0) for q_id in SCHEMA.question_ids] for _, responses in parsed],
+                dtype=np.uint8
+            )
+            all_scores = list(self.assessment.iter_batch_scores(
+                self.assessment.calculate_scores_batch(matrix), datetime.now().isoformat()
+            ))
+
+        results = []
+        saving = []
+        pending = []
+        for (user_info, responses), scores, save in zip(parsed, all_scores, saves):
+            if not analyze:
+                results.append({"scores": scores})
+                continue
+            result = {"scores": scores, "analysis": self.assessment.generate_analysis(scores)}
+            if save:
+                saving.append(result)
+                pending.append(self.saver.save((user_info, scores, result["analysis"], responses)))
+            results.append(result)
+        # 한 요청의 저장 항목을 모두 대기열에 넣고 함께 기다림
+        for result, result_id in zip(saving, await asyncio.gather(*pending)):
+            result["result_id"] = result_id
+        return results if batch else results[0]
+
+    async def report(self, result_id: str) -> str:
+        loop = asyncio.get_running_loop()
+        record = await loop.run_in_executor(None, self.store.get, result_id)
+        if record is None:
+            raise HTTPError(404, f"결과가 없습니다: {result_id}")
+        analysis = record.get("analysis") or self.assessment.generate_analysis(record["scores"])
+        return await loop.run_in_executor(
+            None, self.report_cache.get_or_render,
+            result_id, record["user_info"], record["scores"], analysis
+        )
+
+    async def statistics(self, query: Dict[str, List[str]]) -> Dict:
+        filters = _filters(query)
+        return await asyncio.get_running_loop().run_in_executor(None, self.store.statistics, filters)
+
+    # ---------- 라우팅 ----------
+    def _check_token(self, headers: Dict[str, str]) -> None:
+        if self.token is None:
+            return
+        supplied = headers.get("authorization", "")
+        if not hmac.compare_digest(supplied.encode("utf-8"), f"Bearer {self.token}".encode("utf-8")):
+            raise HTTPError(401, "인증이 필요합니다")
+
+    async def dispatch(self, method: str, target: str, headers: Dict[str, str],
+                       body: bytes) -> Tuple[int, str, bytes]:
+        """요청 → (상태 코드, Content-Type, 본문)"""
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/health":
+            self._require(method, "GET")
+            return _json(200, {"status": "ok"})
+
+        if path in ("/api/score", "/api/analyze"):
+            self._require(method, "POST")
+            try:
+                payload = json.loads(body)
+            except (UnicodeDecodeError, ValueError):
+                raise HTTPError(400, "요청 본문이 올바른 JSON이 아닙니다") from None
+            return _json(200, await self.score(payload, analyze=path == "/api/analyze"))
+
+        if path == "/api/admin/statistics":
+            self._require(method, "GET")
+            self._check_token(headers)
+            return _json(200, await self.statistics(parse_qs(url.query)))
+
+        parts = path.split("/")
+        if len(parts) == 5 and parts[:3] == ["", "api", "results"] and parts[4] == "report":
+            self._require(method, "GET")
+            self._check_token(headers)
+            html = await self.report(unquote(parts[3]))
+            return 200, "text/html; charset=utf-8", html.encode("utf-8")
+
+        raise HTTPError(404, f"없는 경로입니다: {path}")
+
+    @staticmethod
+    def _require(method: str, expected: str) -> None:
+        if method != expected:
+            raise HTTPError(405, f"{expected} 요청만 지원합니다")
+
+    # ---------- 연결 처리 ----------
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEPALIVE_TIMEOUT)
+                except HTTPError as e:
+                    await _write_response(writer, *_json(e.status, {"error": e.message}), keep_alive=False)
+                    return
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                if request is None:
+                    return
+                method, target, version, headers, body = request
+                keep_alive = _keep_alive(version, headers)
+                try:
+                    response = await self.dispatch(method, target, headers, body)
+                except HTTPError as e:
+                    response = _json(e.status, {"error": e.message})
+                except Exception:  # 처리 중 오류는 연결을 유지한 채 500으로 응답 (상세 내용은 서버 로그에만)
+                    logger.exception("요청 처리 중 오류: %s %s", method, target)
+                    response = _json(500, {"error": "서버 내부 오류가 발생했습니다"})
+                await _write_response(writer, *response, keep_alive=keep_alive)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _json(status: int, payload) -> Tuple[int, str, bytes]:
+    return status, "application/json; charset=utf-8", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """요청 하나 읽기 → (method, target, version, headers, body), 연결이 끝났으면 None"""
+    try:
+        line = await reader.readline()
+    except ValueError:
+        raise HTTPError(431, "요청 줄이 너무 깁니다") from None
+    if not line:
+        return None
+    try:
+        # 퍼센트 인코딩 없이 UTF-8 그대로 보낸 경로/쿼리도 허용
+        method, target, version = line.decode("utf-8", "replace").rstrip("\r\n").split(" ")
+    except ValueError:
+        raise HTTPError(400, "잘못된 요청 줄입니다") from None
+
+    headers = {}
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(431, "헤더가 너무 깁니다") from None
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(431, "헤더가 너무 많습니다")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HTTPError(411, "Content-Length가 필요합니다")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(400, "Content-Length가 올바르지 않습니다") from None
+    if length < 0:
+        raise HTTPError(400, "Content-Length가 올바르지 않습니다")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"요청 본문은 {MAX_BODY_BYTES} 바이트 이하여야 합니다")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, version, headers, body
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, content_type: str,
+                          body: bytes, keep_alive: bool) -> None:
+    writer.write(
+        (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1") + body
+    )
+    await writer.drain()
+
+
+async def serve(api: AssessmentAPI, host: str, port: int,
+                ready: Optional[asyncio.Event] = None) -> None:
+    """서버 실행 (취소될 때까지)"""
+    api.saver.start()
+    server = await asyncio.start_server(
+        api.handle_connection, host, port, limit=MAX_HEADER_BYTES, backlog=LISTEN_BACKLOG
+    )
+    try:
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+    finally:
+        await api.saver.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="AI 역량 진단 JSON HTTP API 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="포트 (기본: 8080)")
+    parser.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+    parser.add_argument("--results-dir", default="results",
+                        help="리포트 캐시/결과표 디렉토리 위치 (기본: results)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    api = AssessmentAPI(
+        open_result_store(args.store, args.backend),
+        report_cache=open_report_cache(os.path.join(args.results_dir, "report_cache")),
+        outcome_table=open_outcome_table(os.path.join(args.results_dir, "outcomes")),
+        token=os.environ.get(TOKEN_ENV) or None
+    )
+    print(f"✅ http://{args.host}:{args.port} 에서 대기 중 (종료: Ctrl+C)")
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 응답 파일 일괄 채점
+
+종이 설문이나 LMS에서 모은 응답 파일(JSONL/CSV)을 한 줄씩 읽어 채점하고
+결과 저장소에 기록합니다.
+
+- 입력은 chunk_size 줄씩 묶어 calculate_scores_batch로 채점하고, 처리 중인
+  묶음 수를 제한하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+- --workers 2 이상이면 파싱/채점/분석을 프로세스 풀에서 나눠 처리하고,
+  저장은 현재 프로세스에서 묶음 단위(save_many)로 수행합니다.
+- 형식에 맞지 않는 줄은 건너뛰고 줄 번호와 사유를 보고합니다.
+- --outcomes로 결과표 디렉토리(앱은 results/outcomes)를 주면 분석 생성의
+  판단 부분을 결과표 조회로 대신합니다 (outcome_table.py).
+
+입력 형식 (문항 값은 1~5, 비어 있으면 미응답):
+    JSONL  {"name": ..., "department": ..., "position": ..., "Q1": 4, ...}
+           또는 {"user_info": {...}, "responses": {"Q1": 4, ...}}
+    CSV    머리글: name(이름), department(부서), position(직위), Q1 ... Q15
+    두 형식 모두 timestamp(진단일시)가 있으면 진단 일시로 사용합니다.
+    진단일시는 ISO 8601 형식(예: 2024-03-05T10:00:00)이어야 하며, 시간대가
+    있으면 앱과 같은 로컬 시각으로 바꿔 저장합니다.
+
+사용법:
+    python batch_score.py responses.jsonl [more.csv ...] [--workers 4] [--no-analysis]
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment
+from outcome_table import open_outcome_table
+from result_store import ResultRepository, open_result_store
+
+# 사용자 정보 필드 → 입력에서 허용하는 열 이름
+USER_FIELDS = {
+    "name": ("name", "이름"),
+    "department": ("department", "부서"),
+    "position": ("position", "직위"),
+}
+TIMESTAMP_FIELDS = ("timestamp", "진단일시")
+MAX_REPORTED_ERRORS = 10
+
+# (출처, 줄 번호, 행 dict 또는 JSON 문자열)
+Row = Tuple[str, int, object]
+# (user_info, scores, analysis, responses)
+Item = Tuple[Dict, Dict, Optional[Dict], Dict[str, int]]
+
+
+def _first(row: Dict, names: Iterable[str], default=None):
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            return value
+    return default
+
+
+def parse_timestamp(value) -> str:
+    """
+    입력 진단일시 → 저장 형식 (로컬 시각 ISO 8601 문자열)
+
+    Raises:
+        ValueError: ISO 8601 형식이 아닐 때
+    """
+    try:
+        parsed = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError(f"진단일시는 ISO 8601 형식이어야 합니다: {value!r}") from None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def parse_response(q_id: str, value) -> int:
+    """
+    입력 응답 값 → 정수 (JSON 정수, 정수로 떨어지는 실수, 정수 문자열만 허용)
+
+    Raises:
+        ValueError: 정수가 아니거나(참/거짓, 4.7, "4.7" 등) 1~5가 아닐 때
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"{q_id} 응답이 숫자가 아닙니다: {value!r}")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{q_id} 응답은 정수여야 합니다: {value!r}")
+        value = int(value)
+    elif isinstance(value, str):
+        try:
+            value = int(value.strip())
+        except ValueError:
+            raise ValueError(f"{q_id} 응답은 정수여야 합니다: {value!r}") from None
+    elif not isinstance(value, int):
+        raise ValueError(f"{q_id} 응답이 숫자가 아닙니다: {value!r}")
+    if value not in SCHEMA.likert_scale:
+        raise ValueError(f"{q_id} 응답은 1~5 사이여야 합니다: {value}")
+    return value
+
+
+def parse_row(row: Dict) -> Tuple[Dict, Dict[str, int], Optional[str]]:
+    """
+    입력 행 → (user_info, responses, timestamp)
+
+    Raises:
+        ValueError: 이름이 없거나 응답 값이 1~5 사이의 정수가 아니거나 진단일시 형식이 맞지 않을 때
+    """
+    user_info = row.get("user_info")
+    if not isinstance(user_info, dict):
+        user_info = {field: str(_first(row, names, "")).strip() for field, names in USER_FIELDS.items()}
+    if not user_info.get("name"):
+        raise ValueError("이름이 없습니다")
+
+    source = row.get("responses")
+    if not isinstance(source, dict):
+        source = row
+    responses = {}
+    for q_id in SCHEMA.question_ids:
+        value = source.get(q_id)
+        if value in (None, ""):
+            continue
+        responses[q_id] = parse_response(q_id, value)
+
+    timestamp = _first(row, TIMESTAMP_FIELDS)
+    if timestamp is not None:
+        timestamp = parse_timestamp(timestamp)
+    return user_info, responses, timestamp
+
+
+def iter_rows(path: str, fmt: Optional[str] = None) -> Iterator[Row]:
+    """응답 파일을 한 줄씩 읽기 ('-'는 표준 입력, 형식은 확장자로 판단)"""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+    else:
+        stream = open(path, "r", encoding="utf-8-sig", newline="")
+    with stream:
+        if fmt == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                row.pop(None, None)  # 머리글보다 많은 열
+                yield path, reader.line_num, row
+        else:
+            for line_number, line in enumerate(stream, 1):
+                if line.strip():
+                    yield path, line_number, line
+
+
+def score_chunk(
+    rows: List[Row],
+    with_analysis: bool = True,
+    outcomes_dir: Optional[str] = None
+) -> Tuple[List[Item], List[Tuple[str, int, str]]]:
+    """
+    입력 행 묶음 채점 (outcomes_dir의 결과표는 프로세스마다 한 번만 불러옴)
+
+    Returns:
+        (저장할 항목 목록, (출처, 줄 번호, 오류) 목록)
+    """
+    parsed = []
+    errors = []
+    for source, line_number, row in rows:
+        try:
+            if isinstance(row, str):
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValueError("JSON 객체가 아닙니다")
+            parsed.append(parse_row(row))
+        except ValueError as e:
+            errors.append((source, line_number, str(e)))
+
+    items: List[Item] = []
+    if not parsed:
+        return items, errors
+    outcome_table = open_outcome_table(outcomes_dir) if with_analysis and outcomes_dir else None
+    assessment = AISkillAssessment(outcome_table=outcome_table)
+    matrix = np.array(
+        [[responses.get(q_id, 0) for q_id in SCHEMA.question_ids] for _, responses, _ in parsed],
+        dtype=np.uint8
+    )
+    batch = assessment.calculate_scores_batch(matrix)
+    now = datetime.now().isoformat()
+    for (user_info, responses, timestamp), scores in zip(parsed, assessment.iter_batch_scores(batch, now)):
+        if timestamp:
+            scores["timestamp"] = timestamp
+        analysis = assessment.generate_analysis(scores) if with_analysis else None
+        items.append((user_info, scores, analysis, responses))
+    return items, errors
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_files(
+    paths: List[str],
+    store: Optional[ResultRepository] = None,
+    fmt: Optional[str] = None,
+    workers: int = 1,
+    chunk_size: int = 1000,
+    with_analysis: bool = True,
+    outcomes_dir: Optional[str] = None
+) -> Dict:
+    """
+    응답 파일들을 채점해 저장소에 기록 (store가 None이면 채점만)
+
+    Returns:
+        {"rows", "saved", "errors"(앞쪽 일부), "error_count", "elapsed", "rows_per_second"}
+    """
+    start = time.perf_counter()
+    counts = {"rows": 0, "saved": 0, "error_count": 0}
+    reported: List[Tuple[str, int, str]] = []
+
+    def rows() -> Iterator[Row]:
+        for path in paths:
+            yield from iter_rows(path, fmt)
+
+    def chunk_done(result: Tuple[List[Item], List[Tuple[str, int, str]]]) -> None:
+        items, errors = result
+        counts["rows"] += len(items) + len(errors)
+        counts["error_count"] += len(errors)
+        reported.extend(errors[:MAX_REPORTED_ERRORS - len(reported)])
+        if store is not None and items:
+            store.save_many(items)
+            counts["saved"] += len(items)
+
+    chunks = _chunks(rows(), chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            chunk_done(score_chunk(chunk, with_analysis, outcomes_dir))
+    else:
+        # 처리 중인 묶음 수를 제한해 입력을 한꺼번에 메모리에 올리지 않음
+        max_in_flight = workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = set()
+            for chunk in chunks:
+                in_flight.add(pool.submit(score_chunk, chunk, with_analysis, outcomes_dir))
+                if len(in_flight) >= max_in_flight:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        chunk_done(future.result())
+            for future in in_flight:
+                chunk_done(future.result())
+
+    elapsed = time.perf_counter() - start
+    return dict(
+        counts,
+        errors=reported,
+        elapsed=elapsed,
+        rows_per_second=counts["rows"] / elapsed if elapsed > 0 else 0.0
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="응답 파일(JSONL/CSV)을 일괄 채점해 결과 저장소에 기록")
+    parser.add_argument("inputs", nargs="+", help="응답 파일 경로 ('-'는 표준 입력)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="입력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--workers", type=int, default=1, help="채점 프로세스 수 (기본: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 채점/저장할 줄 수")
+    parser.add_argument("--no-analysis", action="store_true",
+                        help="분석을 생성하지 않음 (리포트를 만들 때 다시 생성)")
+    parser.add_argument("--outcomes", help="분석에 사용할 결과표 디렉토리 (예: results/outcomes)")
+    parser.add_argument("--dry-run", action="store_true", help="채점만 하고 저장하지 않음")
+    parser.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+    args = parser.parse_args(argv)
+
+    store = None if args.dry_run else open_result_store(args.store, args.backend, shared=False)
+    summary = score_files(
+        args.inputs, store, fmt=args.format, workers=max(1, args.workers),
+        chunk_size=args.chunk_size, with_analysis=not args.no_analysis, outcomes_dir=args.outcomes
+    )
+
+    for source, line_number, error in summary["errors"]:
+        print(f"⚠️ {source}:{line_number}: {error}", file=sys.stderr)
+    if summary["error_count"] > len(summary["errors"]):
+        print(f"⚠️ ... 외 {summary['error_count'] - len(summary['errors'])}건", file=sys.stderr)
+    print(f"✅ {summary['rows']}줄 처리, {summary['saved']}건 저장, 오류 {summary['error_count']}건 "
+          f"({summary['elapsed']:.2f}초, {summary['rows_per_second']:,.0f}줄/초)")
+
+
+if __name__ == "__main__":
+    main()
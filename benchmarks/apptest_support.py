@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+AppTest(streamlit.testing) 기반 벤치마크 공통 보정
+
+AppTest(1.29)는 format_func가 있는 라디오의 선택 위치를 표시 문자열로 찾다가
+실패하므로(진단 문항 라디오가 해당), import하면 값(1~5)에서 바로 계산하도록
+바꿉니다.
+"""
+
+from streamlit.testing.v1 import element_tree
+
+
+def _radio_index(self):
+    try:
+        value = self.value
+    except KeyError:
+        return None
+    return value - 1 if isinstance(value, int) else None
+
+
+element_tree.Radio.index = property(_radio_index)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진단 1건당 처리 비용 벤치마크 (점수 계산 + 분석 생성)
+
+분석 캐시를 끈 경우와 켠 경우의 제출 1건당 소요 시간과 캐시 적중률을
+응답 분포별로 비교합니다.
+
+- uniform: 모든 문항을 1~5에서 균등하게 선택 (가능한 조합이 가장 많은 최악의 경우)
+- realistic: 응답자별 역량 수준 주변으로 응답이 몰리는 분포
+
+사용법:
+    python benchmarks/bench_analysis.py [--submissions 20000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ai_skill_assessment  # noqa: E402
+from ai_skill_assessment import (  # noqa: E402
+    SCHEMA, AISkillAssessment, analysis_cache_info, clear_analysis_cache
+)
+
+
+def uniform_responses(count: int, seed: int):
+    rng = random.Random(seed)
+    return [{q_id: rng.randint(1, 5) for q_id in SCHEMA.question_ids} for _ in range(count)]
+
+
+def realistic_responses(count: int, seed: int):
+    rng = random.Random(seed)
+    population = []
+    for _ in range(count):
+        ability = rng.gauss(3.0, 0.8)
+        population.append({
+            q_id: min(5, max(1, round(rng.gauss(ability, 0.6))))
+            for q_id in SCHEMA.question_ids
+        })
+    return population
+
+
+def measure(population, cache_size: int):
+    """제출 1건당 (전체, 분석 생성) 소요 시간 (마이크로초) 목록과 캐시 통계"""
+    ai_skill_assessment.ANALYSIS_CACHE_SIZE = cache_size
+    clear_analysis_cache()
+    totals = []
+    analyses = []
+    for responses in population:
+        start = time.perf_counter()
+        assessment = AISkillAssessment()
+        scores = assessment.calculate_scores(responses)
+        middle = time.perf_counter()
+        assessment.generate_analysis(scores)
+        end = time.perf_counter()
+        totals.append((end - start) * 1e6)
+        analyses.append((end - middle) * 1e6)
+    return totals, analyses, analysis_cache_info()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="진단 1건당 처리 비용 벤치마크")
+    parser.add_argument("--submissions", type=int, default=20000, help="제출 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (분석 시간이 가장 짧은 회차 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    default_size = ai_skill_assessment.ANALYSIS_CACHE_SIZE
+    configs = [("끔", 0), ("켬", default_size)]
+    print(f"{'분포':<12}{'캐시':<8}{'분석 평균(µs)':>16}{'분석 p95(µs)':>16}"
+          f"{'제출 평균(µs)':>16}{'적중률':>10}")
+    for label, make in [("uniform", uniform_responses), ("realistic", realistic_responses)]:
+        population = make(args.submissions, args.seed)
+        # 측정 환경 변화의 영향을 줄이기 위해 캐시 설정을 번갈아 측정
+        runs = {size: [] for _, size in configs}
+        for _ in range(args.repeat):
+            for _, size in configs:
+                runs[size].append(measure(population, size))
+        for cache_label, size in configs:
+            totals, analyses, info = min(runs[size], key=lambda run: sum(run[1]))
+            lookups = info["hits"] + info["misses"]
+            print(
+                f"{label:<12}{cache_label:<8}{statistics.mean(analyses):>16.1f}"
+                f"{sorted(analyses)[int(len(analyses) * 0.95)]:>16.1f}"
+                f"{statistics.mean(totals):>16.1f}"
+                f"{info['hits'] / lookups * 100 if lookups else 0:>9.1f}%"
+            )
+    ai_skill_assessment.ANALYSIS_CACHE_SIZE = default_size
+
+
+if __name__ == "__main__":
+    main()
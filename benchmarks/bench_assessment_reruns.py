@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진단 1건 완료까지의 Streamlit 스크립트 재실행 횟수와 서버 CPU 벤치마크
+
+streamlit.testing(AppTest)으로 응답자가 진단 페이지에 들어와 기본 정보 3개를
+입력하고, 15문항에 답한 뒤 제출해 결과 페이지를 보기까지를 재현합니다.
+브라우저와 같은 조건이 되도록 폼(st.form) 밖의 위젯은 값을 바꿀 때마다
+스크립트를 다시 실행하고, 폼 안의 위젯은 제출할 때만 실행합니다.
+
+재실행 횟수와 스크립트 실행 시간은 앱의 page_* 계측 타이머(metrics.py)로
+세고, 서버 CPU는 AppTest 자체 처리를 포함한 프로세스 CPU 시간입니다.
+--app으로 다른 버전의 streamlit_app.py를 지정해 비교할 수 있습니다.
+
+사용법:
+    python benchmarks/bench_assessment_reruns.py [--respondents 20] [--app path/to/streamlit_app.py]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import apptest_support  # noqa: E402,F401
+import metrics  # noqa: E402
+from population import generate_population  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def complete_assessment(app_path: str, user_info, responses) -> Tuple[AppTest, int]:
+    """진단 1건 완료 (결과 페이지의 AppTest와 값을 바꿔 다시 실행한 횟수 반환)"""
+    at = AppTest.from_file(app_path, default_timeout=60)
+    at.session_state.page = "assessment"
+    at.run()
+    interactions = 0
+
+    def changed(widget) -> None:
+        nonlocal interactions
+        if not widget.form_id:
+            at.run()
+            interactions += 1
+
+    # 폼 밖 위젯이면 값을 바꿀 때마다 화면을 새로 그리므로 위젯을 매번 다시 찾음
+    for i, value in enumerate((user_info["name"], user_info["department"], user_info["position"])):
+        widget = at.text_input[i]
+        widget.input(value)
+        changed(widget)
+    for q_id, value in responses.items():
+        radio = next(r for r in at.radio if r.key == q_id)
+        radio.set_value(value)
+        changed(radio)
+
+    submit = next(b for b in at.button if "진단 완료" in b.label)
+    submit.click().run()
+    if at.exception or at.session_state.page != "result":
+        raise RuntimeError(f"진단 제출에 실패했습니다: {at.exception}")
+    return at, interactions
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="진단 1건당 Streamlit 재실행 횟수와 CPU 벤치마크")
+    parser.add_argument("--respondents", type=int, default=20, help="진단을 완료할 응답자 수")
+    parser.add_argument("--app", default=os.path.join(ROOT, "streamlit_app.py"), help="측정할 앱 스크립트")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    app_path = os.path.abspath(args.app)
+    population = generate_population(args.respondents, args.seed)
+    directory = tempfile.mkdtemp(prefix="bench_reruns_")
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        # 첫 실행의 모듈 import/저장소 생성 비용은 측정에서 제외
+        complete_assessment(app_path, *population.respondent(0)[:2])
+        metrics.enable()
+        metrics.reset()
+        cpu = []
+        interactions = []
+        for user_info, responses, _ in population.iter_respondents():
+            start = time.process_time()
+            interactions.append(complete_assessment(app_path, user_info, responses)[1])
+            cpu.append(time.process_time() - start)
+        snapshot = metrics.snapshot()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    count = args.respondents
+    pages = {stage: values for stage, values in snapshot["stages"].items() if stage.startswith("page_")}
+    runs = sum(values["count"] for values in pages.values())
+    script_ms = sum(values["total_ms"] for values in pages.values())
+    print(f"앱: {os.path.relpath(app_path, cwd)}, 응답자 {count}명")
+    print(f"진단 1건당 스크립트 실행 {runs / count:.1f}회 (값 변경으로 인한 재실행 {statistics.mean(interactions):.1f}회)")
+    for stage, values in pages.items():
+        print(f"  {stage}: {values['count'] / count:.1f}회, 평균 {values['mean_ms']:.1f}ms, p95 {values['p95_ms']:.1f}ms")
+    print(f"진단 1건당 스크립트 실행 시간 {script_ms / count:.0f}ms")
+    print(f"진단 1건당 프로세스 CPU {statistics.mean(cpu) * 1000:.0f}ms (AppTest 처리 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 리포트 생성 벤치마크
+
+작업 트리의 generate_html_report.py와 git 리비전(--rev)의 같은 파일을 불러와
+리포트당 소요 시간과 메모리 할당량을 비교하고, 두 구현의 출력이 동일한지
+(HTML 이스케이프 차이는 제외) 확인합니다. 비교 대상은
+`git show <rev>:generate_html_report.py`로 읽으므로 저장소가 git 작업 트리여야
+합니다.
+
+기본 비교 대상은 사전 컴파일 템플릿 구현(baeb30f)이며, 문자열 이어붙이기
+방식의 최초 구현과 비교하려면 --rev 3978047을 주면 됩니다.
+
+사용법:
+    python benchmarks/bench_html_report.py [--rev baeb30f] [--reports 10000] [--alloc-sample 1000] [--repeat 3]
+"""
+
+import argparse
+import html
+import importlib.util
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ai_skill_assessment import AISkillAssessment, SCHEMA  # noqa: E402
+from generate_html_report import generate_html_report  # noqa: E402
+
+# 사전 컴파일 템플릿으로 바꿨던 리비전 (이후 문자열 이어붙이기 방식으로 되돌림)
+TEMPLATE_REVISION = "baeb30f"
+
+
+def load_revision(rev: str):
+    """git 리비전의 generate_html_report 함수 불러오기"""
+    source = subprocess.run(
+        ["git", "show", f"{rev}:generate_html_report.py"],
+        cwd=ROOT, check=True, capture_output=True
+    ).stdout
+    directory = tempfile.mkdtemp(prefix="bench_html_report_")
+    path = os.path.join(directory, "generate_html_report.py")
+    with open(path, "wb") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("generate_html_report_rev", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.generate_html_report
+
+
+def make_inputs(count: int, seed: int = 42):
+    """무작위 응답으로 (user_info, scores, analysis) 입력 생성"""
+    rng = random.Random(seed)
+    assessment = AISkillAssessment()
+    inputs = []
+    for i in range(count):
+        responses = {q_id: rng.randint(1, 5) for q_id in SCHEMA.question_ids}
+        scores = assessment.calculate_scores(responses)
+        analysis = assessment.generate_analysis(scores)
+        # 초기 버전은 강점/약점의 percentage 키와 문자열 학습 자료만 처리하므로 그 형식으로 맞춤
+        for item in analysis["strengths"] + analysis["weaknesses"]:
+            item.setdefault("percentage", item["score"])
+        for path in analysis["learning_path"]:
+            path["resources"] = [f"{r['type']}: {r['title']}" for r in path["resources"]]
+        user_info = {"name": f"응답자{i}", "department": f"부서{i % 20}", "position": "주무관"}
+        inputs.append((user_info, scores, analysis))
+    return inputs
+
+
+def measure_latency(render, inputs):
+    """리포트당 소요 시간 (마이크로초) 목록"""
+    timings = []
+    for user_info, scores, analysis in inputs:
+        start = time.perf_counter()
+        render(user_info, scores, analysis)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def measure_allocations(render, inputs):
+    """리포트당 최대 할당 바이트 목록 (tracemalloc)"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for user_info, scores, analysis in inputs:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            html = render(user_info, scores, analysis)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+            del html
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 리포트 생성 벤치마크")
+    parser.add_argument("--rev", default=TEMPLATE_REVISION,
+                        help=f"비교할 git 리비전 (기본: 템플릿 구현 {TEMPLATE_REVISION}, 최초 구현은 3978047)")
+    parser.add_argument("--reports", type=int, default=10000, help="시간 측정 리포트 수")
+    parser.add_argument("--alloc-sample", type=int, default=1000, help="메모리 측정 리포트 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (총 시간이 가장 짧은 회차 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    revision_generate_html_report = load_revision(args.rev)
+    inputs = make_inputs(args.reports, args.seed)
+
+    # 이스케이프 전 리비전과도 비교할 수 있도록 엔티티를 풀어서 비교
+    mismatches = sum(
+        1 for user_info, scores, analysis in inputs[:args.alloc_sample]
+        if html.unescape(generate_html_report(user_info, scores, analysis))
+        != html.unescape(revision_generate_html_report(user_info, scores, analysis))
+    )
+    print(f"출력 동일성 (이스케이프 차이 제외): {args.alloc_sample - mismatches}/{args.alloc_sample} 일치")
+
+    print(f"\n{'구현':<12}{'평균(µs)':>12}{'p50(µs)':>12}{'p95(µs)':>12}{'총(s)':>10}{'할당(KB)':>12}")
+    for label, render in [(args.rev, revision_generate_html_report), ("작업 트리", generate_html_report)]:
+        measure_latency(render, inputs[:200])  # 워밍업
+        timings = min(
+            (measure_latency(render, inputs) for _ in range(args.repeat)),
+            key=sum
+        )
+        peaks = measure_allocations(render, inputs[:args.alloc_sample])
+        print(
+            f"{label:<12}{statistics.mean(timings):>12.1f}{percentile(timings, 50):>12.1f}"
+            f"{percentile(timings, 95):>12.1f}{sum(timings) / 1e6:>10.2f}"
+            f"{statistics.mean(peaks) / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결과 레코드 메모리 벤치마크
+
+결과 N건(기본 10만)을 메모리에 올렸을 때의 사용량을 비교합니다 (tracemalloc).
+
+- 관리자 목록 인덱스: JSON에서 읽은 요약 dict ↔ IndexEntry (__slots__)
+- 전체 결과: 저장 형식 dict(user_info/scores/analysis) ↔ CompactResult
+
+dict 쪽은 저장소가 실제로 하는 것처럼 JSON 문자열을 json.loads로 읽어
+만들므로, 결과마다 문자열이 따로 생기는 상황이 그대로 반영됩니다.
+
+사용법:
+    python benchmarks/bench_record_memory.py [--results 100000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment  # noqa: E402
+from records import CompactResult, IndexEntry  # noqa: E402
+from result_store import new_result_id, summarize  # noqa: E402
+
+
+def make_lines(count: int, seed: int = 42):
+    """저장소 로그/인덱스와 같은 형식의 JSON 줄 생성"""
+    rng = random.Random(seed)
+    assessment = AISkillAssessment()
+    departments = [f"부서{i:02d}" for i in range(40)]
+    positions = ["주무관", "사무관", "서기관", "과장"]
+    record_lines = []
+    index_lines = []
+    offset = 0
+    for i in range(count):
+        responses = {q_id: rng.randint(1, 5) for q_id in SCHEMA.question_ids}
+        scores = assessment.calculate_scores(responses)
+        result_id = new_result_id()
+        record = {
+            "id": result_id,
+            "user_info": {
+                "name": f"응답자{i}",
+                "department": rng.choice(departments),
+                "position": rng.choice(positions)
+            },
+            "scores": scores,
+            "analysis": assessment.generate_analysis(scores)
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        record_lines.append(line)
+        entry = summarize(result_id, record)
+        entry["offset"] = offset
+        entry["length"] = len(line.encode("utf-8")) + 1
+        offset += entry["length"]
+        index_lines.append(json.dumps(entry, ensure_ascii=False))
+    return record_lines, index_lines
+
+
+def measure(build, lines):
+    """lines로 객체 목록을 만들 때 남는 메모리 (bytes)와 소요 시간"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = build(lines)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결과 레코드 메모리 벤치마크")
+    parser.add_argument("--results", type=int, default=100000, help="결과 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    record_lines, index_lines = make_lines(args.results, args.seed)
+    cases = [
+        ("인덱스", "dict", index_lines, lambda lines: {
+            entry["id"]: entry for entry in map(json.loads, lines)
+        }),
+        ("인덱스", "IndexEntry", index_lines, lambda lines: {
+            entry.id: entry for entry in (IndexEntry.from_dict(json.loads(line)) for line in lines)
+        }),
+        ("전체 결과", "dict", record_lines, lambda lines: [json.loads(line) for line in lines]),
+        ("전체 결과", "CompactResult", record_lines, lambda lines: [
+            CompactResult.from_record(json.loads(line)) for line in lines
+        ]),
+    ]
+
+    print(f"결과 {args.results:,}건")
+    print(f"{'대상':<10}{'형식':<16}{'메모리(MB)':>12}{'건당(B)':>10}{'비율':>8}{'생성(s)':>10}")
+    baseline = {}
+    for target, label, lines, build in cases:
+        used, elapsed = measure(build, lines)
+        baseline.setdefault(target, used)
+        print(
+            f"{target:<10}{label:<16}{used / 1e6:>12.1f}{used / args.results:>10.0f}"
+            f"{used / baseline[target]:>8.2f}{elapsed:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
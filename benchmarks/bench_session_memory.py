@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결과 페이지에 머무는 세션당 메모리 벤치마크
+
+streamlit.testing(AppTest)으로 응답자 N명이 진단을 마치고 결과 페이지에
+머무는 상태를 만든 뒤 다음을 측정합니다.
+
+- 세션 상태(st.session_state) 크기: 세션들이 가리키는 객체를 한 번씩만 세어
+  (여러 세션이 공유하는 객체는 중복으로 세지 않음) 세션 수로 나눈 값
+- 프로세스 메모리 증가: tracemalloc 기준 세션 N개를 유지할 때 늘어난 양
+  (AppTest가 보관하는 화면 요소 트리 포함)
+- 결과 저장소의 공유 결과 캐시 크기 (세션 수와 관계없이 항목 수 상한이 있음)
+
+--app으로 다른 버전의 streamlit_app.py를 지정해 비교할 수 있습니다.
+
+사용법:
+    python benchmarks/bench_session_memory.py [--sessions 50] [--app path/to/streamlit_app.py]
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_assessment_reruns import complete_assessment  # noqa: E402
+from population import generate_population  # noqa: E402
+from result_store import open_result_store  # noqa: E402
+
+
+def deep_size(obj, seen: set) -> int:
+    """obj가 가리키는 객체 전체 크기 (seen에 있는 객체는 제외하고 추가)"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key, seen) + deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="결과 페이지 세션당 메모리 벤치마크")
+    parser.add_argument("--sessions", type=int, default=50, help="동시에 유지할 세션 수")
+    parser.add_argument("--app", default=os.path.join(ROOT, "streamlit_app.py"), help="측정할 앱 스크립트")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    app_path = os.path.abspath(args.app)
+    population = generate_population(args.sessions + 1, args.seed)
+    directory = tempfile.mkdtemp(prefix="bench_session_memory_")
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        # 모듈 import, 공유 자원 생성은 측정에서 제외
+        complete_assessment(app_path, *population.respondent(args.sessions)[:2])
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        sessions = [
+            complete_assessment(app_path, user_info, responses)[0]
+            for user_info, responses, _ in population.iter_respondents(stop=args.sessions)
+        ]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        seen: set = set()
+        states = [dict(at.session_state.filtered_state) for at in sessions]
+        seen.update(id(state) for state in states)
+        state_bytes = sum(
+            deep_size(key, seen) + deep_size(value, seen)
+            for state in states for key, value in state.items()
+        )
+        keys = sorted(states[0])
+        store = open_result_store()
+        records = getattr(store, "_records", {})
+        cache_bytes = deep_size(records, set())
+        cache_size = getattr(store, "record_cache_size", 0)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    count = args.sessions
+    print(f"앱: {os.path.relpath(app_path)}, 결과 페이지 세션 {count}개")
+    print(f"세션 상태 키: {', '.join(keys)}")
+    print(f"세션당 세션 상태 {state_bytes / count:,.0f} B")
+    print(f"세션당 프로세스 메모리 증가 {(after - before) / count / 1024:,.1f} KiB (AppTest 화면 요소 포함), "
+          f"공유 결과 캐시 제외 시 {(after - before - cache_bytes) / count / 1024:,.1f} KiB")
+    print(f"공유 결과 캐시 {len(records)}건, {cache_bytes / 1024:,.0f} KiB (상한 {cache_size}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streamlit 앱 콜드 스타트와 재실행당 고정 비용 벤치마크
+
+새 인터프리터에서 AppTest로 첫 화면을 처음 실행할 때의 비용(앱 모듈 import,
+저장소/결과표 등 공유 자원 생성 포함)과, 이어지는 재실행의 고정 비용을
+앱의 계측 타이머(metrics.py의 script_setup, startup_*, page_*)로 측정합니다.
+streamlit 자체의 import는 서버가 이미 해 둔 상태이므로 제외합니다.
+
+- 측정마다 하위 프로세스를 새로 띄우며, --repeat회 측정의 중앙값을 출력
+- --results건을 미리 저장한 임시 저장소에서 실행 (인덱스 읽기 비용 포함)
+- 리포트 모듈(generate_html_report)이 리포트를 받기 전에 이미 import됐는지 표시
+- --app으로 다른 버전의 streamlit_app.py를 지정해 비교할 수 있음
+
+사용법:
+    python benchmarks/bench_startup.py [--results 10000] [--reruns 30] [--repeat 5] [--app path]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+LAZY_MODULES = ("generate_html_report", "report_cache", "report_export")
+
+
+def child(app_path: str, reruns: int) -> None:
+    """하위 프로세스: 측정값을 JSON 한 줄로 출력"""
+    import apptest_support  # noqa: F401
+    import metrics
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest는 스크립트 스레드를 대기하며 sleep으로 폴링하므로 벽시계 시간 대신
+    # 앱 안의 계측 타이머(script_setup, page_*) 측정값을 그대로 모음
+    samples = {}
+    metrics.add_sink(lambda stage, seconds: samples.setdefault(stage, []).append(seconds * 1000))
+    metrics.enable()
+
+    at = AppTest.from_file(app_path, default_timeout=120)
+    cpu = time.process_time()
+    at.run()
+    cold_cpu = time.process_time() - cpu
+    if at.exception:
+        raise RuntimeError(at.exception)
+    cold = {stage: values[0] for stage, values in samples.items()}
+    samples.clear()
+
+    for page in ("home", "assessment"):
+        at.session_state.page = page
+        for _ in range(reruns + 1):
+            at.run()
+    print(json.dumps({
+        "cold_cpu_ms": cold_cpu * 1000,
+        "cold": cold,
+        "rerun": {stage: statistics.median(values[1:] or values) for stage, values in samples.items()},
+        "loaded": [name for name in LAZY_MODULES if name in sys.modules],
+    }))
+
+
+def populate(directory: str, count: int, seed: int) -> None:
+    from ai_skill_assessment import AISkillAssessment
+    from population import generate_population
+    from result_store import LogResultStore
+
+    if not count:
+        return
+    population = generate_population(count, seed)
+    assessment = AISkillAssessment()
+    store = LogResultStore(os.path.join(directory, "results"))
+    batch = assessment.calculate_scores_batch(population.responses)
+    items = []
+    for i, scores in enumerate(assessment.iter_batch_scores(batch)):
+        user_info, responses, timestamp = population.respondent(i)
+        scores["timestamp"] = timestamp
+        items.append((user_info, scores, assessment.generate_analysis(scores), responses))
+    store.save_many(items)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Streamlit 앱 콜드 스타트/재실행 비용 벤치마크")
+    parser.add_argument("--app", default=os.path.join(ROOT, "streamlit_app.py"), help="측정할 앱 스크립트")
+    parser.add_argument("--results", type=int, default=10000, help="미리 저장해 둘 결과 수")
+    parser.add_argument("--reruns", type=int, default=30, help="페이지별 재실행 측정 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="콜드 스타트 측정 횟수 (프로세스 수)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    app_path = os.path.abspath(args.app)
+    if args.child:
+        child(app_path, args.reruns)
+        return
+
+    directory = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        populate(directory, args.results, args.seed)
+        runs = []
+        for _ in range(args.repeat):
+            # 리포트 캐시 등 디스크에 남는 상태를 지워 매번 같은 조건에서 시작
+            shutil.rmtree(os.path.join(directory, "results", "report_cache"), ignore_errors=True)
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", "--app", app_path,
+                 "--reruns", str(args.reruns)],
+                cwd=directory, check=True, capture_output=True, text=True,
+                env=dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, BENCH_DIR]))
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def median(part: str, stage: str) -> float:
+        values = [run[part][stage] for run in runs if stage in run[part]]
+        return statistics.median(values) if values else float("nan")
+
+    print(f"앱: {os.path.relpath(app_path)}, 저장된 결과 {args.results:,}건, 측정 {args.repeat}회 중앙값")
+    print(f"첫 실행: 페이지 전 준비 {median('cold', 'script_setup'):.1f}ms (모듈 import, 공유 자원 생성 포함), "
+          f"홈 {median('cold', 'page_home'):.1f}ms, 프로세스 CPU {statistics.median(run['cold_cpu_ms'] for run in runs):.0f}ms")
+    startup = sorted({stage for run in runs for stage in run["cold"] if stage.startswith("startup_")})
+    if startup:
+        print("  공유 자원 생성: " + ", ".join(f"{stage} {median('cold', stage):.1f}ms" for stage in startup))
+    print(f"재실행: 페이지 전 준비 {median('rerun', 'script_setup'):.2f}ms, "
+          f"홈 {median('rerun', 'page_home'):.2f}ms, 진단 페이지 {median('rerun', 'page_assessment'):.2f}ms")
+    loaded = runs[-1]["loaded"]
+    print(f"리포트 요청 전 import된 리포트 모듈: {', '.join(loaded) if loaded else '없음'}")
+
+if __name__ == "__main__":
+    main()
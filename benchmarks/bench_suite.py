@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+규모별 처리 단계 벤치마크 (기준값 비교로 성능 저하 감지)
+
+population.py의 가상 응답자 집단(1k/10k/100k/1m)으로 앱의 주요 단계를
+측정합니다.
+
+- calculate_scores, generate_analysis: 응답자 전체
+- generate_html_report, save_result: 앞쪽 최대 --item-limit명 (단계별 상한)
+- load_all_results: 응답자 전체를 저장한 저장소를 새로 열어 목록 조회
+  (앱의 load_all_results와 같은 summaries() 호출)
+
+단계마다 처리량(건/초), 건당 p50/p95/p99, 메모리(tracemalloc 최대 할당량)를
+출력하고, --output으로 JSON에 기록합니다. --baseline을 주면 같은 규모/단계의
+기준값과 비교해 속도(건당 단계는 중앙값)가 --tolerance보다 떨어지거나 메모리가
+그만큼 늘어난 항목을 보고하고 종료 코드 1을 돌려줍니다. 기준값은 측정한 기계에
+따라 다르므로 같은 기계에서 만든 파일끼리 비교해야 합니다
+(benchmarks/baseline.json은 1k,10k --repeat 3 측정값).
+
+사용법:
+    python benchmarks/bench_suite.py [--scales 1k,10k,100k] [--output result.json]
+    python benchmarks/bench_suite.py --scales 1k,10k --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --scales 1k,10k --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import metrics  # noqa: E402
+from ai_skill_assessment import AISkillAssessment, analysis_cache_info, clear_analysis_cache  # noqa: E402
+from generate_html_report import generate_html_report  # noqa: E402
+from population import Population, format_scale, generate_population, parse_scale  # noqa: E402
+from result_store import LogResultStore, ResultRepository  # noqa: E402
+
+FORMAT_VERSION = 1
+DEFAULT_SCALES = "1k,10k,100k"
+# 건당 비용이 큰 단계는 앞쪽 일부 응답자만 측정 (처리량은 건당 값이므로 규모와 무관하게 비교 가능)
+ITEM_LIMITS = {
+    "generate_html_report": 10000,
+    "save_result": 20000,
+}
+MEMORY_SAMPLE = 1000      # 건당 단계의 메모리 측정에 쓰는 응답자 수
+POPULATE_CHUNK = 10000    # 목록 조회용 저장소 채우기 묶음 크기
+LOAD_REPEAT = 3
+
+
+def open_store(backend: str, directory: str) -> ResultRepository:
+    if backend == "sqlite":
+        from sqlite_store import SQLiteResultStore
+        return SQLiteResultStore(os.path.join(directory, "results.db"))
+    return LogResultStore(directory)
+
+
+def summarize_times(times: np.ndarray, elapsed: float) -> Dict:
+    """건당 소요 시간(초) 배열 → 처리량/백분위"""
+    p50, p95, p99 = np.percentile(times, [50, 95, 99]) * 1e6
+    return {
+        "items": int(len(times)),
+        "seconds": round(elapsed, 4),
+        "per_second": round(len(times) / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_us": round(float(p50), 2),
+        "p95_us": round(float(p95), 2),
+        "p99_us": round(float(p99), 2),
+    }
+
+
+def time_items(func: Callable, count: int, prepare: Callable[[int], object]) -> Dict:
+    """i = 0..count-1에 대해 func(prepare(i))의 건당 시간 측정 (prepare는 측정에서 제외)"""
+    times = np.empty(count, dtype=np.float64)
+    clock = time.perf_counter
+    for i in range(count):
+        arg = prepare(i)
+        t0 = clock()
+        func(arg)
+        times[i] = clock() - t0
+    return summarize_times(times, float(times.sum()))
+
+
+def peak_bytes_per_item(func: Callable, args: List) -> int:
+    """args마다 func을 호출하는 동안의 건당 tracemalloc 최대 할당량 (반환값은 유지)"""
+    gc.collect()
+    tracemalloc.start()
+    kept = [func(arg) for arg in args]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return round(peak / len(args))
+
+
+def bench_scale(population: Population, backend: str, item_limits: Dict[str, int]) -> Dict:
+    """한 규모의 단계별 측정 결과"""
+    count = len(population)
+    assessment = AISkillAssessment()
+    results = {}
+
+    # 리포트/저장 단계에서 다시 쓰는 앞쪽 응답자의 점수와 분석
+    keep = min(count, max(item_limits.values()))
+    respondents = [population.respondent(i) for i in range(keep)]
+    scores_sample = [assessment.calculate_scores(responses) for _, responses, _ in respondents]
+    analyses = [assessment.generate_analysis(scores) for scores in scores_sample]
+    sample = min(count, MEMORY_SAMPLE)
+
+    # 점수 계산: 응답 dict 생성은 측정에서 제외 (응답자 전체)
+    results["calculate_scores"] = time_items(assessment.calculate_scores, count, population.response_dict)
+    results["calculate_scores"]["peak_bytes_per_item"] = peak_bytes_per_item(
+        assessment.calculate_scores, [responses for _, responses, _ in respondents[:sample]]
+    )
+
+    # 분석 생성: 앱과 같이 분석 캐시를 켠 상태 (적중률을 함께 기록)
+    # 응답자 전체의 점수 dict는 배치 채점 결과에서 하나씩 꺼냄
+    batch = assessment.calculate_scores_batch(population.responses)
+    all_scores = assessment.iter_batch_scores(batch, timestamp="")
+    clear_analysis_cache()
+    results["generate_analysis"] = time_items(assessment.generate_analysis, count, lambda i: next(all_scores))
+    info = analysis_cache_info()
+    lookups = info["hits"] + info["misses"]
+    results["generate_analysis"]["cache_hit_rate"] = round(info["hits"] / lookups, 4) if lookups else 0.0
+    clear_analysis_cache()
+    results["generate_analysis"]["peak_bytes_per_item"] = peak_bytes_per_item(
+        assessment.generate_analysis, scores_sample[:sample]
+    )
+    del batch, all_scores
+
+    # HTML 리포트
+    limit = min(count, item_limits["generate_html_report"])
+    report_args = [(respondents[i][0], scores_sample[i], analyses[i]) for i in range(limit)]
+
+    def render(args):
+        return generate_html_report(*args)
+
+    results["generate_html_report"] = time_items(render, limit, report_args.__getitem__)
+    results["generate_html_report"]["peak_bytes_per_item"] = peak_bytes_per_item(
+        render, report_args[:min(limit, MEMORY_SAMPLE)]
+    )
+
+    directory = tempfile.mkdtemp(prefix="bench_suite_")
+    try:
+        # 결과 저장: 앱의 save_result와 같은 건별 save (원 응답 포함)
+        store = open_store(backend, directory)
+        limit = min(count, item_limits["save_result"])
+
+        def save_args(i):
+            user_info, responses, timestamp = respondents[i]
+            scores_sample[i]["timestamp"] = timestamp
+            return user_info, scores_sample[i], analyses[i], responses
+
+        def save(args):
+            user_info, scores, analysis, responses = args
+            return store.save(user_info, scores, analysis, responses=responses)
+
+        results["save_result"] = time_items(save, limit, save_args)
+        results["save_result"]["store_bytes_per_item"] = round(_directory_size(directory) / limit)
+
+        # 나머지 응답자는 묶음 저장으로 채운 뒤 목록 조회 측정
+        populate_start = time.perf_counter()
+        _populate(store, population, assessment, limit)
+        populate_seconds = time.perf_counter() - populate_start
+        del store
+        results["load_all_results"] = _bench_load(backend, directory, count)
+        results["load_all_results"]["populate_seconds"] = round(populate_seconds, 2)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _populate(store: ResultRepository, population: Population, assessment: AISkillAssessment, begin: int) -> None:
+    for start in range(begin, len(population), POPULATE_CHUNK):
+        stop = min(start + POPULATE_CHUNK, len(population))
+        batch = assessment.calculate_scores_batch(population.responses[start:stop])
+        items = []
+        for i, scores in zip(range(start, stop), assessment.iter_batch_scores(batch, timestamp="")):
+            user_info, responses, timestamp = population.respondent(i)
+            scores["timestamp"] = timestamp
+            items.append((user_info, scores, assessment.generate_analysis(scores), responses))
+        store.save_many(items)
+
+
+def _bench_load(backend: str, directory: str, count: int) -> Dict:
+    """새로 연 저장소의 summaries() (첫 조회)와 이어지는 조회 시간, 첫 조회 메모리"""
+    cold = []
+    warm = []
+    for _ in range(LOAD_REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        store = open_store(backend, directory)
+        entries = store.summaries()
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        store.summaries()
+        warm.append(time.perf_counter() - start)
+        assert len(entries) == count, (len(entries), count)
+        del store, entries
+
+    gc.collect()
+    tracemalloc.start()
+    store = open_store(backend, directory)
+    entries = store.summaries()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store, entries
+
+    best = min(cold)
+    return {
+        "items": count,
+        "seconds": round(best, 4),
+        "per_second": round(count / best, 1) if best > 0 else 0.0,
+        "warm_seconds": round(min(warm), 4),
+        "peak_bytes": peak,
+        "retained_bytes_per_item": round(retained / count),
+    }
+
+
+def _directory_size(directory: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory) for name in names
+    )
+
+
+def max_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준값 대비 저하 항목
+
+    건당 측정 단계는 중앙값(p50_us)이 (1 + tolerance)배를 넘을 때, 목록 조회처럼
+    한 번에 측정하는 단계는 처리량(per_second)이 (1 - tolerance)배 미만일 때,
+    메모리 항목(*bytes*)은 (1 + tolerance)배를 넘을 때 저하로 봅니다.
+    중앙값을 쓰는 것은 디스크 쓰기 등 드문 지연에 평균이 크게 흔들리기 때문입니다.
+    """
+    regressions = []
+    for scale, stages in results["scales"].items():
+        for stage, current in stages.items():
+            base = baseline.get("scales", {}).get(scale, {}).get(stage)
+            if not base:
+                continue
+            if "p50_us" in current and base.get("p50_us"):
+                if current["p50_us"] > base["p50_us"] * (1 + tolerance):
+                    regressions.append(
+                        f"{scale} {stage}: p50 {current['p50_us']:,.1f}µs "
+                        f"(기준 {base['p50_us']:,.1f}µs, {current['p50_us'] / base['p50_us'] - 1:+.0%})"
+                    )
+            elif base.get("per_second") and current["per_second"] < base["per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{scale} {stage}: 처리량 {current['per_second']:,.0f}/초 "
+                    f"(기준 {base['per_second']:,.0f}/초, {current['per_second'] / base['per_second'] - 1:+.0%})"
+                )
+            for key, value in current.items():
+                if "bytes" not in key or not base.get(key):
+                    continue
+                if value > base[key] * (1 + tolerance):
+                    regressions.append(
+                        f"{scale} {stage}: {key} {value:,} (기준 {base[key]:,}, {value / base[key] - 1:+.0%})"
+                    )
+    return regressions
+
+
+def print_table(scale: str, stages: Dict) -> None:
+    print(f"\n[{scale}]")
+    print(f"{'단계':<22}{'건수':>10}{'건/초':>12}{'p50(µs)':>10}{'p95(µs)':>10}{'p99(µs)':>10}  메모리")
+    for stage, values in stages.items():
+        if "peak_bytes_per_item" in values:
+            memory = f"최대 할당 {values['peak_bytes_per_item']:,} B/건"
+        elif "store_bytes_per_item" in values:
+            memory = f"저장 공간 {values['store_bytes_per_item']:,} B/건"
+        else:
+            memory = (f"최대 할당 {values['peak_bytes'] / 1e6:,.1f} MB, "
+                      f"유지 {values['retained_bytes_per_item']:,} B/건")
+        percentiles = "".join(
+            f"{values[key]:>10.1f}" if key in values else f"{'-':>10}"
+            for key in ("p50_us", "p95_us", "p99_us")
+        )
+        print(f"{stage:<22}{values['items']:>10,}{values['per_second']:>12,.0f}{percentiles}  {memory}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="규모별 처리 단계 벤치마크")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="응답자 수 목록 (예: 1k,10k,100k,1m)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], default="log", help="저장소 종류")
+    parser.add_argument("--item-limit", type=int, help="리포트/저장 단계의 측정 건수 상한 (기본: 단계별 값)")
+    parser.add_argument("--repeat", type=int, default=1, help="규모별 반복 측정 횟수 (단계별로 가장 빠른 회차 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="측정 결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON 경로")
+    parser.add_argument("--save-baseline", help="측정 결과를 기준값으로 저장할 경로")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 변동 비율 (기본: 0.25)")
+    args = parser.parse_args(argv)
+
+    # 계측 타이머가 측정값에 섞이지 않도록 끔
+    metrics.disable()
+    item_limits = dict(ITEM_LIMITS)
+    if args.item_limit:
+        item_limits = {stage: args.item_limit for stage in item_limits}
+
+    results = {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "backend": args.backend,
+        "scales": {},
+    }
+    for text in args.scales.split(","):
+        count = parse_scale(text)
+        start = time.perf_counter()
+        population = generate_population(count, args.seed)
+        generated = time.perf_counter() - start
+        runs = [bench_scale(population, args.backend, item_limits) for _ in range(max(1, args.repeat))]
+        stages = {stage: max((run[stage] for run in runs),
+                                 key=lambda values: (-values.get("p50_us", 0), values["per_second"]))
+                  for stage in runs[0]}
+        scale = format_scale(count)
+        results["scales"][scale] = stages
+        print_table(scale, stages)
+        print(f"  (집단 생성 {generated:.2f}초, 저장소 채우기 {stages['load_all_results']['populate_seconds']:.1f}초, "
+              f"목록 재조회 {stages['load_all_results']['warm_seconds'] * 1000:.1f}ms)")
+        del population
+    results["max_rss_bytes"] = max_rss_bytes()
+    if results["max_rss_bytes"]:
+        print(f"\n최대 RSS {results['max_rss_bytes'] / 1e6:,.0f} MB")
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+            print(f"📝 {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠️ 기준값({args.baseline}) 대비 저하 {len(regressions)}건:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\n✅ 기준값({args.baseline}) 대비 저하 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON HTTP API 부하 테스트 (api_server.py)
+
+연결 C개를 동시에 열어 keep-alive로 요청 N건을 나눠 보내고,
+처리량(요청/초, 응답 건/초)과 지연 시간 분포(p50/p95/p99)를 출력합니다.
+표준 라이브러리 asyncio 스트림만 사용합니다.
+
+--spawn을 주면 임시 저장소로 서버를 하위 프로세스로 띄워 측정하고 종료합니다.
+
+사용법:
+    python benchmarks/load_test_api.py --spawn [--connections 1000] [--requests 20000]
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8080 --endpoint analyze --save
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ai_skill_assessment import SCHEMA  # noqa: E402
+
+
+def make_bodies(count: int, batch: int, save: bool, seed: int):
+    """요청 본문 목록 (batch > 1이면 항목 배열)"""
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(count):
+        items = []
+        for j in range(batch):
+            item = {"responses": {q_id: rng.randint(1, 5) for q_id in SCHEMA.question_ids}}
+            if save:
+                item["user_info"] = {"name": f"부하{i}_{j}", "department": f"부서{rng.randrange(20)}",
+                                     "position": "주무관"}
+                item["save"] = True
+            items.append(item)
+        payload = items if batch > 1 else items[0]
+        bodies.append(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    return bodies
+
+
+async def read_response(reader: asyncio.StreamReader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("서버가 연결을 닫았습니다")
+    status = int(status_line.split()[1])
+    length = 0
+    close = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "connection" and value.strip().lower() == "close":
+            close = True
+    await reader.readexactly(length)
+    return status, close
+
+
+async def run_load(host: str, port: int, path: str, bodies, connections: int):
+    latencies = []
+    statuses = Counter()
+    next_index = 0
+
+    async def client():
+        nonlocal next_index
+        reader = writer = None
+        try:
+            while next_index < len(bodies):
+                body = bodies[next_index]
+                next_index += 1
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                request = (
+                    f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                ).encode("latin-1") + body
+                start = time.perf_counter()
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, close = await read_response(reader)
+                except (ConnectionError, asyncio.IncompleteReadError, OSError) as e:
+                    statuses[type(e).__name__] += 1
+                    writer.close()
+                    reader = writer = None
+                    continue
+                latencies.append(time.perf_counter() - start)
+                statuses[status] += 1
+                if close:
+                    writer.close()
+                    reader = writer = None
+        finally:
+            if writer is not None:
+                writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(connections)))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(port: int, directory: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "api_server.py"), "--port", str(port),
+         "--store", os.path.join(directory, "store"), "--results-dir", directory],
+        stdout=subprocess.DEVNULL, cwd=directory
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("서버 시작에 실패했습니다")
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("서버가 시간 안에 시작되지 않았습니다")
+
+
+def raise_file_limit(connections: int) -> None:
+    """동시 연결 수만큼 파일 디스크립터 한도 올리기 (가능한 범위에서)"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = connections + 256
+    if soft < wanted:
+        limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON HTTP API 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="서버 주소")
+    parser.add_argument("--spawn", action="store_true", help="임시 저장소로 서버를 띄워 측정")
+    parser.add_argument("--endpoint", choices=["score", "analyze"], default="analyze")
+    parser.add_argument("--save", action="store_true", help="analyze 요청에 save=true 포함")
+    parser.add_argument("--connections", type=int, default=1000, help="동시 연결 수")
+    parser.add_argument("--requests", type=int, default=20000, help="전체 요청 수")
+    parser.add_argument("--batch", type=int, default=1, help="요청당 항목 수 (1이면 단건 본문)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    raise_file_limit(args.connections)
+    bodies = make_bodies(args.requests, args.batch, args.save and args.endpoint == "analyze", args.seed)
+
+    process = directory = None
+    if args.spawn:
+        directory = tempfile.mkdtemp(prefix="load_test_api_")
+        host, port = "127.0.0.1", _free_port()
+        process = spawn_server(port, directory)
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    try:
+        elapsed, latencies, statuses = asyncio.run(
+            run_load(host, port, f"/api/{args.endpoint}", bodies, args.connections)
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+            shutil.rmtree(directory, ignore_errors=True)
+
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000 if ordered else 0.0
+
+    print(f"요청 {args.requests:,}건 / 연결 {args.connections:,}개 / 요청당 항목 {args.batch} "
+          f"({args.endpoint}{', 저장' if args.save else ''})")
+    print(f"소요 {elapsed:.2f}초, {len(latencies) / elapsed:,.0f} 요청/초, "
+          f"{len(latencies) * args.batch / elapsed:,.0f} 건/초")
+    if ordered:
+        print(f"지연(ms) 평균 {statistics.mean(ordered) * 1000:.1f}, p50 {percentile(0.50):.1f}, "
+              f"p95 {percentile(0.95):.1f}, p99 {percentile(0.99):.1f}, 최대 {ordered[-1] * 1000:.1f}")
+    print("응답:", ", ".join(f"{status}={count}" for status, count in sorted(statuses.items(), key=str)))
+
+
+if __name__ == "__main__":
+    main()
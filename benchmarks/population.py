@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 가상 응답자 집단 생성
+
+시드가 같으면 항상 같은 집단을 만듭니다. 응답은 응답자별 잠재 역량과
+영역별 편차, 문항별 난이도를 합친 값을 4개의 경계로 나누는 순서형 모형
+(graded response)으로 만들어, 실제 설문처럼 3~4점에 몰리고 영역 간 상관이
+있는 분포가 됩니다. 부서/직위는 실제 기관처럼 고르지 않은 비율로 뽑고,
+직위와 부서에 따라 평균 역량이 조금씩 다릅니다.
+
+100만 명도 수 초 안에 만들 수 있도록 응답은 numpy 행렬로 한 번에 만들고,
+이름과 진단 일시는 respondent(i)/iter_respondents()에서 필요할 때 만듭니다.
+
+사용법:
+    population = generate_population(10000, seed=42)
+    population.responses            # N×15 uint8 행렬 (문항 순서 Q1~Q15)
+    for user_info, responses, timestamp in population.iter_respondents():
+        ...
+
+    python benchmarks/population.py 10k      # 분포 요약 출력
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment  # noqa: E402
+
+# (부서명, 상대 인원, 평균 역량 차이)
+DEPARTMENTS = (
+    ("총무과", 9, 0.0), ("기획예산과", 7, 0.2), ("디지털혁신과", 4, 0.8),
+    ("정보통신과", 4, 0.7), ("인사과", 5, 0.0), ("감사실", 3, -0.1),
+    ("민원여권과", 8, -0.2), ("세무과", 7, -0.1), ("회계과", 5, 0.0),
+    ("복지정책과", 8, -0.2), ("노인장애인과", 6, -0.3), ("여성가족과", 5, -0.1),
+    ("교육청소년과", 4, 0.1), ("문화관광과", 5, 0.1), ("체육진흥과", 3, -0.1),
+    ("경제일자리과", 5, 0.2), ("지역경제과", 4, 0.1), ("농업정책과", 5, -0.4),
+    ("산림공원과", 4, -0.4), ("환경정책과", 5, -0.1), ("자원순환과", 4, -0.3),
+    ("건축과", 5, -0.2), ("도시계획과", 4, 0.1), ("교통행정과", 5, -0.1),
+    ("도로과", 4, -0.3), ("상하수도과", 4, -0.3), ("보건정책과", 5, 0.0),
+    ("안전총괄과", 4, 0.0), ("재난대응과", 3, -0.1), ("홍보담당관", 3, 0.4),
+)
+
+# (직위, 상대 인원, 평균 역량 차이)
+POSITIONS = (
+    ("주무관", 45, 0.1), ("주사", 20, 0.0), ("팀장", 12, -0.1),
+    ("사무관", 10, 0.0), ("연구사", 4, 0.3), ("서기관", 4, -0.2),
+    ("과장", 4, -0.3), ("연구관", 1, 0.2),
+)
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_SYLLABLES = "민서지현수영준우예진하은도윤시연주원태경선혜성희재"
+
+# 잠재 척도에서 1|2, 2|3, 3|4, 4|5 경계 (평균 응답이 3점대 중반이 되도록)
+THRESHOLDS = np.array([-2.2, -1.1, 0.1, 1.4])
+CATEGORY_SPREAD = 0.45    # 영역별 편차
+NOISE = 0.7               # 문항 응답 잡음
+PERIOD_DAYS = 180         # 진단 일시 분포 기간
+
+
+class Population:
+    """생성된 응답자 집단 (응답 행렬 + 부서/직위 코드)"""
+
+    def __init__(
+        self,
+        responses: np.ndarray,
+        departments: np.ndarray,
+        positions: np.ndarray,
+        names: np.ndarray,
+        minutes: np.ndarray,
+        start: datetime
+    ):
+        self.responses = responses
+        self.departments = departments
+        self.positions = positions
+        self._names = names
+        self._minutes = minutes
+        self._start = start
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def user_info(self, i: int) -> Dict[str, str]:
+        surname, first, second = self._names[i].tolist()
+        return {
+            "name": SURNAMES[surname] + GIVEN_SYLLABLES[first] + GIVEN_SYLLABLES[second],
+            "department": DEPARTMENTS[self.departments[i]][0],
+            "position": POSITIONS[self.positions[i]][0],
+        }
+
+    def response_dict(self, i: int) -> Dict[str, int]:
+        return {q_id: value for q_id, value in zip(SCHEMA.question_ids, self.responses[i].tolist()) if value}
+
+    def timestamp(self, i: int) -> str:
+        return (self._start + timedelta(minutes=int(self._minutes[i]))).isoformat()
+
+    def respondent(self, i: int) -> Tuple[Dict[str, str], Dict[str, int], str]:
+        """(user_info, responses, timestamp)"""
+        return self.user_info(i), self.response_dict(i), self.timestamp(i)
+
+    def iter_respondents(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> Iterator[Tuple[Dict[str, str], Dict[str, int], str]]:
+        for i in range(start, len(self) if stop is None else min(stop, len(self))):
+            yield self.respondent(i)
+
+
+def _weights(table) -> np.ndarray:
+    weights = np.array([row[1] for row in table], dtype=np.float64)
+    return weights / weights.sum()
+
+
+def generate_population(
+    count: int,
+    seed: int = 42,
+    missing_rate: float = 0.0,
+    start: datetime = datetime(2024, 3, 4, 9, 0)
+) -> Population:
+    """
+    가상 응답자 count명 생성
+
+    Args:
+        missing_rate: 문항별 미응답(0) 비율 (앱은 모든 문항을 받으므로 기본 0)
+        start: 진단 일시 분포의 시작 시각 (여기서부터 PERIOD_DAYS일 동안의 근무 시간)
+    """
+    rng = np.random.default_rng(seed)
+    departments = rng.choice(len(DEPARTMENTS), size=count, p=_weights(DEPARTMENTS)).astype(np.uint8)
+    positions = rng.choice(len(POSITIONS), size=count, p=_weights(POSITIONS)).astype(np.uint8)
+
+    ability = (
+        rng.standard_normal(count)
+        + np.array([row[2] for row in DEPARTMENTS])[departments]
+        + np.array([row[2] for row in POSITIONS])[positions]
+    )
+    num_categories = len(SCHEMA.category_ids)
+    category_skill = ability[:, None] + CATEGORY_SPREAD * rng.standard_normal((count, num_categories))
+    # 영역 안의 문항은 연속 구간이므로 문항별로 해당 영역 값을 펼침
+    question_category = np.repeat(np.arange(num_categories), np.diff(
+        np.append(SCHEMA.category_starts, SCHEMA.num_questions)
+    ))
+    difficulty = np.random.default_rng(seed + 1).normal(0.0, 0.35, SCHEMA.num_questions)
+    latent = category_skill[:, question_category] - difficulty + NOISE * rng.standard_normal(
+        (count, SCHEMA.num_questions)
+    )
+    responses = (1 + np.searchsorted(THRESHOLDS, latent)).astype(np.uint8)
+    if missing_rate:
+        responses[rng.random(responses.shape) < missing_rate] = 0
+
+    names = np.stack([
+        rng.integers(0, len(SURNAMES), count),
+        rng.integers(0, len(GIVEN_SYLLABLES), count),
+        rng.integers(0, len(GIVEN_SYLLABLES), count),
+    ], axis=1).astype(np.uint8)
+    # 기간 안의 평일 9~18시 사이 진단 일시 (시작 시각 기준 분 단위)
+    workdays = np.array([d for d in range(PERIOD_DAYS) if (start + timedelta(days=d)).weekday() < 5])
+    minutes = rng.choice(workdays, size=count) * 24 * 60 + rng.integers(0, 9 * 60, count)
+    return Population(responses, departments, positions, names, np.sort(minutes), start)
+
+
+def parse_scale(text: str) -> int:
+    """'1k', '100k', '1m', '2500' → 정수"""
+    text = text.strip().lower()
+    multiplier = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+def format_scale(count: int) -> str:
+    if count >= 1000000 and count % 1000000 == 0:
+        return f"{count // 1000000}m"
+    if count >= 1000 and count % 1000 == 0:
+        return f"{count // 1000}k"
+    return str(count)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="가상 응답자 집단 생성 및 분포 요약")
+    parser.add_argument("scale", nargs="?", default="10k", help="응답자 수 (예: 1k, 100k, 1m)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    population = generate_population(parse_scale(args.scale), args.seed)
+    batch = AISkillAssessment().calculate_scores_batch(population.responses)
+    values, counts = np.unique(population.responses, return_counts=True)
+    print(f"응답자 {len(population):,}명")
+    print("응답 분포:", ", ".join(f"{v}점 {c / counts.sum() * 100:.1f}%" for v, c in zip(values, counts)))
+    levels, level_counts = np.unique(batch["level"], return_counts=True)
+    print("레벨 분포:", ", ".join(f"{l} {c / len(population) * 100:.1f}%" for l, c in zip(levels, level_counts)))
+    print("평균 달성률:", f"{batch['percentage'].mean():.1f}%")
+    print("부서 상위 5:", ", ".join(
+        f"{DEPARTMENTS[d][0]} {c:,}" for d, c in sorted(
+            zip(*np.unique(population.departments, return_counts=True)), key=lambda x: -x[1]
+        )[:5]
+    ))
+    print("예시:", population.respondent(0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 분석용 결과 데이터 내보내기
+
+저장소의 결과를 한 번 순회하며 열(column)별 연속 배열로 모아 NumPy
+.npz 파일 하나 또는 열마다 .npy 파일이 있는 디렉토리로 저장합니다.
+.npy 디렉토리는 np.load(mmap_mode="r")로 바로 매핑되므로 기관 전체
+데이터도 JSON을 파싱하지 않고 수 ms 안에 불러올 수 있습니다.
+
+스프레드시트용으로는 같은 항목을 CSV로 한 줄씩 스트리밍합니다
+(Excel 한글 표시를 위해 UTF-8 BOM 포함).
+
+열 구성:
+    id, name, department, position   문자열 (부서/직위는 코드 + 목록)
+    timestamp                        datetime64[us]
+    responses                        uint8 (N, 문항 수), 이전 문항 구성의 응답은 현재 구성으로
+                                     변환, 응답이 없으면 0
+    schema_version                   uint16 응답의 원래 문항 구성 버전 (응답이 없으면 0)
+    category_scores                  uint8 (N, 영역 수)
+    total_score                      int16
+    level                            uint8 레벨 코드 (level_names 순서)
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from ai_skill_assessment import SCHEMA, CompiledSchema
+from result_store import ResultFilter, iter_matching_records, open_result_store
+from schema_versions import record_responses, record_schema_version
+
+CSV_ENCODING = "utf-8-sig"
+
+
+class ColumnBuilder:
+    """결과를 한 건씩 받아 열별 타입 배열에 이어붙이는 버퍼"""
+
+    def __init__(self, schema: CompiledSchema = SCHEMA):
+        self.schema = schema
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.department_codes = array("i")
+        self.position_codes = array("i")
+        self.departments: Dict[str, int] = {}
+        self.positions: Dict[str, int] = {}
+        self.timestamps: List[str] = []
+        self.responses = array("B")
+        self.schema_versions = array("H")
+        self.category_scores = array("B")
+        self.total_scores = array("h")
+        self.levels = array("B")
+        self._level_codes = {name: code for code, name in enumerate(schema.level_names)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _code(value: str, codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def add(self, record: Dict) -> None:
+        schema = self.schema
+        user_info = record.get("user_info", {})
+        scores = record["scores"]
+        self.ids.append(record.get("id", ""))
+        self.names.append(user_info.get("name", ""))
+        self.department_codes.append(self._code(user_info.get("department", ""), self.departments))
+        self.position_codes.append(self._code(user_info.get("position", ""), self.positions))
+        self.timestamps.append(scores.get("timestamp", ""))
+
+        responses = record_responses(record, schema)
+        if responses is None:
+            responses = bytes(schema.num_questions)
+        self.responses.frombytes(responses)
+        self.schema_versions.append(record_schema_version(record) or 0)
+        category_scores = scores["category_scores"]
+        self.category_scores.extend(category_scores[cat_id]["score"] for cat_id in schema.category_ids)
+        self.total_scores.append(scores["total_score"])
+        self.levels.append(self._level_codes[scores["level"]])
+
+    def extend(self, records: Iterable[Dict]) -> "ColumnBuilder":
+        for record in records:
+            self.add(record)
+        return self
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """열 이름 → 배열 (문자열은 고정 폭 유니코드, 메타데이터 포함)"""
+        schema = self.schema
+        n = len(self)
+        return {
+            "id": np.array(self.ids, dtype=str),
+            "name": np.array(self.names, dtype=str),
+            "department": np.frombuffer(self.department_codes, dtype=np.int32),
+            "departments": np.array(list(self.departments), dtype=str),
+            "position": np.frombuffer(self.position_codes, dtype=np.int32),
+            "positions": np.array(list(self.positions), dtype=str),
+            "timestamp": np.array(
+                [ts or "NaT" for ts in self.timestamps], dtype="datetime64[us]"
+            ),
+            "responses": np.frombuffer(self.responses, dtype=np.uint8).reshape(n, schema.num_questions),
+            "schema_version": np.frombuffer(self.schema_versions, dtype=np.uint16),
+            "category_scores": np.frombuffer(self.category_scores, dtype=np.uint8)
+                .reshape(n, len(schema.category_ids)),
+            "total_score": np.frombuffer(self.total_scores, dtype=np.int16),
+            "level": np.frombuffer(self.levels, dtype=np.uint8),
+            "question_ids": np.array(schema.question_ids, dtype=str),
+            "category_ids": np.array(schema.category_ids, dtype=str),
+            "level_names": np.array(schema.level_names, dtype=str),
+        }
+
+
+def save_npz(columns: Dict[str, np.ndarray], path: str, compressed: bool = False) -> None:
+    """열들을 .npz 파일 하나로 저장"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        (np.savez_compressed if compressed else np.savez)(f, **columns)
+    os.replace(tmp_path, path)
+
+
+def save_npy_dir(columns: Dict[str, np.ndarray], directory: str) -> None:
+    """열마다 <열 이름>.npy 파일로 저장 (메모리 매핑으로 불러오기 가능)"""
+    os.makedirs(directory, exist_ok=True)
+    for name, values in columns.items():
+        path = os.path.join(directory, f"{name}.npy")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, values)
+        os.replace(tmp_path, path)
+
+
+def load_columns(path: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """save_npz/save_npy_dir로 저장한 열 불러오기 (.npy 디렉토리는 메모리 매핑)"""
+    if os.path.isdir(path):
+        return {
+            filename[:-4]: np.load(os.path.join(path, filename), mmap_mode="r" if mmap else None)
+            for filename in sorted(os.listdir(path)) if filename.endswith(".npy")
+        }
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+# ---------- CSV ----------
+def csv_header(schema: CompiledSchema = SCHEMA) -> List[str]:
+    return (
+        ["ID", "이름", "부서", "직위", "진단일시", "점수", "달성률", "레벨"]
+        + list(schema.category_names)
+        + list(schema.question_ids)
+    )
+
+
+def csv_row(record: Dict, schema: CompiledSchema = SCHEMA) -> List:
+    user_info = record.get("user_info", {})
+    scores = record["scores"]
+    responses = record_responses(record, schema)
+    category_scores = scores["category_scores"]
+    return (
+        [
+            record.get("id", ""),
+            user_info.get("name", ""),
+            user_info.get("department", ""),
+            user_info.get("position", ""),
+            scores.get("timestamp", ""),
+            scores["total_score"],
+            scores["percentage"],
+            scores["level"]
+        ]
+        + [category_scores[cat_id]["score"] for cat_id in schema.category_ids]
+        + (list(responses) if responses is not None else [""] * schema.num_questions)
+    )
+
+
+def iter_csv(records: Iterable[Dict], schema: CompiledSchema = SCHEMA,
+             rows_per_chunk: int = 500) -> Iterator[bytes]:
+    """CSV를 바이트 조각으로 스트리밍 (BOM 포함, rows_per_chunk 줄씩)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(csv_header(schema))
+    yield buffer.getvalue().encode(CSV_ENCODING)
+    buffer.seek(0)
+    buffer.truncate()
+    pending = 0
+    for record in records:
+        writer.writerow(csv_row(record, schema))
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_csv(records: Iterable[Dict], fileobj, schema: CompiledSchema = SCHEMA) -> int:
+    """CSV를 파일 객체(바이너리)에 스트리밍으로 기록 → 기록한 행 수"""
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        for record in records:
+            rows += 1
+            yield record
+
+    for chunk in iter_csv(counted(), schema):
+        fileobj.write(chunk)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="진단 결과를 분석용 열 파일 또는 CSV로 내보내기")
+    parser.add_argument("output", help="출력 경로 (npz: 파일, npy: 디렉토리, csv: 파일 또는 '-')")
+    parser.add_argument("--format", choices=["npz", "npy", "csv"], default="npz", help="출력 형식 (기본: npz)")
+    parser.add_argument("--compressed", action="store_true", help="npz를 압축하여 저장")
+    parser.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+    parser.add_argument("--department", help="해당 부서 결과만 내보내기")
+    args = parser.parse_args(argv)
+
+    store = open_result_store(args.store, args.backend, shared=False)
+    filters = ResultFilter(department=args.department) if args.department else None
+    records = iter_matching_records(store, filters)
+
+    if args.format == "csv":
+        if args.output == "-":
+            rows = write_csv(records, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.output, "wb") as f:
+                rows = write_csv(records, f)
+        print(f"✅ CSV {rows}건 기록", file=sys.stderr)
+        return
+
+    columns = ColumnBuilder().extend(records).columns()
+    if args.format == "npy":
+        save_npy_dir(columns, args.output)
+    else:
+        save_npz(columns, args.output, compressed=args.compressed)
+    print(f"✅ {len(columns['id'])}건을 {args.output}에 저장", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,31 @@ AI 활용 역량 진단 시스템 - HTML 리포트 생성
 """
 
 from datetime import datetime
+from html import escape
+import hashlib
 import json
 
+from metrics import timed
+
+# 템플릿 버전 (이 파일이 바뀌면 달라지며, 이미 만든 리포트가 최신인지 판단하는 데 사용)
+with open(__file__, "rb") as _source:
+    TEMPLATE_VERSION = hashlib.sha256(_source.read()).hexdigest()[:16]
+
+
+def _text(value) -> str:
+    """HTML에 넣을 값 (사용자 입력이 그대로 들어가므로 항상 이스케이프)"""
+    return escape(str(value))
+
+
+def _format_resource(resource) -> str:
+    """학습 자료 항목 (generate_analysis의 dict 또는 문자열)"""
+    if isinstance(resource, dict):
+        return _text(f"{resource['type']}: {resource['title']} "
+                     f"({resource['duration']} · {resource['level']})")
+    return _text(resource)
+
+
+@timed("generate_html_report")
 def generate_html_report(user_info, scores, analysis):
     """
     HTML 형식의 상세 리포트 생성
@@ -36,7 +59,7 @@ def generate_html_report(user_info, scores, analysis):
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI 활용 역량 진단 리포트 - {user_info['name']}</title>
+    <title>AI 활용 역량 진단 리포트 - {_text(user_info['name'])}</title>
     <style>
         * {{
             margin: 0;
@@ -460,15 +483,15 @@ def generate_html_report(user_info, scores, analysis):
                 <div class="info-grid">
                     <div class="info-item">
                         <div class="info-label">이름</div>
-                        <div class="info-value">{user_info['name']}</div>
+                        <div class="info-value">{_text(user_info['name'])}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">소속 부서</div>
-                        <div class="info-value">{user_info['department']}</div>
+                        <div class="info-value">{_text(user_info['department'])}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">직위</div>
-                        <div class="info-value">{user_info['position']}</div>
+                        <div class="info-value">{_text(user_info['position'])}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">진단 일시</div>
@@ -480,16 +503,16 @@ def generate_html_report(user_info, scores, analysis):
             <!-- 종합 점수 -->
             <div class="score-summary">
                 <h2>종합 점수</h2>
-                <div class="total-score">{scores['total_score']} / {scores['total_max']}</div>
-                <div style="font-size: 1.5em; margin: 10px 0;">달성률: {scores['percentage']}%</div>
-                <div class="level-badge">{level} 레벨</div>
+                <div class="total-score">{_text(scores['total_score'])} / {_text(scores['total_max'])}</div>
+                <div style="font-size: 1.5em; margin: 10px 0;">달성률: {_text(scores['percentage'])}%</div>
+                <div class="level-badge">{_text(level)} 레벨</div>
             </div>
             
             <!-- 전체 평가 -->
             <div class="section">
                 <h2>📊 전체 평가</h2>
                 <div class="assessment-box">
-                    <p>{analysis['overall_assessment']}</p>
+                    <p>{_text(analysis['overall_assessment'])}</p>
                 </div>
             </div>
             
@@ -513,14 +536,14 @@ def generate_html_report(user_info, scores, analysis):
         
         html += f"""
                     <div class="category-card">
-                        <div class="category-name">{category_data['name']}</div>
+                        <div class="category-name">{_text(category_data['name'])}</div>
                         <div class="progress-bar">
-                            <div class="progress-fill" style="width: {percentage}%; background: {bar_color};">
-                                {percentage}%
+                            <div class="progress-fill" style="width: {_text(percentage)}%; background: {bar_color};">
+                                {_text(percentage)}%
                             </div>
                         </div>
                         <div class="score-detail">
-                            {category_data['score']} / {category_data['max_score']} 점
+                            {_text(category_data['score'])} / {_text(category_data['max_score'])} 점
                         </div>
                     </div>
 """
@@ -543,9 +566,9 @@ def generate_html_report(user_info, scores, analysis):
         for item in analysis['strengths']:
             html += f"""
                         <li>
-                            <div class="item-category">{item['category']}</div>
-                            <div class="item-percentage">달성률: {item['percentage']}%</div>
-                            <div class="item-comment">{item['comment']}</div>
+                            <div class="item-category">{_text(item['category'])}</div>
+                            <div class="item-percentage">달성률: {_text(item.get('percentage', item.get('score')))}%</div>
+                            <div class="item-comment">{_text(item['comment'])}</div>
                         </li>
 """
         html += '</ul>'
@@ -565,9 +588,9 @@ def generate_html_report(user_info, scores, analysis):
         for item in analysis['weaknesses']:
             html += f"""
                         <li>
-                            <div class="item-category">{item['category']}</div>
-                            <div class="item-percentage">달성률: {item['percentage']}%</div>
-                            <div class="item-comment">{item['comment']}</div>
+                            <div class="item-category">{_text(item['category'])}</div>
+                            <div class="item-percentage">달성률: {_text(item.get('percentage', item.get('score')))}%</div>
+                            <div class="item-comment">{_text(item['comment'])}</div>
                         </li>
 """
         html += '</ul>'
@@ -585,10 +608,10 @@ def generate_html_report(user_info, scores, analysis):
                 <div class="recommendations">
                     <h3>{} 레벨 맞춤 추천</h3>
                     <ul>
-""".format(level)
+""".format(_text(level))
     
     for rec in analysis['recommendations']:
-        html += f'                        <li>{rec}</li>\n'
+        html += f'                        <li>{_text(rec)}</li>\n'
     
     html += """
                     </ul>
@@ -605,12 +628,12 @@ def generate_html_report(user_info, scores, analysis):
     for path in analysis['learning_path']:
         html += f"""
                     <div class="learning-card">
-                        <span class="learning-priority">우선순위 {path['priority']}</span>
-                        <div class="learning-title">{path['category']}</div>
+                        <span class="learning-priority">우선순위 {_text(path['priority'])}</span>
+                        <div class="learning-title">{_text(path['category'])}</div>
                         <div class="learning-progress">
-                            <span class="current">현재 {path['current_score']}%</span>
+                            <span class="current">현재 {_text(path['current_score'])}%</span>
                             <span class="arrow">→</span>
-                            <span class="target">목표 {path['target_score']}%</span>
+                            <span class="target">목표 {_text(path['target_score'])}%</span>
                         </div>
                         <div class="learning-resources">
                             <h4>추천 학습 자료</h4>
@@ -618,7 +641,7 @@ def generate_html_report(user_info, scores, analysis):
 """
         
         for resource in path['resources']:
-            html += f'                                <li>{resource}</li>\n'
+            html += f'                                <li>{_format_resource(resource)}</li>\n'
         
         html += """
                             </ul>
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 단계별 소요 시간/횟수 계측
+
+채점, 분석, 저장, 리포트 생성, 목록 조회 등 주요 단계에 timed 데코레이터나
+timer 컨텍스트를 붙여 두면, 계측을 켰을 때 단계별 소요 시간을 모으고
+p50/p95/p99를 계산합니다.
+
+- 기본은 꺼져 있으며(환경 변수 AI_ASSESSMENT_METRICS=1로 켬), 꺼져 있을 때는
+  호출마다 전역 플래그 확인 한 번만 추가됩니다.
+- 단계별 최근 RESERVOIR_SIZE개의 측정값만 보관하므로 메모리가 일정합니다.
+- add_sink로 외부 수집기(로그, StatsD 등)에 측정값을 함께 넘길 수 있습니다.
+
+    @timed("calculate_scores")
+    def calculate_scores(...): ...
+
+    with timer("save_result"):
+        ...
+
+    increment("submissions")
+    dump_json("metrics.json")
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+ENABLED_ENV = "AI_ASSESSMENT_METRICS"
+RESERVOIR_SIZE = 10000
+PERCENTILES = (50, 95, 99)
+
+_enabled = os.environ.get(ENABLED_ENV, "").lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_samples: Dict[str, Deque[float]] = {}
+_totals: Dict[str, List[float]] = {}   # 단계 → [횟수, 합계(초), 최댓값(초)]
+_counters: Dict[str, int] = {}
+_sinks: List[Callable[[str, float], None]] = []
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def disable() -> None:
+    enable(False)
+
+
+def add_sink(sink: Callable[[str, float], None]) -> None:
+    """측정값을 받을 콜백 추가 (단계명, 소요 초)"""
+    with _lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[str, float], None]) -> None:
+    with _lock:
+        _sinks.remove(sink)
+
+
+def record(stage: str, seconds: float) -> None:
+    """단계 소요 시간 기록"""
+    with _lock:
+        samples = _samples.get(stage)
+        if samples is None:
+            samples = _samples[stage] = deque(maxlen=RESERVOIR_SIZE)
+            _totals[stage] = [0, 0.0, 0.0]
+        samples.append(seconds)
+        totals = _totals[stage]
+        totals[0] += 1
+        totals[1] += seconds
+        if seconds > totals[2]:
+            totals[2] = seconds
+        sinks = list(_sinks)
+    for sink in sinks:
+        sink(stage, seconds)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """카운터 증가 (계측이 꺼져 있으면 무시)"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+class _Timer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stage: str):
+    """with 블록 소요 시간 계측 (꺼져 있으면 아무것도 하지 않는 공유 객체)"""
+    return _Timer(stage) if _enabled else _NULL_TIMER
+
+
+def timed(stage: Optional[str] = None):
+    """함수 소요 시간 계측 데코레이터 (stage 기본값은 함수 이름)"""
+    def decorator(func):
+        name = stage or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> Dict:
+    """
+    단계별 통계와 카운터
+
+    Returns:
+        {"enabled", "stages": {단계: {count, total_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}},
+         "counters": {...}}
+        백분위는 단계별 최근 RESERVOIR_SIZE개 측정값 기준입니다.
+    """
+    with _lock:
+        samples = {stage: np.fromiter(values, dtype=np.float64, count=len(values))
+                   for stage, values in _samples.items()}
+        totals = {stage: list(values) for stage, values in _totals.items()}
+        counters = dict(_counters)
+
+    stages = {}
+    for stage in sorted(samples):
+        count, total, maximum = totals[stage]
+        values = np.percentile(samples[stage], PERCENTILES) * 1000
+        stages[stage] = {
+            "count": count,
+            "total_ms": round(total * 1000, 3),
+            "mean_ms": round(total / count * 1000, 4),
+            **{f"p{p}_ms": round(float(v), 4) for p, v in zip(PERCENTILES, values)},
+            "max_ms": round(maximum * 1000, 4)
+        }
+    return {"enabled": _enabled, "stages": stages, "counters": counters}
+
+
+def dump_json(path: Optional[str] = None) -> str:
+    """snapshot을 JSON 문자열로 (path가 있으면 파일에도 기록)"""
+    text = json.dumps(dict(snapshot(), dumped_at=time.strftime("%Y-%m-%dT%H:%M:%S")),
+                      ensure_ascii=False, indent=2)
+    if path is not None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    return text
+
+
+def reset() -> None:
+    """측정값과 카운터 비우기"""
+    with _lock:
+        _samples.clear()
+        _totals.clear()
+        _counters.clear()
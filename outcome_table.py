@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 영역 점수 조합별 결과표
+
+영역마다 문항이 3개(리커트 1~5)이므로 영역 점수는 3~15, 가능한 영역 점수
+조합은 13^5 ≈ 37만 개뿐입니다. 모든 조합의 레벨, 강점/약점 영역, 학습
+경로 순서를 미리 계산해 .npy 파일로 저장하고 메모리 매핑으로 읽어,
+분석 생성의 판단 부분(단건)과 대량 결과의 레벨/강점/약점/학습 경로
+판정(lookup_batch)을 표 조회로 대신합니다.
+
+행 형식 (uint8 10개): [레벨 코드, 강점 영역 ×3, 약점 영역 ×3, 학습 경로 영역 ×3]
+영역은 스키마의 영역 인덱스이며, 해당 항목이 없으면 NONE(255)입니다.
+
+파일명에 스키마/레벨 기준/분석 기준의 지문이 들어가므로 ASSESSMENT_DATA나
+LEVEL_CRITERIA가 바뀌면 자동으로 새 표를 만들고 이전 파일은 지웁니다.
+불러올 때는 표본 행을 실제 분석 결과와 비교해 검증합니다.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import ai_skill_assessment
+from ai_skill_assessment import SCHEMA, AISkillAssessment, CompiledSchema
+
+# 표 생성 방식이 바뀌면 올려서 기존 파일을 무효화
+OUTCOME_TABLE_VERSION = 1
+NONE = 255
+ROW_WIDTH = 1 + 3 * ai_skill_assessment.MAX_ANALYSIS_ITEMS
+VALIDATION_SAMPLE_SIZE = 512
+
+
+def schema_fingerprint(schema: CompiledSchema) -> str:
+    """표 내용을 결정하는 입력(문항, 레벨 기준, 분석 기준)의 지문"""
+    payload = json.dumps(
+        [
+            OUTCOME_TABLE_VERSION,
+            schema.data,
+            schema.level_criteria,
+            ai_skill_assessment.STRENGTH_MIN_PERCENTAGE,
+            ai_skill_assessment.WEAKNESS_MAX_PERCENTAGE,
+            ai_skill_assessment.MAX_ANALYSIS_ITEMS
+        ],
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class OutcomeTable:
+    """영역 점수 조합 → (레벨, 강점, 약점, 학습 경로) 조회표"""
+
+    def __init__(self, schema: CompiledSchema, rows: np.ndarray):
+        """
+        Args:
+            schema: 표를 만든 스키마
+            rows: (조합 수, ROW_WIDTH) uint8 배열 (메모리 매핑 가능)
+        """
+        self.schema = schema
+        self.rows = rows
+        min_likert = min(schema.likert_options)
+        self.min_scores = np.array(
+            [len(q_ids) * min_likert for q_ids in schema.category_question_ids], dtype=np.int64
+        )
+        self.radix = schema.category_max_scores - self.min_scores + 1
+        # 마지막 영역이 가장 빠르게 변하는 순서 (C 순서)
+        self.strides = np.concatenate([np.cumprod(self.radix[::-1])[::-1][1:], [1]])
+        self._min_list = self.min_scores.tolist()
+        self._max_list = schema.category_max_scores.tolist()
+        self._stride_list = self.strides.tolist()
+        # 행 하나씩 읽을 때는 numpy 인덱싱보다 memoryview 슬라이스가 훨씬 빠름
+        self._view = memoryview(np.asarray(rows).reshape(-1))
+        expected = (int(np.prod(self.radix)), ROW_WIDTH)
+        if rows.shape != expected or rows.dtype != np.uint8:
+            raise ValueError(f"결과표 형식이 맞지 않습니다: {rows.shape}/{rows.dtype}, 기대값 {expected}/uint8")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    # ---------- 생성 ----------
+    @classmethod
+    def build(cls, schema: CompiledSchema = SCHEMA) -> "OutcomeTable":
+        """모든 영역 점수 조합의 결과를 벡터 연산으로 계산"""
+        min_likert = min(schema.likert_options)
+        ranges = [
+            np.arange(len(q_ids) * min_likert, max_score + 1)
+            for q_ids, max_score in zip(schema.category_question_ids, schema.category_max_list)
+        ]
+        grid = np.stack(np.meshgrid(*ranges, indexing="ij"), axis=-1).reshape(-1, len(ranges))
+        percentages = np.column_stack([
+            table[grid[:, j]] for j, table in enumerate(schema.category_percentage_tables)
+        ])
+
+        n = ai_skill_assessment.MAX_ANALYSIS_ITEMS
+        rows = np.full((len(grid), ROW_WIDTH), NONE, dtype=np.uint8)
+        rows[:, 0] = schema.level_table.classify_codes(grid.sum(axis=1))
+
+        # 안정 정렬이므로 달성률이 같으면 영역 순서를 유지 (분석 메서드의 sort와 동일)
+        descending = np.argsort(-percentages, axis=1, kind="stable")[:, :n]
+        ascending = np.argsort(percentages, axis=1, kind="stable")[:, :n]
+        is_strength = np.take_along_axis(percentages, descending, axis=1) \
+            >= ai_skill_assessment.STRENGTH_MIN_PERCENTAGE
+        is_weakness = np.take_along_axis(percentages, ascending, axis=1) \
+            < ai_skill_assessment.WEAKNESS_MAX_PERCENTAGE
+        rows[:, 1:1 + n] = np.where(is_strength, descending, NONE)
+        rows[:, 1 + n:1 + 2 * n] = np.where(is_weakness, ascending, NONE)
+        rows[:, 1 + 2 * n:] = ascending
+        return cls(schema, rows)
+
+    def save(self, path: str) -> None:
+        """.npy 파일로 저장 (임시 파일 교체로 원자적 기록)"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.rows))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, schema: CompiledSchema = SCHEMA) -> "OutcomeTable":
+        """.npy 파일을 메모리 매핑으로 불러오기"""
+        return cls(schema, np.load(path, mmap_mode="r"))
+
+    # ---------- 조회 ----------
+    def index(self, category_scores: Sequence[int]) -> Optional[int]:
+        """영역 점수(스키마 영역 순서)의 행 번호, 표 범위를 벗어나면 None"""
+        row = 0
+        for score, low, high, stride in zip(
+            category_scores, self._min_list, self._max_list, self._stride_list
+        ):
+            if not low <= score <= high:
+                return None
+            row += (score - low) * stride
+        return row
+
+    def lookup(self, category_scores: Sequence[int]) -> Optional[Tuple[int, List[int], List[int], List[int]]]:
+        """
+        영역 점수 조합의 결과, 표 범위를 벗어나면 None
+
+        Returns:
+            (레벨 코드, 강점, 약점, 학습 경로 영역 인덱스 목록)
+        """
+        row = self.index(category_scores)
+        if row is None:
+            return None
+        return self.unpack(self._view[row * ROW_WIDTH:(row + 1) * ROW_WIDTH].tolist())
+
+    def lookup_batch(self, category_scores: np.ndarray) -> np.ndarray:
+        """
+        영역 점수 행렬(N×영역 수)의 결과 행을 한 번에 조회
+
+        Returns:
+            (N, ROW_WIDTH) uint8 배열 (레벨 코드는 0열)
+
+        Raises:
+            ValueError: 표 범위를 벗어난 점수가 있을 때
+        """
+        offsets = np.asarray(category_scores, dtype=np.int64) - self.min_scores
+        if offsets.size and (offsets.min() < 0 or (offsets >= self.radix).any()):
+            raise ValueError("결과표 범위를 벗어난 영역 점수가 있습니다")
+        return np.asarray(self.rows)[offsets @ self.strides]
+
+    @staticmethod
+    def unpack(values: Sequence[int]) -> Tuple[int, List[int], List[int], List[int]]:
+        """결과 행 → (레벨 코드, 강점, 약점, 학습 경로) 영역 인덱스 목록"""
+        n = ai_skill_assessment.MAX_ANALYSIS_ITEMS
+        return (
+            values[0],
+            [j for j in values[1:1 + n] if j != NONE],
+            [j for j in values[1 + n:1 + 2 * n] if j != NONE],
+            [j for j in values[1 + 2 * n:] if j != NONE]
+        )
+
+    # ---------- 검증 ----------
+    def validate(self, sample_size: int = VALIDATION_SAMPLE_SIZE, seed: int = 0) -> None:
+        """
+        표본 행을 분석 메서드의 결과와 비교 (양 끝 행 포함)
+
+        Raises:
+            ValueError: 표와 실제 분석 결과가 다를 때
+        """
+        schema = self.schema
+        assessment = AISkillAssessment(schema)
+        rng = np.random.default_rng(seed)
+        sample = np.unique(np.concatenate([
+            [0, len(self.rows) - 1],
+            rng.integers(0, len(self.rows), size=min(sample_size, len(self.rows)))
+        ]))
+        name_index = {name: j for j, name in enumerate(schema.category_names)}
+        for row_number in sample.tolist():
+            category_scores = (
+                self.min_scores + (row_number // self.strides) % self.radix
+            ).tolist()
+            scores = assessment.calculate_scores(_responses_for(schema, category_scores))
+            expected = (
+                schema.level_names.index(scores["level"]),
+                [name_index[item["category"]] for item in assessment._identify_strengths(scores)],
+                [name_index[item["category"]] for item in assessment._identify_weaknesses(scores)],
+                [name_index[path["category"]] for path in assessment._create_learning_path(scores)]
+            )
+            if self.unpack(self.rows[row_number].tolist()) != expected:
+                raise ValueError(f"결과표 검증 실패: 영역 점수 {category_scores}")
+
+
+def _responses_for(schema: CompiledSchema, category_scores: Sequence[int]) -> dict:
+    """영역 점수가 주어진 값이 되는 응답 하나 만들기 (앞 문항부터 채움)"""
+    options = schema.likert_options
+    responses = {}
+    for q_ids, score in zip(schema.category_question_ids, category_scores):
+        remaining = score - len(q_ids) * options[0]
+        for q_id in q_ids:
+            step = min(remaining, options[-1] - options[0])
+            responses[q_id] = options[0] + step
+            remaining -= step
+    return responses
+
+
+def load_outcome_table(directory: str, schema: CompiledSchema = SCHEMA) -> OutcomeTable:
+    """
+    결과표 불러오기 (없거나 지문이 다르거나 검증에 실패하면 새로 생성)
+
+    Args:
+        directory: 결과표 파일(outcomes_<지문>.npy)을 둘 디렉토리
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"outcomes_{schema_fingerprint(schema)}.npy")
+    for stale in glob.glob(os.path.join(directory, "outcomes_*.npy")):
+        if stale != path:
+            os.remove(stale)
+
+    if os.path.exists(path):
+        try:
+            table = OutcomeTable.load(path, schema)
+            table.validate()
+            return table
+        except (ValueError, OSError, EOFError):
+            # 손상되었거나 분석 기준과 맞지 않는 파일은 새로 생성
+            pass
+
+    table = OutcomeTable.build(schema)
+    table.validate()
+    table.save(path)
+    return OutcomeTable.load(path, schema)
+
+
+# 프로세스 전체에서 공유하는 결과표 (Streamlit 재실행 간 유지)
+_shared_tables: Dict[Tuple[str, int], OutcomeTable] = {}
+_shared_lock = threading.Lock()
+
+
+def open_outcome_table(directory: str, schema: CompiledSchema = SCHEMA) -> OutcomeTable:
+    """디렉토리별 공유 결과표 (처음 한 번만 불러오거나 생성)"""
+    key = (os.path.abspath(directory), id(schema))
+    with _shared_lock:
+        table = _shared_tables.get(key)
+        if table is None:
+            table = _shared_tables[key] = load_outcome_table(directory, schema)
+        return table
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 압축 결과 레코드
+
+결과는 user_info/scores/category_scores/analysis가 중첩된 dict로 저장되며,
+영역명·설명·코멘트 같은 같은 문자열이 결과마다 복사되어 있습니다.
+여기의 레코드 타입은 __slots__로 필드만 보관하고,
+
+- 영역 점수는 영역 순서대로 1바이트씩 담은 고정 길이 배열(bytes)로,
+- 분석 문구는 복사하지 않고 레벨과 영역 점수로 상수표에서 다시 구성하며,
+- 원 응답은 문항 순서대로 1바이트씩 담은 bytes로,
+- 부서/직위/레벨처럼 반복되는 문자열은 intern하여 한 객체를 공유합니다.
+
+기존 JSON 형식과는 from_record()/to_record()로 상호 변환합니다.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment, CompiledSchema
+from schema_versions import record_schema_version
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class IndexEntry:
+    """
+    로그 저장소의 요약 인덱스 항목
+
+    summarize() 결과 + 로그 위치(offset/length). ResultFilter.matches 등
+    기존 코드가 entry["department"]처럼 접근하므로 dict식 조회도 지원합니다.
+    """
+
+    __slots__ = ("id", "name", "department", "position", "score", "level", "timestamp",
+                 "offset", "length")
+
+    def __init__(self, id: str, name: str, department: str, position: str, score: int,
+                 level: str, timestamp: str, offset: int, length: int):
+        self.id = id
+        self.name = name
+        self.department = _intern(department)
+        self.position = _intern(position)
+        self.score = score
+        self.level = _intern(level)
+        self.timestamp = timestamp
+        self.offset = offset
+        self.length = length
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "IndexEntry":
+        return cls(**{field: data[field] for field in cls.__slots__})
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __getitem__(self, field: str):
+        return getattr(self, field)
+
+    def __repr__(self) -> str:
+        return f"IndexEntry({self.to_dict()!r})"
+
+
+class CompactResult:
+    """
+    진단 결과 1건의 압축 표현
+
+    분석이 레벨과 영역 점수로 다시 만든 분석과 같으면 보관하지 않고
+    (analysis=None), 문구가 바뀌기 전에 저장된 결과 등 다를 때만 원본을 둡니다.
+    """
+
+    __slots__ = ("id", "name", "department", "position", "timestamp", "level_code",
+                 "category_scores", "responses", "analysis")
+
+    def __init__(self, id: str, name: str, department: str, position: str, timestamp: str,
+                 level_code: int, category_scores: bytes, responses: Optional[bytes] = None,
+                 analysis: Optional[Dict] = None):
+        self.id = id
+        self.name = name
+        self.department = _intern(department)
+        self.position = _intern(position)
+        self.timestamp = timestamp
+        self.level_code = level_code
+        self.category_scores = category_scores
+        self.responses = responses
+        self.analysis = analysis
+
+    @property
+    def total_score(self) -> int:
+        return sum(self.category_scores)
+
+    def level(self, schema: CompiledSchema = SCHEMA) -> str:
+        return schema.level_names[self.level_code]
+
+    # ---------- 변환 ----------
+    @classmethod
+    def from_record(cls, record: Dict, schema: CompiledSchema = SCHEMA) -> "CompactResult":
+        """
+        저장 형식 dict({id, user_info, scores, analysis})에서 변환
+
+        Raises:
+            ValueError: 영역/문항 구성이 스키마와 다르거나 총점이 맞지 않을 때
+        """
+        scores = record["scores"]
+        stored = scores["category_scores"]
+        if set(stored) != set(schema.category_ids):
+            raise ValueError(f"영역 구성이 스키마와 다릅니다: {sorted(stored)}")
+        category_scores = bytes(stored[cat_id]["score"] for cat_id in schema.category_ids)
+        if sum(category_scores) != scores["total_score"]:
+            raise ValueError(f"총점({scores['total_score']})이 영역 점수 합과 다릅니다")
+        responses = record.get("responses")
+        if responses is not None:
+            version = record_schema_version(record)
+            if version != schema.version:
+                raise ValueError(f"응답의 문항 구성 버전({version})이 스키마({schema.version})와 다릅니다")
+            responses = schema.response_bytes(responses)
+
+        user_info = record.get("user_info", {})
+        compact = cls(
+            id=record.get("id", ""),
+            name=user_info.get("name", ""),
+            department=user_info.get("department", ""),
+            position=user_info.get("position", ""),
+            timestamp=scores.get("timestamp", ""),
+            level_code=schema.level_names.index(scores["level"]),
+            category_scores=category_scores,
+            responses=responses
+        )
+        analysis = record.get("analysis")
+        if analysis and analysis != compact.build_analysis(schema):
+            compact.analysis = analysis
+        return compact
+
+    def build_scores(self, schema: CompiledSchema = SCHEMA) -> Dict:
+        """calculate_scores 형식의 점수 dict 재구성"""
+        category_scores = {}
+        for j, cat_id in enumerate(schema.category_ids):
+            score = self.category_scores[j]
+            category_scores[cat_id] = {
+                "name": schema.category_names[j],
+                "score": score,
+                "max_score": schema.category_max_list[j],
+                "percentage": float(schema.category_percentage_tables[j][score])
+            }
+        total_score = self.total_score
+        return {
+            "total_score": total_score,
+            "total_max": schema.total_max,
+            "percentage": float(schema.total_percentage_table[total_score]),
+            "level": schema.level_names[self.level_code],
+            "category_scores": category_scores,
+            "timestamp": self.timestamp
+        }
+
+    def build_analysis(self, schema: CompiledSchema = SCHEMA, scores: Optional[Dict] = None) -> Dict:
+        """분석 재구성 (보관된 원본이 있으면 원본)"""
+        if self.analysis is not None:
+            return self.analysis
+        return AISkillAssessment(schema).generate_analysis(scores or self.build_scores(schema))
+
+    def to_record(self, schema: CompiledSchema = SCHEMA) -> Dict:
+        """저장 형식 dict로 변환"""
+        scores = self.build_scores(schema)
+        record = {
+            "id": self.id,
+            "user_info": {
+                "name": self.name,
+                "department": self.department,
+                "position": self.position
+            },
+            "scores": scores,
+            "analysis": self.build_analysis(schema, scores)
+        }
+        if self.responses is not None:
+            record["responses"] = "".join(map(str, self.responses))
+            record["schema_version"] = schema.version
+        return record
+
+    def __repr__(self) -> str:
+        return (f"CompactResult(id={self.id!r}, name={self.name!r}, "
+                f"scores={list(self.category_scores)}, level_code={self.level_code})")
+
+
+def load_compact_results(records: Iterable[Dict], schema: CompiledSchema = SCHEMA) -> List[CompactResult]:
+    """저장소의 iter_records() 등에서 압축 결과 목록 만들기"""
+    return [CompactResult.from_record(record, schema) for record in records]
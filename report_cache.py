@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - HTML 리포트 캐시
+
+리포트 내용을 결정하는 입력(결과 ID, 템플릿 버전, 작성일, 사용자 정보,
+점수, 분석)의 해시를 키로 생성된 HTML을 메모리와 디스크에 보관합니다.
+같은 결과 페이지를 다시 열면 렌더링 없이 캐시에서 바로 돌려줍니다.
+
+- 메모리와 디스크 모두 LRU 방식으로 크기 상한을 넘으면 오래된 것부터 제거
+- 디스크 캐시는 템플릿 버전별 하위 디렉토리에 두며, generate_html_report.py가
+  바뀌면 이전 버전 디렉토리를 지우고 새로 시작
+"""
+
+import hashlib
+import marshal
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from generate_html_report import TEMPLATE_VERSION, generate_html_report
+
+
+def report_key(result_id: str, user_info: Dict, scores: Dict, analysis: Dict,
+               report_date: Optional[str] = None) -> str:
+    """
+    리포트 내용 해시 (리포트 작성일도 본문에 들어가므로 키에 포함)
+
+    렌더링 자체가 수십 µs이므로 JSON 직렬화 대신 참조 기록이 없는 marshal
+    버전 2를 사용합니다. 내용과 키 순서가 같으면 같은 바이트가 나오며,
+    저장소에서 읽은 결과도 저장 당시 키 순서를 유지합니다.
+    """
+    report_date = report_date or datetime.now().strftime("%Y-%m-%d")
+    payload = marshal.dumps(
+        [result_id, TEMPLATE_VERSION, report_date, user_info, scores, analysis], 2
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ReportCache:
+    """메모리 + 디스크 2단계 LRU 리포트 캐시"""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_memory_bytes: int = 16 * 1024 * 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Args:
+            directory: 디스크 캐시 위치 (None이면 메모리만 사용)
+            max_memory_bytes: 메모리 캐시 상한 (UTF-8 기준 바이트)
+            max_disk_bytes: 디스크 캐시 상한
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.directory = None
+        if directory is not None:
+            self.directory = os.path.join(directory, TEMPLATE_VERSION)
+            self._load_disk_index(directory)
+
+    # ---------- 디스크 ----------
+    def _load_disk_index(self, root: str) -> None:
+        """이전 템플릿 버전 캐시 삭제 후 현재 버전 파일을 접근 시각 순으로 등록"""
+        os.makedirs(self.directory, exist_ok=True)
+        for name in os.listdir(root):
+            path = os.path.join(root, name)
+            if name != TEMPLATE_VERSION and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".html"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, name[:-5], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.html")
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if self.directory is None or key not in self._disk:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                html = f.read()
+            os.utime(path)  # 재시작 후에도 LRU 순서를 유지하도록 접근 시각 갱신
+        except FileNotFoundError:
+            self._disk_bytes -= self._disk.pop(key)
+            return None
+        self._disk.move_to_end(key)
+        return html
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self.directory is None or key in self._disk:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._disk_path(key))
+            except FileNotFoundError:
+                pass
+
+    # ---------- 메모리 ----------
+    def _remember(self, key: str, html: str, size: int) -> None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = html
+        self._memory_sizes[key] = size
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            old_key, _ = self._memory.popitem(last=False)
+            self._memory_bytes -= self._memory_sizes.pop(old_key)
+
+    # ---------- 조회 ----------
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 리포트 (없으면 None, 적중/실패 횟수 집계)"""
+        with self._lock:
+            html = self._memory.get(key)
+            if html is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return html
+            html = self._read_disk(key)
+            if html is not None:
+                self._remember(key, html, len(html.encode("utf-8")))
+                self.hits += 1
+                self.disk_hits += 1
+                return html
+            self.misses += 1
+            return None
+
+    def put(self, key: str, html: str) -> None:
+        data = html.encode("utf-8")
+        with self._lock:
+            self._remember(key, html, len(data))
+            self._write_disk(key, data)
+
+    def get_or_render(self, result_id: str, user_info: Dict, scores: Dict, analysis: Dict) -> str:
+        """캐시에 있으면 그대로, 없으면 리포트를 생성해 캐시에 저장 후 반환"""
+        key = report_key(result_id, user_info, scores, analysis)
+        html = self.get(key)
+        if html is None:
+            html = generate_html_report(user_info, scores, analysis)
+            self.put(key, html)
+        return html
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 모두 비우기"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_sizes.clear()
+            self._memory_bytes = 0
+            for key in list(self._disk):
+                try:
+                    os.remove(self._disk_path(key))
+                except FileNotFoundError:
+                    pass
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict:
+        """적중/실패 횟수와 사용량"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes
+            }
+
+
+# 프로세스 전체에서 공유하는 캐시 인스턴스 (Streamlit 재실행 간 유지)
+_shared_caches: Dict[Optional[str], ReportCache] = {}
+_shared_lock = threading.Lock()
+
+
+def open_report_cache(directory: Optional[str] = None) -> ReportCache:
+    """디렉토리별 공유 리포트 캐시"""
+    key = os.path.abspath(directory) if directory is not None else None
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = ReportCache(directory)
+        return cache
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - HTML 리포트 일괄 내보내기
+
+저장소의 결과를 순서대로 읽어 프로세스 풀에서 리포트를 병렬 생성하고
+출력 디렉토리에 파일로 기록합니다.
+
+- 동시에 처리 중인 묶음 수를 제한하고, 리포트 HTML은 작업 프로세스가
+  직접 파일로 쓰므로 결과 수와 관계없이 메모리 사용량이 일정합니다.
+- 완료된 리포트는 매니페스트(.export_manifest.jsonl)에 결과 지문과 함께
+  기록되어, 중단된 작업을 이어서 실행하거나 이미 최신인 리포트를 건너뜁니다.
+- ZIP 내보내기는 임시 파일 없이 리포트를 하나씩 압축해 바이트 조각으로
+  흘려보내므로, 리포트 수가 늘어도 한 번에 리포트 한 건만 메모리에 둡니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ai_skill_assessment import AISkillAssessment
+from generate_html_report import TEMPLATE_VERSION, generate_html_report
+from result_store import (
+    ResultFilter, ResultRepository, iter_matching_records, open_result_store, summarize
+)
+
+MANIFEST_FILENAME = ".export_manifest.jsonl"
+
+
+def report_filename(record: Dict) -> str:
+    """리포트 파일명 (Streamlit 다운로드 파일명과 같은 형식)"""
+    name = re.sub(r'[\\/:*?"<>|\s]+', "_", record["user_info"].get("name", "")) or "무명"
+    return f"AI역량진단_{name}_{record['id']}.html"
+
+
+def record_fingerprint(record: Dict) -> str:
+    """리포트 내용을 결정하는 입력(결과 + 템플릿 버전)의 지문"""
+    payload = json.dumps(
+        [TEMPLATE_VERSION, record["user_info"], record["scores"], record.get("analysis")],
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def render_record(record: Dict) -> str:
+    """저장된 결과 한 건의 리포트 생성 (분석이 없는 이전 결과는 분석을 다시 생성)"""
+    analysis = record.get("analysis") or AISkillAssessment().generate_analysis(record["scores"])
+    return generate_html_report(record["user_info"], record["scores"], analysis)
+
+
+def _render_chunk(records: List[Dict], output_dir: str) -> List[Tuple[str, str, str]]:
+    """작업 프로세스: 리포트 묶음을 생성해 파일로 기록 → (결과 ID, 지문, 파일명) 목록"""
+    done = []
+    for record in records:
+        filename = report_filename(record)
+        path = os.path.join(output_dir, filename)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(render_record(record))
+        os.replace(tmp_path, path)
+        done.append((record["id"], record_fingerprint(record), filename))
+    return done
+
+
+def load_manifest(output_dir: str) -> Dict[str, Tuple[str, str]]:
+    """매니페스트 읽기 → {결과 ID: (지문, 파일명)} (같은 ID는 마지막 기록)"""
+    manifest = {}
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return manifest
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            manifest[entry["id"]] = (entry["fingerprint"], entry["file"])
+    return manifest
+
+
+def _chunks(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def print_progress(done: int, skipped: int, total: int, elapsed: float) -> None:
+    """기본 진행 상황 출력"""
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"\r  {done + skipped}/{total} (생성 {done}, 건너뜀 {skipped}) {rate:.0f}건/초",
+          end="", file=sys.stderr, flush=True)
+
+
+def export_reports(
+    store: ResultRepository,
+    output_dir: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 50,
+    resume: bool = True,
+    filters: Optional[ResultFilter] = None,
+    progress: Optional[Callable[[int, int, int, float], None]] = print_progress
+) -> Dict:
+    """
+    저장소의 결과 리포트를 일괄 생성
+
+    Args:
+        store: 결과 저장소
+        output_dir: 리포트 출력 디렉토리
+        workers: 작업 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 처리)
+        chunk_size: 작업 프로세스에 한 번에 넘기는 결과 수
+        resume: True면 매니페스트 기준으로 최신 리포트를 건너뜀
+        filters: 지정 시 조건에 맞는 결과만 내보냄
+        progress: 진행 상황 콜백 (생성, 건너뜀, 전체, 경과 초)
+
+    Returns:
+        {"rendered": 생성 수, "skipped": 건너뛴 수, "elapsed": 소요 초}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir) if resume else {}
+    total = len(store)
+    workers = workers or os.cpu_count() or 1
+    rendered = 0
+    skipped = 0
+    start = time.perf_counter()
+
+    def pending_records() -> Iterator[Dict]:
+        nonlocal skipped
+        for record in store.iter_records():
+            if filters is not None and not filters.matches(summarize(record["id"], record)):
+                skipped += 1
+                continue
+            previous = manifest.get(record["id"])
+            if (previous is not None
+                    and previous[0] == record_fingerprint(record)
+                    and os.path.exists(os.path.join(output_dir, previous[1]))):
+                skipped += 1
+                continue
+            yield record
+
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), "a", encoding="utf-8") as manifest_file:
+        def record_done(done: List[Tuple[str, str, str]]) -> None:
+            nonlocal rendered
+            for result_id, fingerprint, filename in done:
+                manifest_file.write(json.dumps(
+                    {"id": result_id, "fingerprint": fingerprint, "file": filename},
+                    ensure_ascii=False
+                ) + "\n")
+            manifest_file.flush()
+            rendered += len(done)
+            if progress is not None:
+                progress(rendered, skipped, total, time.perf_counter() - start)
+
+        chunks = _chunks(pending_records(), chunk_size)
+        if workers == 1:
+            for chunk in chunks:
+                record_done(_render_chunk(chunk, output_dir))
+        else:
+            # 처리 중인 묶음 수를 제한해 결과를 한꺼번에 메모리에 올리지 않음
+            max_in_flight = workers * 2
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                in_flight = set()
+                for chunk in chunks:
+                    in_flight.add(pool.submit(_render_chunk, chunk, output_dir))
+                    if len(in_flight) >= max_in_flight:
+                        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            record_done(future.result())
+                for future in in_flight:
+                    record_done(future.result())
+
+    if progress is not None:
+        progress(rendered, skipped, total, time.perf_counter() - start)
+        print(file=sys.stderr)
+    return {"rendered": rendered, "skipped": skipped, "elapsed": time.perf_counter() - start}
+
+
+class _ChunkWriter:
+    """zipfile이 쓴 바이트를 모아 두었다가 조각 단위로 내주는 쓰기 전용 버퍼"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip_archive(records: Iterable[Dict]) -> Iterator[bytes]:
+    """
+    결과 리포트를 ZIP 아카이브 바이트 조각으로 스트리밍
+
+    출력이 탐색 불가능한 스트림이므로 zipfile이 각 항목 뒤에 데이터
+    디스크립터를 기록합니다. 리포트는 한 건씩 생성·압축 후 바로 내보냅니다.
+    """
+    buffer = _ChunkWriter()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for record in records:
+            html = render_record(record).encode("utf-8")
+            info = zipfile.ZipInfo(report_filename(record), date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, "w") as member:
+                member.write(html)
+            yield buffer.take()
+    # 중앙 디렉토리
+    yield buffer.take()
+
+
+def write_zip_archive(records: Iterable[Dict], fileobj) -> int:
+    """ZIP 아카이브를 파일 객체에 스트리밍으로 기록 → 기록한 바이트 수"""
+    written = 0
+    for chunk in iter_zip_archive(records):
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="저장된 진단 결과의 HTML 리포트 일괄 생성")
+    parser.add_argument("output", help="리포트 출력 디렉토리 (--zip이면 ZIP 파일 경로, '-'는 표준 출력)")
+    parser.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+    parser.add_argument("--workers", type=int, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunk-size", type=int, default=50, help="작업 단위 결과 수 (기본: 50)")
+    parser.add_argument("--department", help="해당 부서 결과만 내보내기")
+    parser.add_argument("--no-resume", action="store_true", help="이미 생성된 리포트도 다시 생성")
+    parser.add_argument("--zip", action="store_true", help="리포트를 ZIP 아카이브 하나로 스트리밍")
+    args = parser.parse_args(argv)
+
+    store = open_result_store(args.store, args.backend, shared=False)
+    filters = ResultFilter(department=args.department) if args.department else None
+
+    if args.zip:
+        records = iter_matching_records(store, filters)
+        if args.output == "-":
+            written = write_zip_archive(records, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.output, "wb") as f:
+                written = write_zip_archive(records, f)
+        print(f"✅ ZIP 아카이브 {written / 1024:.0f}KB 기록", file=sys.stderr)
+        return
+
+    stats = export_reports(
+        store, args.output,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        resume=not args.no_resume,
+        filters=filters
+    )
+    print(f"✅ 리포트 {stats['rendered']}건 생성, {stats['skipped']}건 건너뜀 "
+          f"({stats['elapsed']:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 저장된 결과 일괄 재채점
+
+결과와 함께 보관한 원 응답으로 현재 ASSESSMENT_DATA/LEVEL_CRITERIA 기준의
+점수를 다시 계산하고, 영역 점수나 레벨이 달라졌거나 이전 문항 구성 버전으로
+저장된 결과를 새 점수와 분석으로 덮어씁니다.
+
+1. 저장소를 한 번 순회하며 응답 문자열, 문항 구성 버전, 저장된 영역
+   점수/레벨만 모음
+2. 버전별로 응답 행렬을 chunk_size 행씩 현재 문항 구성으로 변환
+   (schema_versions.translate_responses)한 뒤 calculate_scores_batch로
+   재채점하고 저장된 값과 배열 단위로 비교
+3. 바뀐 결과만 현재 버전 응답과 함께 chunk_size건씩 save_many로 덮어씀
+   (순회가 끝난 뒤 기록하므로 로그 저장소도 안전)
+
+원 응답이 없거나(응답 보관 이전 결과) 변환 규칙이 없는 버전의 결과는
+건너뜁니다. 진단 일시는 원래 값을 유지합니다.
+
+사용법:
+    python rescore.py [--dry-run] [--store results] [--backend log]
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ai_skill_assessment import SCHEMA, AISkillAssessment, CompiledSchema
+from result_store import ResultRepository, open_result_store
+from schema_versions import get_schema, record_schema_version, translate_responses
+
+# 저장된 점수의 영역 구성이 현재 스키마와 다를 때 영역 점수 자리에 넣는 값
+UNKNOWN_SCORE = -1
+
+
+class _Collected:
+    """1단계에서 모은 재채점 대상 (결과당 응답 문자열 + 저장된 점수 요약)"""
+
+    def __init__(self, schema: CompiledSchema):
+        self.schema = schema
+        self.ids: List[str] = []
+        self.codes: List[str] = []
+        self.versions: List[int] = []
+        self.levels: List[str] = []
+        self.total_max: List[int] = []
+        self.category_scores: List[List[int]] = []
+        self.skipped = Counter()
+
+    def add(self, record: Dict) -> None:
+        schema = self.schema
+        if record.get("responses") is None:
+            self.skipped["응답 없음"] += 1
+            return
+        version = record_schema_version(record)
+        if version is None:
+            self.skipped["문항 구성 버전 알 수 없음"] += 1
+            return
+        scores = record["scores"]
+        stored = scores["category_scores"]
+        self.ids.append(record["id"])
+        self.codes.append(record["responses"])
+        self.versions.append(version)
+        self.levels.append(scores["level"])
+        self.total_max.append(scores.get("total_max", 0))
+        if tuple(stored) == schema.category_ids:
+            self.category_scores.append([stored[cat_id]["score"] for cat_id in schema.category_ids])
+        else:
+            self.category_scores.append([UNKNOWN_SCORE] * len(schema.category_ids))
+
+    def groups(self) -> Dict[int, np.ndarray]:
+        """버전 → 해당 버전 결과의 행 번호"""
+        versions = np.array(self.versions, dtype=np.int64)
+        return {int(v): np.flatnonzero(versions == v) for v in np.unique(versions)}
+
+
+def rescore_store(
+    store: ResultRepository,
+    schema: CompiledSchema = SCHEMA,
+    dry_run: bool = False,
+    chunk_size: int = 10000,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Dict:
+    """
+    저장소 전체를 현재 스키마로 재채점
+
+    Args:
+        schema: 재채점 기준 (저장할 때는 현재 버전 SCHEMA와 같은 버전이어야 함)
+        dry_run: True면 바뀔 결과만 세고 저장하지 않음
+        chunk_size: 한 번에 재채점할 행 수
+        progress: (처리한 행 수, 전체 행 수)를 받는 콜백
+
+    Returns:
+        {"total", "rescored", "changed", "skipped", "migrated", "level_changes", "elapsed"}
+        migrated는 이전 버전 → 건수, level_changes는 "이전 레벨 → 새 레벨" → 건수
+    """
+    if not dry_run and schema.version != SCHEMA.version:
+        raise ValueError(f"결과는 현재 버전({SCHEMA.version}) 기준으로만 다시 저장할 수 있습니다")
+    start = time.perf_counter()
+    assessment = AISkillAssessment(schema)
+    collected = _Collected(schema)
+    total = 0
+    for record in store.iter_records():
+        collected.add(record)
+        total += 1
+
+    changed_ids: List[str] = []
+    changed_rows: List[np.ndarray] = []
+    level_changes = Counter()
+    migrated = Counter()
+    done = 0
+    for version, rows in collected.groups().items():
+        # 변환 규칙이 없는 버전은 빈 행렬로 먼저 확인해 통째로 건너뜀
+        try:
+            source = schema if version == schema.version else get_schema(version)
+            translate_responses(np.zeros((0, source.num_questions), dtype=np.uint8), version, schema)
+        except (KeyError, ValueError):
+            collected.skipped[f"{version} 버전 변환 규칙 없음"] += len(rows)
+            continue
+
+        for begin in range(0, len(rows), chunk_size):
+            chunk = rows[begin:begin + chunk_size]
+            matrix = translate_responses(
+                source.decode_response_matrix([collected.codes[i] for i in chunk.tolist()]),
+                version, schema
+            )
+            batch = assessment.calculate_scores_batch(matrix)
+            stored_scores = np.array([collected.category_scores[i] for i in chunk.tolist()], dtype=np.int64)
+            stored_levels = np.array([collected.levels[i] for i in chunk.tolist()], dtype=object)
+            stored_max = np.array([collected.total_max[i] for i in chunk.tolist()], dtype=np.int64)
+            changed = (
+                (stored_scores != batch["category_scores"]).any(axis=1)
+                | (stored_levels != batch["level"])
+                | (stored_max != schema.total_max)
+                | (version != schema.version)
+            )
+            for i in np.flatnonzero(changed).tolist():
+                changed_ids.append(collected.ids[chunk[i]])
+                changed_rows.append(matrix[i])
+                level_changes[(stored_levels[i], batch["level"][i])] += 1
+            if version != schema.version:
+                migrated[version] += len(chunk)
+            done += len(chunk)
+            if progress:
+                progress(done, len(collected.ids))
+
+    if not dry_run and changed_ids:
+        _apply(store, assessment, changed_ids, np.array(changed_rows), chunk_size)
+
+    return {
+        "total": total,
+        "rescored": done,
+        "changed": len(changed_ids),
+        "skipped": dict(collected.skipped),
+        "migrated": dict(migrated),
+        "level_changes": {
+            f"{old} → {new}": count for (old, new), count in level_changes.most_common() if old != new
+        },
+        "elapsed": time.perf_counter() - start
+    }
+
+
+def _apply(
+    store: ResultRepository,
+    assessment: AISkillAssessment,
+    result_ids: List[str],
+    matrix: np.ndarray,
+    chunk_size: int
+) -> None:
+    """
+    바뀐 결과에 새 점수/분석과 현재 버전 응답 저장 (진단 일시는 유지)
+
+    chunk_size건씩 save_many로 덮어쓰므로 저장소 잠금/트랜잭션과 집계 기록은
+    묶음당 한 번입니다.
+    """
+    schema = assessment.schema
+    for begin in range(0, len(result_ids), chunk_size):
+        chunk_ids = result_ids[begin:begin + chunk_size]
+        chunk = matrix[begin:begin + chunk_size]
+        batch = assessment.calculate_scores_batch(chunk)
+        items = []
+        saved_ids = []
+        for result_id, scores, values in zip(
+            chunk_ids, assessment.iter_batch_scores(batch, timestamp=""), chunk.tolist()
+        ):
+            record = store.get(result_id)
+            if record is None:
+                continue
+            scores["timestamp"] = record["scores"].get("timestamp", "")
+            responses = {q_id: value for q_id, value in zip(schema.question_ids, values) if value}
+            items.append((record["user_info"], scores, assessment.generate_analysis(scores), responses))
+            saved_ids.append(result_id)
+        if items:
+            store.save_many(items, result_ids=saved_ids)
+
+
+def print_progress(done: int, total: int) -> None:
+    """기본 진행 상황 출력"""
+    print(f"\r  재채점 {done}/{total}", end="", file=sys.stderr, flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="저장된 원 응답으로 전체 결과를 현재 기준에 맞게 재채점")
+    parser.add_argument("--dry-run", action="store_true", help="바뀔 결과만 집계하고 저장하지 않음")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="한 번에 재채점할 결과 수")
+    parser.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+    parser.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+    args = parser.parse_args(argv)
+
+    store = open_result_store(args.store, args.backend, shared=False)
+    summary = rescore_store(store, dry_run=args.dry_run, chunk_size=args.chunk_size,
+                            progress=print_progress)
+    print(file=sys.stderr)
+
+    verb = "변경 대상" if args.dry_run else "갱신"
+    print(f"✅ 전체 {summary['total']}건 중 {summary['rescored']}건 재채점, "
+          f"{verb} {summary['changed']}건 ({summary['elapsed']:.2f}초)")
+    for version, count in summary["migrated"].items():
+        print(f"   {version} → {SCHEMA.version} 버전 변환: {count}건")
+    for reason, count in summary["skipped"].items():
+        print(f"   건너뜀 ({reason}): {count}건")
+    for change, count in summary["level_changes"].items():
+        print(f"   레벨 {change}: {count}건")
+
+
+if __name__ == "__main__":
+    main()
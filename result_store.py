@@ -0,0 +1,775 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 결과 저장소
+
+진단 결과를 추가 전용(append-only) 로그 파일에 한 줄씩 기록하고,
+관리자 페이지에 필요한 요약 필드만 담은 인덱스 파일을 따로 유지합니다.
+
+    results.log       전체 결과 (JSON Lines)
+    results.idx       요약 + 로그 내 위치 (JSON Lines)
+    results.agg.json  누적 집계 (aggregates.py)
+
+인덱스만 읽으면 목록을 만들 수 있고, 개별 결과는 위치 정보로 바로 읽습니다.
+
+저장소 구현은 ResultRepository 인터페이스를 따르며, open_result_store가
+설정(환경 변수)에 따라 로그 저장소 또는 SQLite 저장소(sqlite_store.py)를 엽니다.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aggregates import RunningAggregates, read_aggregates_file, write_aggregates_file
+from ai_skill_assessment import SCHEMA
+from records import IndexEntry
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOG_FILENAME = "results.log"
+INDEX_FILENAME = "results.idx"
+AGGREGATES_FILENAME = "results.agg.json"
+# 저장소가 직접 쓰는 파일 (기존 결과 가져오기에서 제외)
+STORE_FILENAMES = frozenset((LOG_FILENAME, INDEX_FILENAME, AGGREGATES_FILENAME))
+LEGACY_RESULT_KEYS = ("user_info", "scores", "analysis")
+
+# 저장소 설정 환경 변수
+BACKEND_ENV = "AI_ASSESSMENT_STORE_BACKEND"   # "log"(기본) 또는 "sqlite"
+LOCATION_ENV = "AI_ASSESSMENT_STORE_PATH"     # 로그 디렉토리 또는 SQLite 파일 경로
+
+# 관리자 목록 정렬 옵션: 키 → (표시명, 정렬 필드, 내림차순 여부)
+SORT_OPTIONS = {
+    "newest": ("최신순", "id", True),
+    "oldest": ("오래된순", "id", False),
+    "score_desc": ("점수 높은순", "score", True),
+    "score_asc": ("점수 낮은순", "score", False),
+    "name": ("이름순", "name", False)
+}
+
+
+@dataclass
+class ResultFilter:
+    """관리자 목록 필터 (None은 조건 없음, 날짜는 양 끝 포함)"""
+    department: Optional[str] = None
+    level: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    def matches(self, entry: Dict) -> bool:
+        """인덱스 요약 항목이 조건을 만족하는지 확인"""
+        if self.department is not None and entry["department"] != self.department:
+            return False
+        if self.level is not None and entry["level"] != self.level:
+            return False
+        day = entry["timestamp"][:10]
+        if self.date_from is not None and day < self.date_from.isoformat():
+            return False
+        if self.date_to is not None and day > self.date_to.isoformat():
+            return False
+        return True
+
+
+def new_result_id(now: Optional[datetime] = None) -> str:
+    """충돌 없는 결과 ID 생성 (시간순 정렬 가능)"""
+    now = now or datetime.now()
+    return f"{now.strftime('%Y%m%d_%H%M%S_%f')}_{uuid.uuid4().hex[:8]}"
+
+
+def summarize(result_id: str, result_data: Dict) -> Dict:
+    """결과 데이터에서 인덱스용 요약 필드 추출"""
+    user_info = result_data.get("user_info", {})
+    scores = result_data["scores"]
+    return {
+        "id": result_id,
+        "name": user_info.get("name", ""),
+        "department": user_info.get("department", ""),
+        "position": user_info.get("position", ""),
+        "score": scores["total_score"],
+        "level": scores["level"],
+        "timestamp": scores.get("timestamp", "")
+    }
+
+
+def build_record(
+    user_info: Dict,
+    scores: Dict,
+    analysis: Dict,
+    responses: Optional[Dict[str, int]] = None
+) -> Dict:
+    """저장 형식의 결과 dict (응답은 문항당 1바이트 문자열과 문항 구성 버전으로 보관)"""
+    record = {"user_info": user_info, "scores": scores, "analysis": analysis}
+    if responses is not None:
+        record["responses"] = SCHEMA.encode_responses(responses)
+        record["schema_version"] = SCHEMA.version
+    return record
+
+
+def summary_to_result(entry: Dict) -> Dict:
+    """인덱스 요약을 load_all_results 형식으로 변환"""
+    return {
+        "id": entry["id"],
+        "user_info": {
+            "name": entry["name"],
+            "department": entry["department"],
+            "position": entry["position"]
+        },
+        "score": entry["score"],
+        "level": entry["level"],
+        "timestamp": entry["timestamp"]
+    }
+
+
+def empty_statistics() -> Dict:
+    """결과가 없을 때의 관리자 통계"""
+    return {
+        "total_count": 0,
+        "avg_score": 0.0,
+        "level_counts": dict.fromkeys(SCHEMA.level_names, 0)
+    }
+
+
+class ResultRepository(ABC):
+    """결과 저장소 인터페이스"""
+
+    @abstractmethod
+    def save(
+        self,
+        user_info: Dict,
+        scores: Dict,
+        analysis: Dict,
+        result_id: Optional[str] = None,
+        responses: Optional[Dict[str, int]] = None
+    ) -> str:
+        """결과 저장 후 결과 ID 반환 (responses를 주면 원 응답도 함께 보관)"""
+
+    def save_many(
+        self,
+        items: Iterable[Tuple[Dict, Dict, Optional[Dict], Optional[Dict[str, int]]]],
+        result_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        여러 결과를 한 번에 저장 후 결과 ID 목록 반환
+
+        Args:
+            items: (user_info, scores, analysis, responses) 목록
+            result_ids: 항목별 결과 ID (주면 같은 ID의 결과를 덮어쓰고, 없으면 새 ID)
+        """
+        items, result_ids = pair_result_ids(items, result_ids)
+        return [
+            self.save(user_info, scores, analysis, result_id=result_id, responses=responses)
+            for (user_info, scores, analysis, responses), result_id in zip(items, result_ids)
+        ]
+
+    @abstractmethod
+    def get(self, result_id: str) -> Optional[Dict]:
+        """결과 ID로 전체 결과 조회"""
+
+    @abstractmethod
+    def summaries(self) -> List[Dict]:
+        """전체 결과 요약 (최신순, load_all_results 형식)"""
+
+    @abstractmethod
+    def query(
+        self,
+        filters: Optional[ResultFilter] = None,
+        sort: str = "newest",
+        offset: int = 0,
+        limit: int = 20
+    ) -> List[Dict]:
+        """조건에 맞는 결과 요약 한 페이지 (load_all_results 형식)"""
+
+    @abstractmethod
+    def count(self, filters: Optional[ResultFilter] = None) -> int:
+        """조건에 맞는 결과 수"""
+
+    @abstractmethod
+    def departments(self) -> List[str]:
+        """저장된 결과의 부서 목록 (정렬)"""
+
+    @abstractmethod
+    def statistics(self, filters: Optional[ResultFilter] = None) -> Dict:
+        """관리자 통계 (총 인원, 평균 점수, 레벨별 인원)"""
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[Dict]:
+        """전체 결과 스트리밍 (각 항목에 id 포함)"""
+
+    @abstractmethod
+    def aggregates(self) -> RunningAggregates:
+        """저장된 누적 집계 (읽기 전용으로 사용)"""
+
+    @abstractmethod
+    def rebuild_aggregates(self) -> RunningAggregates:
+        """전체 결과에서 누적 집계를 다시 계산하여 저장"""
+
+    def refresh(self) -> None:
+        """외부 변경 사항 반영 (캐시가 없는 저장소는 할 일 없음)"""
+
+    def invalidate(self) -> None:
+        """캐시 비우기 (캐시가 없는 저장소는 할 일 없음)"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __contains__(self, result_id: str) -> bool:
+        ...
+
+
+def pair_result_ids(
+    items: Iterable[Tuple],
+    result_ids: Optional[List[str]]
+) -> Tuple[List[Tuple], List[Optional[str]]]:
+    """save_many 인자 정리 (result_ids가 없으면 항목마다 None)"""
+    items = list(items)
+    if result_ids is None:
+        return items, [None] * len(items)
+    if len(result_ids) != len(items):
+        raise ValueError(f"결과 ID 수({len(result_ids)})가 항목 수({len(items)})와 다릅니다")
+    return items, list(result_ids)
+
+
+def _parse_record(line: bytes) -> Dict:
+    """로그의 JSON 줄 → 결과 dict (id 제외)"""
+    record = json.loads(line)
+    record.pop("id", None)
+    return record
+
+
+class LogResultStore(ResultRepository):
+    """
+    추가 전용 로그 + 요약 인덱스 기반 결과 저장소
+
+    요약 인덱스는 메모리에 캐시되며, 읽기 전에 인덱스 파일 상태를 확인해
+    다른 프로세스가 추가한 줄만 이어서 읽습니다 (새 항목 수에 비례하는 비용).
+    get()으로 읽은 전체 결과는 크기가 제한된 LRU 캐시에 보관합니다.
+    """
+
+    def __init__(self, directory: str = "results", record_cache_size: int = 256):
+        self.directory = directory
+        self.log_path = os.path.join(directory, LOG_FILENAME)
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self.aggregates_path = os.path.join(directory, AGGREGATES_FILENAME)
+        self.record_cache_size = record_cache_size
+        self._lock = threading.RLock()
+        self._index: Dict[str, IndexEntry] = {}
+        self._records: "OrderedDict[str, bytes]" = OrderedDict()  # 최근 조회한 결과의 JSON 줄 (LRU)
+        self._index_inode = None
+        self._index_pos = 0      # 인덱스 파일에서 읽은 위치 (bytes)
+        self._indexed_end = 0    # 인덱스가 가리키는 로그의 끝 위치
+        self._aggregates: Optional[RunningAggregates] = None
+        self._aggregates_pos = -1  # 집계가 반영한 인덱스 파일 위치
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    # ---------- 인덱스 ----------
+    def _load_index(self, log_locked: bool = False) -> None:
+        """인덱스 파일 전체 로드 후, 인덱스에 누락된 로그 꼬리 복구"""
+        with self._lock:
+            self._index = {}
+            self._records.clear()
+            self._index_inode = None
+            self._index_pos = 0
+            self._indexed_end = 0
+            self._read_index_tail()
+
+            if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > self._indexed_end:
+                if log_locked:
+                    self._recover_index()
+                    return
+                with open(self.log_path, "ab") as log:
+                    self._lock_file(log)
+                    try:
+                        self._read_index_tail()
+                        self._recover_index()
+                    finally:
+                        self._unlock_file(log)
+
+    def _read_index_tail(self) -> None:
+        """인덱스 파일에서 아직 읽지 않은 완성된 줄만 읽기"""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return
+        self._index_inode = stat.st_ino
+        if stat.st_size <= self._index_pos:
+            return
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_pos)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # 기록 도중인 마지막 줄은 다음에 다시 읽음
+                    break
+                self._index_pos += len(line)
+                try:
+                    entry = IndexEntry.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    continue
+                self._add_entry(entry)
+
+    def _add_entry(self, entry: IndexEntry) -> None:
+        self._index[entry.id] = entry
+        self._records.pop(entry.id, None)
+        self._indexed_end = max(self._indexed_end, entry.offset + entry.length)
+
+    def _recover_index(self) -> None:
+        """로그 기록 후 인덱스 기록 전에 중단된 항목을 인덱스에 추가 (로그 잠금 상태)"""
+        entries = []
+        with open(self.log_path, "rb") as f:
+            f.seek(self._indexed_end)
+            offset = self._indexed_end
+            for line in f:
+                length = len(line)
+                if line.endswith(b"\n"):
+                    record = json.loads(line)
+                    entries.append(self._index_entry(record["id"], record, offset, length))
+                offset += length
+        for entry in entries:
+            self._append_index(entry)
+
+    def _append_index(self, *entries: IndexEntry) -> None:
+        """인덱스 파일에 항목 추가 (로그 잠금 상태, 인덱스를 끝까지 읽은 뒤 호출)"""
+        data = b"".join(
+            (json.dumps(entry.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+            for entry in entries
+        )
+        with open(self.index_path, "ab") as index:
+            index.write(data)
+        self._index_pos += len(data)
+        self._index_inode = os.stat(self.index_path).st_ino
+        for entry in entries:
+            self._add_entry(entry)
+
+    @staticmethod
+    def _index_entry(result_id: str, result_data: Dict, offset: int, length: int) -> IndexEntry:
+        return IndexEntry(offset=offset, length=length, **summarize(result_id, result_data))
+
+    @staticmethod
+    def _lock_file(f) -> None:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+    @staticmethod
+    def _unlock_file(f) -> None:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+    def refresh(self, log_locked: bool = False) -> None:
+        """다른 프로세스가 추가한 인덱스 항목 반영 (파일이 교체/축소되면 전체 재로드)"""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            stat = None
+        with self._lock:
+            if stat is None:
+                if self._index_pos:
+                    self._load_index(log_locked)
+            elif stat.st_ino != self._index_inode or stat.st_size < self._index_pos:
+                self._load_index(log_locked)
+            elif stat.st_size > self._index_pos:
+                self._read_index_tail()
+
+    def invalidate(self) -> None:
+        """캐시를 비우고 인덱스를 처음부터 다시 읽기"""
+        with self._lock:
+            self._aggregates = None
+            self._load_index()
+
+    # ---------- 누적 집계 ----------
+    def _current_aggregates(self, log_locked: bool, rebuild: bool = False) -> RunningAggregates:
+        """현재 인덱스 위치까지 반영된 집계 (파일이 뒤처졌으면 재계산, 로그 잠금 상태)"""
+        if not rebuild:
+            if self._aggregates is not None and self._aggregates_pos == self._index_pos:
+                return self._aggregates
+            loaded = read_aggregates_file(self.aggregates_path)
+            if loaded is not None and loaded[0] == self._index_pos:
+                self._aggregates, self._aggregates_pos = loaded[1], self._index_pos
+                return self._aggregates
+        if not log_locked:
+            with open(self.log_path, "ab") as log:
+                self._lock_file(log)
+                try:
+                    self.refresh(log_locked=True)
+                    return self._current_aggregates(log_locked=True, rebuild=rebuild)
+                finally:
+                    self._unlock_file(log)
+
+        aggregates = RunningAggregates.from_records(self._iter_records())
+        write_aggregates_file(self.aggregates_path, aggregates, self._index_pos)
+        self._aggregates, self._aggregates_pos = aggregates, self._index_pos
+        return aggregates
+
+    def aggregates(self) -> RunningAggregates:
+        """저장된 누적 집계 (다른 프로세스의 저장분 포함)"""
+        self.refresh()
+        with self._lock:
+            return self._current_aggregates(log_locked=False)
+
+    def rebuild_aggregates(self) -> RunningAggregates:
+        """로그 전체에서 누적 집계를 다시 계산하여 저장"""
+        self.refresh()
+        with self._lock:
+            return self._current_aggregates(log_locked=False, rebuild=True)
+
+    # ---------- 쓰기 ----------
+    def save(
+        self,
+        user_info: Dict,
+        scores: Dict,
+        analysis: Dict,
+        result_id: Optional[str] = None,
+        responses: Optional[Dict[str, int]] = None
+    ) -> str:
+        """결과 저장 후 결과 ID 반환 (responses를 주면 원 응답도 함께 보관)"""
+        with self._lock, open(self.log_path, "ab") as log:
+            self._lock_file(log)
+            try:
+                # 다른 프로세스가 추가한 항목을 먼저 반영해야 인덱스 위치가 맞음
+                self.refresh(log_locked=True)
+                aggregates = self._current_aggregates(log_locked=True)
+                if result_id is None:
+                    result_id = new_result_id()
+                    while result_id in self._index:
+                        result_id = new_result_id()
+                    previous = None
+                else:
+                    previous = self._read_record(result_id)
+                record = {"id": result_id, **build_record(user_info, scores, analysis, responses)}
+                line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+                log.seek(0, os.SEEK_END)
+                offset = log.tell()
+                log.write(line)
+                log.flush()
+
+                self._append_index(self._index_entry(result_id, record, offset, len(line)))
+
+                # 누적 집계 O(1) 갱신 (같은 ID를 덮어쓰면 이전 결과를 빼고 더함)
+                if previous is not None:
+                    aggregates.remove(previous)
+                aggregates.add(record)
+                write_aggregates_file(self.aggregates_path, aggregates, self._index_pos)
+                self._aggregates_pos = self._index_pos
+            finally:
+                self._unlock_file(log)
+        return result_id
+
+    def save_many(
+        self,
+        items: Iterable[Tuple[Dict, Dict, Optional[Dict], Optional[Dict[str, int]]]],
+        result_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        여러 결과를 한 번에 저장 (잠금, 로그/인덱스 쓰기, 집계 기록을 한 번씩만 수행)
+
+        result_ids를 주면 같은 ID의 결과를 덮어쓰며, 집계에서 이전 결과를 빼고 더함
+        """
+        items, given_ids = pair_result_ids(items, result_ids)
+        with self._lock, open(self.log_path, "ab") as log:
+            self._lock_file(log)
+            try:
+                self.refresh(log_locked=True)
+                aggregates = self._current_aggregates(log_locked=True)
+                log.seek(0, os.SEEK_END)
+                offset = log.tell()
+                lines = []
+                entries = []
+                result_ids = []
+                written: Dict[str, Dict] = {}  # 이번 묶음에서 쓴 결과 (같은 ID가 두 번 나올 때)
+                for (user_info, scores, analysis, responses), result_id in zip(items, given_ids):
+                    if result_id is None:
+                        result_id = new_result_id()
+                        while result_id in self._index or result_id in written:
+                            result_id = new_result_id()
+                        previous = None
+                    else:
+                        previous = written.get(result_id) or self._read_record(result_id)
+                    record = {"id": result_id, **build_record(user_info, scores, analysis, responses)}
+                    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+                    lines.append(line)
+                    entries.append(self._index_entry(result_id, record, offset, len(line)))
+                    result_ids.append(result_id)
+                    written[result_id] = record
+                    offset += len(line)
+                    if previous is not None:
+                        aggregates.remove(previous)
+                    aggregates.add(record)
+                if not lines:
+                    return result_ids
+
+                log.write(b"".join(lines))
+                log.flush()
+                self._append_index(*entries)
+                write_aggregates_file(self.aggregates_path, aggregates, self._index_pos)
+                self._aggregates_pos = self._index_pos
+            finally:
+                self._unlock_file(log)
+        return result_ids
+
+    # ---------- 읽기 ----------
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._index)
+
+    def __contains__(self, result_id: str) -> bool:
+        self.refresh()
+        return result_id in self._index
+
+    def get(self, result_id: str) -> Optional[Dict]:
+        """
+        결과 ID로 전체 결과 조회 (LRU 캐시, 없으면 인덱스 위치로 직접 읽기)
+
+        캐시는 로그의 JSON 줄을 그대로 보관하고 조회할 때마다 파싱하므로,
+        여러 세션이 같은 결과를 읽어도 서로 다른 dict를 받습니다.
+        """
+        self.refresh()
+        with self._lock:
+            line = self._records.get(result_id)
+            if line is not None:
+                self._records.move_to_end(result_id)
+            else:
+                line = self._read_line(result_id)
+                if line is None:
+                    return None
+                if self.record_cache_size:
+                    self._records[result_id] = line
+                    if len(self._records) > self.record_cache_size:
+                        self._records.popitem(last=False)
+        return _parse_record(line)
+
+    def _read_record(self, result_id: str) -> Optional[Dict]:
+        """인덱스 위치로 로그에서 결과 한 건 읽기 (id 제외)"""
+        line = self._read_line(result_id)
+        return None if line is None else _parse_record(line)
+
+    def _read_line(self, result_id: str) -> Optional[bytes]:
+        """인덱스 위치로 로그에서 결과 한 건의 JSON 줄 읽기"""
+        entry = self._index.get(result_id)
+        if entry is None:
+            return None
+        with open(self.log_path, "rb") as f:
+            f.seek(entry.offset)
+            return f.read(entry.length)
+
+    def summaries(self) -> List[Dict]:
+        """전체 결과 요약 (최신순, load_all_results 형식)"""
+        self.refresh()
+        with self._lock:
+            return [
+                summary_to_result(self._index[result_id])
+                for result_id in sorted(self._index, reverse=True)
+            ]
+
+    def _filtered(self, filters: Optional[ResultFilter]) -> Iterable[IndexEntry]:
+        entries = self._index.values()
+        if filters is None:
+            return entries
+        return (entry for entry in entries if filters.matches(entry))
+
+    def query(
+        self,
+        filters: Optional[ResultFilter] = None,
+        sort: str = "newest",
+        offset: int = 0,
+        limit: int = 20
+    ) -> List[Dict]:
+        """조건에 맞는 결과 요약 한 페이지 (앞쪽 offset+limit개만 부분 정렬)"""
+        _, field, descending = SORT_OPTIONS[sort]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        self.refresh()
+        with self._lock:
+            top = select(
+                offset + limit,
+                self._filtered(filters),
+                key=lambda entry: (getattr(entry, field), entry.id)
+            )
+        return [summary_to_result(entry) for entry in top[offset:]]
+
+    def count(self, filters: Optional[ResultFilter] = None) -> int:
+        self.refresh()
+        with self._lock:
+            if filters is None:
+                return len(self._index)
+            return sum(1 for _ in self._filtered(filters))
+
+    def departments(self) -> List[str]:
+        self.refresh()
+        with self._lock:
+            return sorted({entry.department for entry in self._index.values()})
+
+    def statistics(self, filters: Optional[ResultFilter] = None) -> Dict:
+        """관리자 통계 (조건이 없으면 누적 집계, 있으면 인덱스 한 번 순회)"""
+        if filters is None:
+            return self.aggregates().statistics()
+        stats = empty_statistics()
+        level_counts = stats["level_counts"]
+        count = 0
+        total = 0
+        self.refresh()
+        with self._lock:
+            for entry in self._filtered(filters):
+                count += 1
+                total += entry.score
+                level_counts[entry.level] = level_counts.get(entry.level, 0) + 1
+        if count:
+            stats["total_count"] = count
+            stats["avg_score"] = total / count
+        return stats
+
+    def iter_records(self) -> Iterator[Dict]:
+        """로그의 전체 결과를 순서대로 스트리밍 (같은 ID는 최신 기록만)"""
+        self.refresh()
+        return self._iter_records()
+
+    def _iter_records(self) -> Iterator[Dict]:
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.endswith(b"\n"):
+                    record = json.loads(line)
+                    entry = self._index.get(record["id"])
+                    if entry is not None and entry.offset == offset:
+                        yield record
+                offset += len(line)
+
+
+# 프로세스 전체에서 공유하는 저장소 인스턴스 (Streamlit 재실행 간 유지)
+MAX_SHARED_STORES = 8
+_shared_stores: "OrderedDict[Tuple[str, str], ResultRepository]" = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def open_result_store(
+    location: Optional[str] = None,
+    backend: Optional[str] = None,
+    shared: bool = True
+) -> ResultRepository:
+    """
+    설정에 따라 결과 저장소 열기
+
+    Args:
+        location: 저장 위치 (미지정 시 환경 변수 또는 기본값 results)
+        backend: "log" 또는 "sqlite" (미지정 시 환경 변수 또는 log)
+        shared: True면 같은 위치의 저장소 인스턴스를 프로세스 전체에서 공유
+    """
+    backend = backend or os.environ.get(BACKEND_ENV, "log")
+    location = location or os.environ.get(LOCATION_ENV)
+
+    if backend == "log":
+        location = location or "results"
+        factory = LogResultStore
+    elif backend == "sqlite":
+        from sqlite_store import SQLiteResultStore
+        location = location or os.path.join("results", "results.db")
+        factory = SQLiteResultStore
+    else:
+        raise ValueError(f"지원하지 않는 저장소 종류입니다: {backend}")
+
+    if not shared:
+        return factory(location)
+
+    key = (backend, os.path.abspath(location))
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = _shared_stores[key] = factory(location)
+            if len(_shared_stores) > MAX_SHARED_STORES:
+                _shared_stores.popitem(last=False)
+        else:
+            _shared_stores.move_to_end(key)
+        return store
+
+
+def invalidate_result_stores() -> None:
+    """공유 저장소 캐시 비우기 (다음 open_result_store에서 새로 로드)"""
+    with _shared_lock:
+        _shared_stores.clear()
+
+
+def iter_matching_records(
+    store: ResultRepository,
+    filters: Optional[ResultFilter] = None
+) -> Iterator[Dict]:
+    """조건에 맞는 전체 결과 스트리밍"""
+    for record in store.iter_records():
+        if filters is None or filters.matches(summarize(record["id"], record)):
+            yield record
+
+
+def import_legacy_results(store: ResultRepository, directory: str) -> int:
+    """
+    파일당 결과 하나인 기존 results/ 디렉토리를 저장소로 가져오기
+
+    파일명(확장자 제외)을 결과 ID로 사용하며, 이미 가져온 ID는 건너뜁니다.
+    저장소 자체 파일(누적 집계 등)과 결과 형식이 아닌 JSON도 건너뜁니다.
+
+    Returns:
+        새로 가져온 결과 수
+    """
+    imported = 0
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json") or filename in STORE_FILENAMES:
+            continue
+        result_id = filename[:-len(".json")]
+        if result_id in store:
+            continue
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or any(key not in data for key in LEGACY_RESULT_KEYS):
+            continue
+        store.save(data["user_info"], data["scores"], data["analysis"], result_id=result_id)
+        imported += 1
+    return imported
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="AI 역량 진단 결과 저장소 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    migrate = sub.add_parser("migrate", help="기존 results/*.json 파일을 저장소로 가져오기")
+    migrate.add_argument("source", help="기존 결과 JSON 디렉토리")
+
+    sub.add_parser(
+        "rebuild-aggregates",
+        help="전체 결과에서 누적 집계를 다시 계산하고 저장된 값과 비교"
+    )
+
+    for command in sub.choices.values():
+        command.add_argument("--store", help="저장 위치 (기본: results 또는 results/results.db)")
+        command.add_argument("--backend", choices=["log", "sqlite"], help="저장소 종류 (기본: log)")
+
+    args = parser.parse_args(argv)
+    store = open_result_store(args.store, args.backend, shared=False)
+
+    if args.command == "migrate":
+        imported = import_legacy_results(store, args.source)
+        print(f"✅ {imported}건 가져옴 (저장소 전체 {len(store)}건)")
+
+    elif args.command == "rebuild-aggregates":
+        stored = store.aggregates().to_dict()
+        rebuilt = store.rebuild_aggregates()
+        if stored == rebuilt.to_dict():
+            print("✅ 저장된 집계가 원본 결과와 일치합니다")
+        else:
+            print("⚠️ 저장된 집계가 원본 결과와 달라 다시 계산했습니다")
+        stats = rebuilt.statistics()
+        print(f"   {stats['total_count']}건, 평균 {stats['avg_score']:.1f}점, "
+              f"표준편차 {stats['score_std']:.1f}")
+
+if __name__ == "__main__":
+    main()
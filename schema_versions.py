@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - 문항 구성 버전과 응답 변환
+
+저장된 결과에는 응답과 함께 문항 구성 버전(schema_version)이 기록됩니다.
+문항을 추가하거나 영역 간에 옮길 때는 ai_skill_assessment.SCHEMA_VERSION을
+올리고, 이전 구성을 SCHEMA_VERSIONS에, 이전 버전 → 새 버전 응답 변환 규칙을
+MIGRATIONS에 등록합니다.
+
+    SCHEMA_VERSIONS[1] = (이전 ASSESSMENT_DATA, 이전 LEVEL_CRITERIA)
+    MIGRATIONS[2] = Migration(
+        1, 2,
+        sources={"Q16": "Q4"},            # 새 문항 ← 이전 문항 (같은 ID는 자동 대응)
+        value_maps={"Q7": (0, 5, 4, 3, 2, 1)},  # 역문항 등 응답 값 변환
+        fill="category_mean"              # 대응 문항이 없는 새 문항 채우기
+    )
+
+변환은 응답 행렬(N×문항 수) 전체에 열 인덱싱과 조회표로 한 번에 적용되며,
+여러 버전을 건너뛸 때는 버전 순서대로 이어서 적용합니다.
+"""
+
+import threading
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_skill_assessment import (
+    ASSESSMENT_DATA, LEVEL_CRITERIA, SCHEMA, SCHEMA_VERSION, CompiledSchema
+)
+
+# 대응 문항이 없는 새 문항 채우기 방식
+FILL_ZERO = "zero"                    # 미응답(0)으로 둠
+FILL_CATEGORY_MEAN = "category_mean"  # 같은 영역 응답 문항의 평균 (반올림)
+FILL_OPTIONS = (FILL_ZERO, FILL_CATEGORY_MEAN)
+
+# 버전 → (ASSESSMENT_DATA, LEVEL_CRITERIA)
+SCHEMA_VERSIONS: Dict[int, Tuple[Dict, Dict]] = {
+    SCHEMA_VERSION: (ASSESSMENT_DATA, LEVEL_CRITERIA)
+}
+
+
+class Migration:
+    """한 버전의 응답을 다음 버전 문항 구성으로 바꾸는 규칙"""
+
+    def __init__(
+        self,
+        from_version: int,
+        to_version: int,
+        sources: Optional[Mapping[str, Optional[str]]] = None,
+        value_maps: Optional[Mapping[str, Sequence[int]]] = None,
+        fill: str = FILL_CATEGORY_MEAN
+    ):
+        """
+        Args:
+            sources: 새 문항 ID → 이전 문항 ID (None이면 대응 없음).
+                지정하지 않은 새 문항은 같은 ID의 이전 문항을 사용합니다.
+            value_maps: 새 문항 ID → 이전 응답 값(0~5)별 새 값 6개
+            fill: 대응 문항이 없는 새 문항 채우기 방식 (FILL_OPTIONS)
+        """
+        if fill not in FILL_OPTIONS:
+            raise ValueError(f"알 수 없는 채우기 방식입니다: {fill}")
+        self.from_version = from_version
+        self.to_version = to_version
+        self.sources = dict(sources or {})
+        self.value_maps = {q_id: tuple(values) for q_id, values in (value_maps or {}).items()}
+        self.fill = fill
+        self._compiled: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def compile(self, old: CompiledSchema, new: CompiledSchema) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (새 문항별 이전 열 번호(-1은 대응 없음), 새 문항 × 응답 값 조회표)
+
+        Raises:
+            ValueError: 없는 문항을 가리키거나 값 변환표가 형식에 맞지 않을 때
+        """
+        key = (id(old), id(new))
+        with self._lock:
+            compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        unknown = set(self.sources) - set(new.question_ids) | set(self.value_maps) - set(new.question_ids)
+        if unknown:
+            raise ValueError(f"새 버전에 없는 문항입니다: {sorted(unknown)}")
+        source_index = np.full(new.num_questions, -1, dtype=np.int64)
+        lookup = np.tile(np.arange(6, dtype=np.uint8), (new.num_questions, 1))
+        for i, q_id in enumerate(new.question_ids):
+            source = self.sources.get(q_id, q_id)
+            if source is not None and source in old.question_index:
+                source_index[i] = old.question_index[source]
+            elif q_id in self.sources:
+                raise ValueError(f"이전 버전에 없는 문항입니다: {source}")
+            values = self.value_maps.get(q_id)
+            if values is not None:
+                if len(values) != 6 or any(not 0 <= value <= 5 for value in values):
+                    raise ValueError(f"값 변환표는 0~5 사이 값 6개여야 합니다: {q_id}")
+                lookup[i] = values
+
+        compiled = (source_index, lookup)
+        with self._lock:
+            self._compiled[key] = compiled
+        return compiled
+
+    def _value_map_columns(self, new: CompiledSchema) -> Sequence[int]:
+        return [new.question_index[q_id] for q_id in self.value_maps]
+
+    def apply(self, matrix: np.ndarray, old: CompiledSchema, new: CompiledSchema) -> np.ndarray:
+        """이전 버전 응답 행렬(N×이전 문항 수) → 새 버전 응답 행렬 (uint8)"""
+        source_index, lookup = self.compile(old, new)
+        matrix = np.asarray(matrix, dtype=np.uint8)
+        mapped = source_index >= 0
+        result = np.zeros((matrix.shape[0], new.num_questions), dtype=np.uint8)
+        columns = np.flatnonzero(mapped)
+        result[:, columns] = matrix[:, source_index[columns]]
+        # 값 변환표는 지정된 문항에만 적용 (나머지는 그대로 복사)
+        for i in self._value_map_columns(new):
+            result[:, i] = lookup[i][result[:, i]]
+
+        if self.fill == FILL_CATEGORY_MEAN and not mapped.all() and matrix.shape[0]:
+            # 대응 없는 문항이 있는 영역만 응답 문항 평균(반올림)으로 채움
+            for j in np.unique(new.question_category[~mapped]).tolist():
+                sources = [i for i in np.flatnonzero(new.question_category == j).tolist() if mapped[i]]
+                block = result[:, sources].astype(np.int32)
+                sums = block.sum(axis=1)
+                counts = (block > 0).sum(axis=1)
+                means = np.where(counts > 0, (2 * sums + counts) // np.maximum(2 * counts, 1), 0)
+                targets = [i for i in np.flatnonzero(new.question_category == j).tolist() if not mapped[i]]
+                result[:, targets] = means.astype(np.uint8)[:, None]
+        return result
+
+
+# 새 버전 → 직전 버전에서 오는 변환 규칙
+MIGRATIONS: Dict[int, Migration] = {}
+
+_compiled_schemas: Dict[int, CompiledSchema] = {SCHEMA_VERSION: SCHEMA}
+_compiled_lock = threading.Lock()
+
+
+def register_schema_version(
+    version: int,
+    data: Dict,
+    level_criteria: Dict,
+    migration: Optional[Migration] = None
+) -> CompiledSchema:
+    """문항 구성 버전 등록 (migration은 직전 버전 → version 변환 규칙)"""
+    if migration is not None and migration.to_version != version:
+        raise ValueError(f"변환 규칙의 대상 버전({migration.to_version})이 {version}과 다릅니다")
+    schema = CompiledSchema(data, level_criteria, version)
+    with _compiled_lock:
+        SCHEMA_VERSIONS[version] = (data, level_criteria)
+        _compiled_schemas[version] = schema
+        if migration is not None:
+            MIGRATIONS[version] = migration
+    return schema
+
+
+def get_schema(version: int) -> CompiledSchema:
+    """버전의 컴파일된 스키마 (처음 요청할 때 한 번만 컴파일)"""
+    with _compiled_lock:
+        schema = _compiled_schemas.get(version)
+        if schema is None:
+            if version not in SCHEMA_VERSIONS:
+                raise KeyError(f"등록되지 않은 문항 구성 버전입니다: {version}")
+            data, level_criteria = SCHEMA_VERSIONS[version]
+            schema = _compiled_schemas[version] = CompiledSchema(data, level_criteria, version)
+        return schema
+
+
+def record_schema_version(record: Dict) -> Optional[int]:
+    """저장된 결과의 문항 구성 버전 (원 응답이나 버전 기록이 없으면 None)"""
+    if record.get("responses") is None:
+        return None
+    return record.get("schema_version")
+
+
+def translate_responses(
+    matrix: np.ndarray,
+    from_version: int,
+    to_schema: CompiledSchema = SCHEMA
+) -> np.ndarray:
+    """
+    from_version의 응답 행렬을 to_schema 문항 구성으로 변환
+
+    Raises:
+        ValueError: 중간 버전의 변환 규칙이 없거나 이후 버전에서 이전 버전으로 변환할 때
+    """
+    if from_version == to_schema.version:
+        return np.asarray(matrix, dtype=np.uint8)
+    if from_version > to_schema.version:
+        raise ValueError(f"이후 버전({from_version})의 응답은 {to_schema.version} 버전으로 변환할 수 없습니다")
+    for version in range(from_version + 1, to_schema.version + 1):
+        migration = MIGRATIONS.get(version)
+        if migration is None:
+            raise ValueError(f"{version - 1} → {version} 버전 변환 규칙이 없습니다")
+        new = to_schema if version == to_schema.version else get_schema(version)
+        matrix = migration.apply(matrix, get_schema(version - 1), new)
+    return matrix
+
+
+def record_responses(record: Dict, schema: CompiledSchema = SCHEMA) -> Optional[bytes]:
+    """저장된 원 응답을 schema 문항 구성으로 변환한 값 (없거나 변환할 수 없으면 None)"""
+    version = record_schema_version(record)
+    if version is None:
+        return None
+    try:
+        if version == schema.version:
+            return schema.response_bytes(record["responses"])
+        matrix = get_schema(version).decode_response_matrix([record["responses"]])
+        return translate_responses(matrix, version, schema)[0].tobytes()
+    except (KeyError, ValueError):
+        return None
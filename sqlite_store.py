@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 활용 역량 진단 시스템 - SQLite 결과 저장소
+
+표준 라이브러리 sqlite3만 사용합니다. 요약 필드는 별도 컬럼으로 두고
+부서/레벨/진단일시에 인덱스를 걸어, 관리자 통계를 전체 결과를 메모리에
+올리지 않고 집계 쿼리로 계산합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aggregates import RunningAggregates
+from result_store import (
+    SORT_OPTIONS, ResultFilter, ResultRepository, build_record, empty_statistics, new_result_id,
+    pair_result_ids, summarize
+)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS results (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    department  TEXT NOT NULL,
+    position    TEXT NOT NULL,
+    score       INTEGER NOT NULL,
+    level       TEXT NOT NULL,
+    timestamp   TEXT NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_department ON results (department);
+CREATE INDEX IF NOT EXISTS idx_results_level ON results (level);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (timestamp);
+CREATE TABLE IF NOT EXISTS aggregates (
+    name        TEXT PRIMARY KEY,
+    data        TEXT NOT NULL
+);
+"""
+
+# aggregates 테이블에서 전체 결과 누적 집계를 담는 행
+AGGREGATES_KEY = "results"
+
+SUMMARY_COLUMNS = "id, name, department, position, score, level, timestamp"
+
+
+def _where(filters: Optional[ResultFilter]) -> Tuple[str, list]:
+    """필터를 WHERE 절과 파라미터로 변환 (인덱스 컬럼만 사용)"""
+    if filters is None:
+        return "", []
+    clauses = []
+    params = []
+    if filters.department is not None:
+        clauses.append("department = ?")
+        params.append(filters.department)
+    if filters.level is not None:
+        clauses.append("level = ?")
+        params.append(filters.level)
+    if filters.date_from is not None:
+        clauses.append("timestamp >= ?")
+        params.append(filters.date_from.isoformat())
+    if filters.date_to is not None:
+        clauses.append("timestamp < ?")
+        params.append((filters.date_to + timedelta(days=1)).isoformat())
+    if not clauses:
+        return "", []
+    return " WHERE " + " AND ".join(clauses), params
+
+
+def _row_to_summary(row) -> Dict:
+    """요약 행을 load_all_results 형식으로 변환"""
+    result_id, name, department, position, score, level, timestamp = row
+    return {
+        "id": result_id,
+        "user_info": {"name": name, "department": department, "position": position},
+        "score": score,
+        "level": level,
+        "timestamp": timestamp
+    }
+
+
+class SQLiteResultStore(ResultRepository):
+    """SQLite 기반 결과 저장소"""
+
+    def __init__(self, path: str = os.path.join("results", "results.db"), record_cache_size: int = 256):
+        self.path = path
+        self.record_cache_size = record_cache_size
+        # 최근 조회한 결과의 JSON 문자열 (LRU, 조회마다 파싱해 세션끼리 dict를 공유하지 않음).
+        # 다른 연결(프로세스)이 커밋하면 data_version이 바뀌므로 그때 비우고,
+        # 이 연결에서 덮어쓴 결과는 저장할 때 제거
+        self._records: "OrderedDict[str, str]" = OrderedDict()
+        self._data_version = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Streamlit 세션 스레드들이 연결 하나를 공유하므로 잠금으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA_SQL)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---------- 쓰기 ----------
+    def save(
+        self,
+        user_info: Dict,
+        scores: Dict,
+        analysis: Dict,
+        result_id: Optional[str] = None,
+        responses: Optional[Dict[str, int]] = None
+    ) -> str:
+        """결과 저장 후 결과 ID 반환 (같은 ID는 덮어씀)"""
+        result_id = result_id or new_result_id()
+        record = build_record(user_info, scores, analysis, responses)
+        summary = summarize(result_id, record)
+        with self._lock:
+            # 결과와 누적 집계를 한 트랜잭션에서 갱신
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                aggregates = self._load_aggregates()
+                previous = self._conn.execute(
+                    "SELECT data FROM results WHERE id = ?", (result_id,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(id, name, department, position, score, level, timestamp, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        result_id, summary["name"], summary["department"], summary["position"],
+                        summary["score"], summary["level"], summary["timestamp"],
+                        json.dumps(record, ensure_ascii=False)
+                    )
+                )
+                if previous is not None:
+                    aggregates.remove(json.loads(previous[0]))
+                aggregates.add(record)
+                self._store_aggregates(aggregates)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                self._records.pop(result_id, None)
+        return result_id
+
+    def save_many(
+        self,
+        items: Iterable[Tuple[Dict, Dict, Optional[Dict], Optional[Dict[str, int]]]],
+        result_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        여러 결과를 한 트랜잭션에서 저장
+
+        result_ids를 주면 같은 ID의 결과를 덮어쓰며, 집계에서 이전 결과를 빼고 더함
+        """
+        items, given_ids = pair_result_ids(items, result_ids)
+        rows = []
+        result_ids = []
+        written: Dict[str, Dict] = {}  # 이번 묶음에서 쓴 결과 (같은 ID가 두 번 나올 때)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                aggregates = self._load_aggregates()
+                for (user_info, scores, analysis, responses), result_id in zip(items, given_ids):
+                    if result_id is None:
+                        result_id = new_result_id()
+                    else:
+                        previous = written.get(result_id)
+                        if previous is None:
+                            row = self._conn.execute(
+                                "SELECT data FROM results WHERE id = ?", (result_id,)
+                            ).fetchone()
+                            previous = json.loads(row[0]) if row is not None else None
+                        if previous is not None:
+                            aggregates.remove(previous)
+                    record = build_record(user_info, scores, analysis, responses)
+                    written[result_id] = record
+                    summary = summarize(result_id, record)
+                    rows.append((
+                        result_id, summary["name"], summary["department"], summary["position"],
+                        summary["score"], summary["level"], summary["timestamp"],
+                        json.dumps(record, ensure_ascii=False)
+                    ))
+                    result_ids.append(result_id)
+                    aggregates.add(record)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO results "
+                    "(id, name, department, position, score, level, timestamp, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._store_aggregates(aggregates)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                for result_id in written:
+                    self._records.pop(result_id, None)
+        return result_ids
+
+    # ---------- 누적 집계 (잠금/트랜잭션 안에서 호출) ----------
+    def _load_aggregates(self) -> RunningAggregates:
+        row = self._conn.execute(
+            "SELECT data FROM aggregates WHERE name = ?", (AGGREGATES_KEY,)
+        ).fetchone()
+        if row is not None:
+            return RunningAggregates.from_dict(json.loads(row[0]))
+        # 집계가 없으면 (이전 버전 DB 등) 전체 결과에서 계산
+        return RunningAggregates.from_records(
+            json.loads(data) for (data,) in self._conn.execute("SELECT data FROM results")
+        )
+
+    def _store_aggregates(self, aggregates: RunningAggregates) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO aggregates (name, data) VALUES (?, ?)",
+            (AGGREGATES_KEY, json.dumps(aggregates.to_dict(), ensure_ascii=False))
+        )
+
+    def aggregates(self) -> RunningAggregates:
+        """저장된 누적 집계"""
+        with self._lock:
+            return self._load_aggregates()
+
+    def rebuild_aggregates(self) -> RunningAggregates:
+        """전체 결과에서 누적 집계를 다시 계산하여 저장"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM aggregates WHERE name = ?", (AGGREGATES_KEY,))
+                aggregates = self._load_aggregates()
+                self._store_aggregates(aggregates)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return aggregates
+
+    # ---------- 읽기 ----------
+    def _query(self, sql: str, params=()) -> List:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM results")[0][0]
+
+    def __contains__(self, result_id: str) -> bool:
+        return bool(self._query("SELECT 1 FROM results WHERE id = ?", (result_id,)))
+
+    def get(self, result_id: str) -> Optional[Dict]:
+        """결과 ID로 전체 결과 조회 (LRU 캐시, 없으면 DB에서 읽기)"""
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._records.clear()
+                self._data_version = data_version
+            data = self._records.get(result_id)
+            if data is not None:
+                self._records.move_to_end(result_id)
+            else:
+                row = self._conn.execute("SELECT data FROM results WHERE id = ?", (result_id,)).fetchone()
+                if row is None:
+                    return None
+                data = row[0]
+                if self.record_cache_size:
+                    self._records[result_id] = data
+                    if len(self._records) > self.record_cache_size:
+                        self._records.popitem(last=False)
+        return json.loads(data)
+
+    def summaries(self) -> List[Dict]:
+        """전체 결과 요약 (최신순, load_all_results 형식)"""
+        rows = self._query(f"SELECT {SUMMARY_COLUMNS} FROM results ORDER BY id DESC")
+        return [_row_to_summary(row) for row in rows]
+
+    def query(
+        self,
+        filters: Optional[ResultFilter] = None,
+        sort: str = "newest",
+        offset: int = 0,
+        limit: int = 20
+    ) -> List[Dict]:
+        """조건에 맞는 결과 요약 한 페이지 (해당 페이지 행만 읽음)"""
+        _, field, descending = SORT_OPTIONS[sort]
+        direction = "DESC" if descending else "ASC"
+        where, params = _where(filters)
+        rows = self._query(
+            f"SELECT {SUMMARY_COLUMNS} FROM results{where} "
+            f"ORDER BY {field} {direction}, id {direction} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [_row_to_summary(row) for row in rows]
+
+    def count(self, filters: Optional[ResultFilter] = None) -> int:
+        where, params = _where(filters)
+        return self._query(f"SELECT COUNT(*) FROM results{where}", params)[0][0]
+
+    def departments(self) -> List[str]:
+        rows = self._query("SELECT DISTINCT department FROM results ORDER BY department")
+        return [row[0] for row in rows]
+
+    def statistics(self, filters: Optional[ResultFilter] = None) -> Dict:
+        """관리자 통계 (조건이 없으면 누적 집계, 있으면 집계 쿼리)"""
+        if filters is None:
+            return self.aggregates().statistics()
+        stats = empty_statistics()
+        where, params = _where(filters)
+        count, avg_score = self._query(
+            f"SELECT COUNT(*), AVG(score) FROM results{where}", params
+        )[0]
+        if not count:
+            return stats
+        stats["total_count"] = count
+        stats["avg_score"] = avg_score
+        for level, level_count in self._query(
+            f"SELECT level, COUNT(*) FROM results{where} GROUP BY level", params
+        ):
+            stats["level_counts"][level] = level_count
+        return stats
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[Dict]:
+        """전체 결과 스트리밍 (ID 순, batch_size 단위로 읽기)"""
+        last_id = ""
+        while True:
+            rows = self._query(
+                "SELECT id, data FROM results WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            )
+            if not rows:
+                return
+            for result_id, data in rows:
+                record = json.loads(data)
+                record["id"] = result_id
+                yield record
+            last_id = rows[-1][0]
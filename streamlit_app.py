@@ -2,12 +2,22 @@
 AI 활용 역량 진단 시스템 - Streamlit 버전
 """
 
-import streamlit as st
-import json
-from datetime import datetime
 import os
-from ai_skill_assessment import AISkillAssessment, ASSESSMENT_DATA, LEVEL_CRITERIA
-from generate_html_report import generate_html_report
+import time
+
+# 스크립트 실행마다 페이지 전까지의 고정 비용 측정 시작점 (첫 실행은 모듈 import 포함)
+_run_started = time.perf_counter()
+
+from datetime import datetime
+from html import escape
+import streamlit as st
+import metrics
+from ai_skill_assessment import AISkillAssessment
+from result_store import (
+    SORT_OPTIONS, ResultFilter, import_legacy_results, iter_matching_records, open_result_store
+)
+from data_export import iter_csv
+from outcome_table import open_outcome_table
 
 # 페이지 설정
 st.set_page_config(
@@ -54,52 +64,59 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 세션 상태 초기화
+# 세션 상태 초기화 (결과는 ID만 보관하고 내용은 저장소의 공유 캐시에서 조회)
 if 'page' not in st.session_state:
     st.session_state.page = 'home'
-if 'user_info' not in st.session_state:
-    st.session_state.user_info = {}
-if 'responses' not in st.session_state:
-    st.session_state.responses = {}
-if 'results' not in st.session_state:
-    st.session_state.results = None
+if 'result_id' not in st.session_state:
+    st.session_state.result_id = None
+
+# 관리자 목록 페이지 크기
+ADMIN_PAGE_SIZES = [20, 50, 100]
 
-# 결과 저장 디렉토리
+# 결과 저장 디렉토리 (저장소 종류는 AI_ASSESSMENT_STORE_BACKEND 환경 변수로 선택)
 RESULTS_DIR = "results"
-os.makedirs(RESULTS_DIR, exist_ok=True)
 
-def save_result(user_info, scores, analysis):
-    """결과 저장"""
-    result_id = datetime.now().strftime('%Y%m%d_%H%M%S')
-    result_data = {
-        'user_info': user_info,
-        'scores': scores,
-        'analysis': analysis
-    }
-    
-    filepath = os.path.join(RESULTS_DIR, f'{result_id}.json')
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(result_data, f, ensure_ascii=False, indent=2)
-    
-    return result_id
+# ==================== 공유 자원 ====================
+# 아래 자원은 프로세스에서 처음 필요할 때 한 번만 만들고 모든 세션과 재실행이
+# 함께 사용함 (처음 만드는 시간은 startup_* 단계로 계측)
 
+@st.cache_resource(show_spinner=False)
+def get_result_store():
+    """결과 저장소 (요약 인덱스를 공유하므로 재실행 시 새 항목만 읽음)"""
+    with metrics.timer("startup_result_store"):
+        store = open_result_store()
+        if not len(store) and os.path.isdir(RESULTS_DIR):
+            # 파일당 결과 하나로 저장하던 이전 형식 가져오기
+            import_legacy_results(store, RESULTS_DIR)
+    return store
+
+@st.cache_resource(show_spinner=False)
+def get_assessment():
+    """진단 엔진 (영역 점수 조합별 결과표 포함, 문항/레벨 기준이 바뀌면 결과표를 다시 생성)"""
+    with metrics.timer("startup_assessment"):
+        return AISkillAssessment(outcome_table=open_outcome_table(os.path.join(RESULTS_DIR, "outcomes")))
+
+@st.cache_resource(show_spinner=False)
+def get_report_cache():
+    """리포트 캐시 (리포트 모듈은 처음 리포트를 받을 때 import)"""
+    with metrics.timer("startup_report_cache"):
+        from report_cache import open_report_cache
+        return open_report_cache(os.path.join(RESULTS_DIR, "report_cache"))
+
+result_store = get_result_store()
+assessment_engine = get_assessment()
+SCHEMA = assessment_engine.schema
+
+@metrics.timed("save_result")
+def save_result(user_info, scores, analysis, responses=None):
+    """결과 저장 (원 응답 포함)"""
+    metrics.increment("submissions")
+    return result_store.save(user_info, scores, analysis, responses=responses)
+
+@metrics.timed("load_all_results")
 def load_all_results():
-    """전체 결과 불러오기"""
-    results = []
-    if os.path.exists(RESULTS_DIR):
-        for filename in sorted(os.listdir(RESULTS_DIR), reverse=True):
-            if filename.endswith('.json'):
-                filepath = os.path.join(RESULTS_DIR, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    results.append({
-                        'id': filename.replace('.json', ''),
-                        'user_info': data['user_info'],
-                        'score': data['scores']['total_score'],
-                        'level': data['scores']['level'],
-                        'timestamp': data['scores']['timestamp']
-                    })
-    return results
+    """전체 결과 불러오기 (요약 인덱스만 사용)"""
+    return result_store.summaries()
 
 # ==================== 메인 페이지 ====================
 def show_home():
@@ -158,96 +175,94 @@ def show_assessment():
     </div>
     """, unsafe_allow_html=True)
     
-    # 사용자 정보 입력
-    st.markdown("### 👤 기본 정보")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        name = st.text_input("이름 *", placeholder="예: 홍길동")
-    with col2:
-        department = st.text_input("부서명 *", placeholder="예: 디지털혁신과")
-    with col3:
-        position = st.text_input("직위 *", placeholder="예: 주무관")
+    # 기본 정보와 문항을 하나의 폼으로 묶어, 입력/선택할 때마다가 아니라
+    # 제출할 때 한 번만 스크립트가 다시 실행되도록 함
+    with st.form("assessment_form"):
+        # 사용자 정보 입력
+        st.markdown("### 👤 기본 정보")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            name = st.text_input("이름 *", placeholder="예: 홍길동", key='user_name')
+        with col2:
+            department = st.text_input("부서명 *", placeholder="예: 디지털혁신과", key='user_department')
+        with col3:
+            position = st.text_input("직위 *", placeholder="예: 주무관", key='user_position')
+        
+        # 진단 문항
+        st.markdown("---")
+        responses = {}
+        
+        for cat_idx, category in enumerate(SCHEMA.categories, 1):
+            st.markdown(f"""
+            <div class="category-card">
+                <h3>{cat_idx}. {category['name']}</h3>
+                <p style="color: #666; font-style: italic;">{category['description']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            for question in category['questions']:
+                st.markdown(f"**{question['id']}. {question['text']}**")
+                
+                response = st.radio(
+                    "",
+                    options=SCHEMA.likert_options,
+                    format_func=SCHEMA.likert_scale.get,
+                    key=question['id'],
+                    horizontal=True
+                )
+                responses[question['id']] = response
+                st.markdown("<br>", unsafe_allow_html=True)
+        
+        # 제출 버튼
+        st.markdown("---")
+        col1, col2, col3 = st.columns([1,1,1])
+        with col2:
+            submitted = st.form_submit_button("✅ 진단 완료 및 결과 확인", use_container_width=True)
     
-    if not all([name, department, position]):
-        st.warning("⚠️ 모든 기본 정보를 입력해주세요.")
+    if not submitted:
         return
     
-    st.session_state.user_info = {
+    user_info = {
         'name': name,
         'department': department,
         'position': position
     }
+    if not all(user_info.values()):
+        st.warning("⚠️ 모든 기본 정보를 입력해주세요.")
+        return
+    if len(responses) != SCHEMA.num_questions:
+        st.error("모든 문항에 응답해주세요!")
+        return
     
-    # 진단 문항
-    st.markdown("---")
-    responses = {}
-    
-    for cat_idx, category in enumerate(ASSESSMENT_DATA['categories'], 1):
-        st.markdown(f"""
-        <div class="category-card">
-            <h3>{cat_idx}. {category['name']}</h3>
-            <p style="color: #666; font-style: italic;">{category['description']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        for question in category['questions']:
-            st.markdown(f"**{question['id']}. {question['text']}**")
-            
-            response = st.radio(
-                "",
-                options=[1, 2, 3, 4, 5],
-                format_func=lambda x: ASSESSMENT_DATA['likert_scale'][x],
-                key=question['id'],
-                horizontal=True
-            )
-            responses[question['id']] = response
-            st.markdown("<br>", unsafe_allow_html=True)
-    
-    st.session_state.responses = responses
+    scores = assessment_engine.calculate_scores(responses)
+    analysis = assessment_engine.generate_analysis(scores)
     
-    # 제출 버튼
-    st.markdown("---")
-    col1, col2, col3 = st.columns([1,1,1])
-    with col2:
-        if st.button("✅ 진단 완료 및 결과 확인", use_container_width=True):
-            if len(responses) == 15:
-                assessment = AISkillAssessment()
-                scores = assessment.calculate_scores(responses)
-                analysis = assessment.generate_analysis(scores)
-                
-                result_id = save_result(st.session_state.user_info, scores, analysis)
-                
-                st.session_state.results = {
-                    'user_info': st.session_state.user_info,
-                    'scores': scores,
-                    'analysis': analysis,
-                    'result_id': result_id
-                }
-                
-                st.session_state.page = 'result'
-                st.rerun()
-            else:
-                st.error("모든 문항에 응답해주세요!")
+    st.session_state.result_id = save_result(user_info, scores, analysis, responses)
+    st.session_state.page = 'result'
+    st.rerun()
 
 # ==================== 결과 페이지 ====================
 def show_result():
-    if st.session_state.results is None:
+    result_id = st.session_state.result_id
+    # 저장소의 최근 결과 캐시(LRU)는 모든 세션이 공유하므로 세션마다 사본을 두지 않음
+    result = result_store.get(result_id) if result_id else None
+    if result is None:
         st.error("진단 결과가 없습니다. 먼저 진단을 완료해주세요.")
         if st.button("🏠 처음으로"):
             st.session_state.page = 'home'
             st.rerun()
         return
     
-    results = st.session_state.results
-    scores = results['scores']
-    analysis = results['analysis']
-    user_info = results['user_info']
+    scores = result['scores']
+    user_info = result['user_info']
+    # 분석 없이 저장된 결과(일괄 채점 --no-analysis)는 분석을 다시 생성
+    analysis = result.get('analysis') or assessment_engine.generate_analysis(scores)
     
     st.markdown(f"""
     <div class="main-header">
         <h1>🎯 진단 결과</h1>
-        <p>{user_info['name']} 님의 AI 활용 역량 분석</p>
+        <p>{escape(user_info['name'])} 님의 AI 활용 역량 분석</p>
     </div>
     """, unsafe_allow_html=True)
     
@@ -330,14 +345,13 @@ def show_result():
     
     with col1:
         if st.button("📄 HTML 리포트 다운로드", use_container_width=True):
-            html_content = generate_html_report(
-                {'scores': scores, 'analysis': analysis},
-                user_info
+            html_content = get_report_cache().get_or_render(
+                result_id, user_info, scores, analysis
             )
             st.download_button(
                 label="💾 다운로드",
                 data=html_content,
-                file_name=f"AI역량진단_{user_info['name']}_{results['result_id']}.html",
+                file_name=f"AI역량진단_{user_info['name']}_{result_id}.html",
                 mime="text/html",
                 use_container_width=True
             )
@@ -345,8 +359,7 @@ def show_result():
     with col2:
         if st.button("🔄 다시 진단하기", use_container_width=True):
             st.session_state.page = 'home'
-            st.session_state.responses = {}
-            st.session_state.results = None
+            st.session_state.result_id = None
             st.rerun()
     
     with col3:
@@ -363,19 +376,60 @@ def show_admin():
     </div>
     """, unsafe_allow_html=True)
     
-    results = load_all_results()
-    
-    if not results:
+    if not len(result_store):
         st.info("아직 진단 결과가 없습니다.")
         if st.button("🏠 처음으로"):
             st.session_state.page = 'home'
             st.rerun()
         return
     
-    total_count = len(results)
-    avg_score = sum(r['score'] for r in results) / total_count if total_count > 0 else 0
-    expert_count = len([r for r in results if r['level'] in ['전문가', '고급']])
-    avg_percentage = (avg_score / 75) * 100
+    # 조회 조건 (필터/정렬은 저장소에서 처리)
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.markdown("### 🔍 조회 조건")
+    with col2:
+        if st.button("🔄 새로고침", use_container_width=True):
+            # 캐시된 인덱스를 버리고 저장소를 다시 읽음
+            result_store.invalidate()
+            st.rerun()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        department = st.selectbox("부서", ["전체"] + result_store.departments(), key='admin_department')
+    with col2:
+        level = st.selectbox("레벨", ["전체"] + list(SCHEMA.level_names), key='admin_level')
+    with col3:
+        dates = st.date_input("진단일 (기간)", value=(), key='admin_dates')
+    with col4:
+        sort = st.selectbox(
+            "정렬",
+            list(SORT_OPTIONS),
+            format_func=lambda key: SORT_OPTIONS[key][0],
+            key='admin_sort'
+        )
+    
+    filters = ResultFilter(
+        department=None if department == "전체" else department,
+        level=None if level == "전체" else level,
+        date_from=dates[0] if len(dates) >= 1 else None,
+        date_to=dates[1] if len(dates) == 2 else None
+    )
+    if filters == ResultFilter():
+        # 조건이 없으면 전체를 훑지 않고 저장소의 누적 집계를 사용
+        filters = None
+    stats = result_store.statistics(filters)
+    
+    if not stats['total_count']:
+        st.info("조건에 맞는 진단 결과가 없습니다.")
+        if st.button("🏠 처음으로"):
+            st.session_state.page = 'home'
+            st.rerun()
+        return
+    
+    total_count = stats['total_count']
+    avg_score = stats['avg_score']
+    level_counts = stats['level_counts']
+    expert_count = level_counts.get('전문가', 0) + level_counts.get('고급', 0)
+    avg_percentage = (avg_score / SCHEMA.total_max) * 100
     
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("총 진단 인원", total_count)
@@ -384,22 +438,72 @@ def show_admin():
     col4.metric("평균 달성률", f"{avg_percentage:.1f}%")
     
     st.markdown("### 📈 레벨별 분포")
-    level_counts = {
-        '초급': len([r for r in results if r['level'] == '초급']),
-        '중급': len([r for r in results if r['level'] == '중급']),
-        '고급': len([r for r in results if r['level'] == '고급']),
-        '전문가': len([r for r in results if r['level'] == '전문가'])
-    }
     
-    col1, col2, col3, col4 = st.columns(4)
+    level_cols = st.columns(len(level_counts))
     for i, (level, count) in enumerate(level_counts.items()):
-        with [col1, col2, col3, col4][i]:
+        with level_cols[i]:
             percentage = (count / total_count * 100) if total_count > 0 else 0
             st.info(f"**{level}**\n\n{count}명 ({percentage:.1f}%)")
     
+    # 조건이 없을 때는 저장소의 누적 집계에서 영역별 평균도 바로 읽음
+    if 'category_averages' in stats:
+        st.markdown("### 🧭 영역별 평균 달성률")
+        category_cols = st.columns(len(SCHEMA.category_ids))
+        for j, cat_id in enumerate(SCHEMA.category_ids):
+            average = stats['category_averages'].get(cat_id, 0.0)
+            category_cols[j].metric(
+                SCHEMA.category_names[j],
+                f"{average / SCHEMA.category_max_list[j] * 100:.1f}%"
+            )
+    
+    st.markdown("### 📦 일괄 다운로드")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(f"🗜️ 조회된 {total_count}명의 리포트 ZIP 만들기", key='admin_zip',
+                     use_container_width=True):
+            # 리포트를 한 건씩 압축하며 이어붙이므로 압축된 크기만큼만 메모리 사용
+            from report_export import iter_zip_archive
+            with st.spinner("리포트를 압축하는 중..."):
+                archive = b"".join(iter_zip_archive(iter_matching_records(result_store, filters)))
+            st.download_button(
+                label="📥 ZIP 다운로드",
+                data=archive,
+                file_name=f"AI역량진단_리포트_{datetime.now().strftime('%Y%m%d')}.zip",
+                mime="application/zip"
+            )
+    with col2:
+        if st.button(f"📊 조회된 {total_count}명의 결과 CSV 만들기", key='admin_csv',
+                     use_container_width=True):
+            csv_data = b"".join(iter_csv(iter_matching_records(result_store, filters)))
+            st.download_button(
+                label="📥 CSV 다운로드",
+                data=csv_data,
+                file_name=f"AI역량진단결과_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+    
     st.markdown("### 📋 전체 진단 결과 목록")
     
-    for result in results:
+    # 현재 페이지의 결과만 저장소에서 읽기
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("페이지당 건수", ADMIN_PAGE_SIZES, key='admin_page_size')
+    total_pages = max(1, -(-total_count // page_size))
+    if st.session_state.get('admin_page', 1) > total_pages:
+        st.session_state.admin_page = total_pages
+    with col2:
+        page = st.number_input(
+            f"페이지 (전체 {total_pages}쪽)",
+            min_value=1, max_value=total_pages, step=1,
+            key='admin_page'
+        )
+    
+    offset = (page - 1) * page_size
+    with metrics.timer("load_results_page"):
+        page_results = result_store.query(filters, sort=sort, offset=offset, limit=page_size)
+    st.caption(f"전체 {total_count}건 중 {offset + 1}–{offset + len(page_results)}번째")
+    
+    for result in page_results:
         with st.expander(
             f"{result['user_info']['name']} ({result['user_info']['department']}) - "
             f"{result['score']}점 / {result['level']}"
@@ -410,15 +514,62 @@ def show_admin():
                 st.write(f"**부서:** {result['user_info']['department']}")
                 st.write(f"**직위:** {result['user_info']['position']}")
             with col2:
-                st.write(f"**점수:** {result['score']}/75")
+                st.write(f"**점수:** {result['score']}/{SCHEMA.total_max}")
                 st.write(f"**레벨:** {result['level']}")
                 st.write(f"**진단일시:** {result['timestamp'][:19]}")
     
+    show_metrics()
+    
     st.markdown("---")
     if st.button("🏠 처음으로"):
         st.session_state.page = 'home'
         st.rerun()
 
+def show_metrics():
+    """단계별 소요 시간 (metrics.py 계측 결과)"""
+    st.markdown("### ⏱️ 처리 단계별 소요 시간")
+    enabled = st.checkbox("계측 사용", value=metrics.enabled(), key='admin_metrics_enabled',
+                          help=f"서버 시작 시 켜려면 {metrics.ENABLED_ENV}=1 환경 변수를 설정하세요")
+    if enabled != metrics.enabled():
+        metrics.enable(enabled)
+    
+    snapshot = metrics.snapshot()
+    if not snapshot['stages']:
+        st.caption("아직 측정값이 없습니다." if enabled else "계측이 꺼져 있습니다.")
+        return
+    
+    st.dataframe(
+        [
+            {
+                "단계": stage,
+                "횟수": values['count'],
+                "평균(ms)": values['mean_ms'],
+                "p50(ms)": values['p50_ms'],
+                "p95(ms)": values['p95_ms'],
+                "p99(ms)": values['p99_ms'],
+                "최대(ms)": values['max_ms']
+            }
+            for stage, values in snapshot['stages'].items()
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+    if snapshot['counters']:
+        st.caption(" · ".join(f"{name}: {count}" for name, count in snapshot['counters'].items()))
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 JSON 다운로드",
+            data=metrics.dump_json(),
+            file_name=f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+            key='admin_metrics_json'
+        )
+    with col2:
+        if st.button("🧹 측정값 초기화", key='admin_metrics_reset'):
+            metrics.reset()
+            st.rerun()
+
 # ==================== 메인 ====================
 def main():
     with st.sidebar:
@@ -448,14 +599,20 @@ def main():
 **소요 시간:** 약 10분
         """)
     
-    if st.session_state.page == 'home':
-        show_home()
-    elif st.session_state.page == 'assessment':
-        show_assessment()
-    elif st.session_state.page == 'result':
-        show_result()
-    elif st.session_state.page == 'admin':
-        show_admin()
+    # 페이지 전까지의 고정 비용 (설정, CSS, 세션 초기화, 공유 자원 조회)
+    if metrics.enabled():
+        metrics.record("script_setup", time.perf_counter() - _run_started)
+    
+    # 페이지별 스크립트 실행 시간 (st.rerun으로 중단되어도 기록)
+    with metrics.timer(f"page_{st.session_state.page}"):
+        if st.session_state.page == 'home':
+            show_home()
+        elif st.session_state.page == 'assessment':
+            show_assessment()
+        elif st.session_state.page == 'result':
+            show_result()
+        elif st.session_state.page == 'admin':
+            show_admin()
 
 if __name__ == "__main__":
     main()